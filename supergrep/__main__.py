@@ -1,7 +1,10 @@
 """Console application entry point"""
 import sys
+from multiprocessing import freeze_support
 
 
 if __name__ == '__main__':
+    # the textfsm stage runs in worker processes, also in the frozen .exe
+    freeze_support()
     from supergrep.main import main
     sys.exit(main(sys.argv))
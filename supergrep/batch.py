@@ -0,0 +1,185 @@
+"""Batch mode, runs one workbook job per collection bundle"""
+import csv
+import json
+import os
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging import getLogger
+from typing import Any, Callable, List
+
+from supergrep.config import settings
+from supergrep.instrumentation import run_instrumented
+from supergrep.parsing import clear_parsed, close_nested_zips
+
+__all__ = ('BatchJob', 'collect_jobs', 'run_batch')
+
+logger = getLogger(__name__)
+
+BatchJob = namedtuple('BatchJob', 'input_files output_file')
+
+# Name of the per-job timings and failures file, in the output directory
+SUMMARY_FILE = 'batch_summary.json'
+
+
+def output_path(output_dir: str, input_file: str) -> str:
+    """Output path of a bundle, named after the bundle
+
+    :param output_dir:
+    :param input_file:
+    :return:
+    """
+    name = os.path.basename(input_file)
+    for extension in ('.gz', '.bz2', '.tbz2', '.tgz', '.tar', '.zip'):
+        if name.endswith(extension):
+            name = name[:-len(extension)]
+    return os.path.join(output_dir, '{}.{}'.format(
+        name, settings.output_format))
+
+
+def unique_paths(paths: List[str]) -> List[str]:
+    """Suffixes the paths already taken with _2, _3, ...
+
+    Bundles with the same name in different directories would otherwise
+    overwrite each other's workbook.
+
+    :param paths:
+    :return:
+    """
+    taken = {os.path.normcase(path) for path in paths}
+    seen = set()  # type: set
+    unique = list()  # type: List[str]
+    for path in paths:
+        if os.path.normcase(path) in seen:
+            root, extension = os.path.splitext(path)
+            count = 2
+            while os.path.normcase('{}_{}{}'.format(
+                    root, count, extension)) in taken:
+                count += 1
+            path = '{}_{}{}'.format(root, count, extension)
+            taken.add(os.path.normcase(path))
+        seen.add(os.path.normcase(path))
+        unique.append(path)
+    return unique
+
+
+def collect_jobs(source: str, output_dir: str) -> List[BatchJob]:
+    """Jobs for every bundle in a directory, or every line of a manifest
+
+    Each file of a directory is a bundle. Each line of a manifest lists the
+    comma separated input files of one bundle, lines starting with # are
+    skipped. The workbook is named after the first input file, bundles
+    with the same name get a numbered suffix.
+
+    :param source: directory or manifest file
+    :param output_dir:
+    :return:
+    """
+    if os.path.isdir(source):
+        bundles = [[os.path.join(source, name)]
+                   for name in sorted(os.listdir(source))
+                   if not name.startswith('.')
+                   and os.path.isfile(os.path.join(source, name))]
+    else:
+        base_dir = os.path.dirname(os.path.abspath(source))
+        with open(source, newline='') as manifest:
+            bundles = [
+                [os.path.join(base_dir, path.strip()) for path in row
+                 if path.strip()]
+                for row in csv.reader(manifest)
+                if row and row[0].strip()
+                and not row[0].strip().startswith('#')]
+    output_files = unique_paths(
+        [output_path(output_dir, input_files[0]) for input_files in bundles])
+    return [BatchJob(tuple(input_files), output_file)
+            for input_files, output_file in zip(bundles, output_files)]
+
+
+def run_job(func: Callable, templates: Any, job: BatchJob,
+            options: dict) -> dict:
+    """Runs a job in a worker process, returns its summary entry
+
+    The worker keeps its imports and compiled templates from one job to the
+    next. Its own textfsm stage runs in process, the bundles already keep
+    every worker busy.
+
+    :param func: entry point of the vendor
+    :param templates:
+    :param job:
+    :param options: settings of the parent process
+    :return:
+    """
+    for name, value in options.items():
+        setattr(settings, name, value)
+    settings.parse_workers = 1
+    start = time.perf_counter()
+    error = None
+    try:
+        if run_instrumented(
+                func, templates, job.input_files, job.output_file):
+            error = 'No template runs over the input files'
+    except Exception:  # pylint: disable=broad-except
+        error = traceback.format_exc()
+    finally:
+        # the worker runs the next job, not the sheets of this one
+        clear_parsed()
+        close_nested_zips()
+    return {
+        'input_files': list(job.input_files),
+        'output_file': job.output_file,
+        'seconds': round(time.perf_counter() - start, 3),
+        'error': error
+    }
+
+
+def run_batch(func: Callable, templates: Any, jobs: List[BatchJob],
+              output_dir: str, max_workers: int = None) -> int:
+    """Runs the jobs across a process pool and writes the summary
+
+    :param func: entry point of the vendor
+    :param templates:
+    :param jobs:
+    :param output_dir:
+    :param max_workers:
+    :return: 0 when every job succeeded, 1 otherwise
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    options = {'write_only': settings.write_only,
+               'output_format': settings.output_format,
+               'cache_path': settings.cache_path,
+               'prefilter': settings.prefilter,
+               'template_index': settings.template_index,
+               'vendor': settings.vendor,
+               'report': settings.report,
+               'report_memory': settings.report_memory,
+               'profile': settings.profile}
+    workers = max_workers or settings.batch_workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    results = list()  # type: List[dict]
+    with ProcessPoolExecutor(max(1, min(workers, len(jobs)))) as executor:
+        futures = [executor.submit(run_job, func, templates, job, options)
+                   for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['error']:
+                logger.error('\n{} failed:\n{}'.format(
+                    result['output_file'], result['error']))
+            else:
+                logger.info('{} done in {}s'.format(
+                    result['output_file'], result['seconds']))
+
+    results.sort(key=lambda result: result['output_file'])
+    failed = [result for result in results if result['error']]
+    summary = {
+        'jobs': len(results),
+        'failed': len(failed),
+        'seconds': round(time.perf_counter() - start, 3),
+        'results': results
+    }
+    with open(os.path.join(output_dir, SUMMARY_FILE), 'w') as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    logger.info('{} bundles, {} failed, {}s'.format(
+        summary['jobs'], summary['failed'], summary['seconds']))
+    return 1 if failed else 0
@@ -0,0 +1 @@
+"""Throughput benchmarks over synthetic collection bundles"""
@@ -0,0 +1,7 @@
+"""Benchmark entry point, python -m supergrep.benchmark"""
+import sys
+
+from supergrep.benchmark.run import main
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,105 @@
+"""Checks extract_elements against search_tag_value over xmltodict.parse
+
+Both extractors run over the XML documents of synthetic EVA, XIV and Isilon
+bundles, and over small documents covering the corner cases of the search
+(namespaces, repeated parents, empty matches), with the tags the sheets
+read. python -m supergrep.benchmark.equivalence prints every mismatch.
+"""
+import random
+import sys
+import tempfile
+from io import BytesIO
+from typing import Any, Generator, List
+
+import xmltodict
+
+from supergrep.benchmark.generators import eva_bundle, isilon_bundle, xiv_bundle
+from supergrep.eva.utils import EVA_ELEMENTS
+from supergrep.isilon.utils import ISILON_ELEMENTS
+from supergrep.parsing import load_raw_content, raw_gz_content, raw_tar_content
+from supergrep.utils import search_tag_value
+from supergrep.xiv.san_hosts import HOST_ELEMENTS, MAP_ELEMENTS
+from supergrep.xiv.volumes import VOLUME_ELEMENTS
+from supergrep.xml_elements import extract_elements
+
+__all__ = ('check_extractors', 'xml_documents')
+
+# (document, tags) of the corner cases of search_tag_value
+CORNER_CASES = (
+    ('<r xmlns="urn:x"><t>1</t></r>', ('t', )),
+    ('<r><p:t xmlns:p="urn:x">1</p:t></r>', ('t', 'p:t')),
+    ('<r><node><x>1</x></node><node><x>2</x></node></r>', ('x', 'node')),
+    ('<r><a><t/></a><c><t>v</t></c></r>', ('t', )),
+    ('<r><t/><a><t>v</t></a></r>', ('t', )),
+    ('<r><a><b><t>deep</t></b></a><c><t>shallow</t></c></r>', ('t', )),
+    ('<r><a x="1"><t>1</t></a><a><t>2</t></a></r>', ('t', 'a')),
+    ('<r><t>1</t><t>2</t><t/></r>', ('t', )),
+    ('<r>text<a>1</a>tail</r>', ('r', 'a')),
+    ('<t a="1">x</t>', ('t', )),
+)
+
+
+def xml_documents(directory: str, scale: int) -> Generator:
+    """Yields the (name, document, tags) the sheets extract elements from
+
+    :param directory:
+    :param scale: of each synthetic bundle
+    :return:
+    """
+    for number, (document, tags) in enumerate(CORNER_CASES):
+        yield 'corner case {}'.format(number), document, tags
+    for name, content in load_raw_content(
+            (eva_bundle(directory, scale), ), ('*EVA_config.xml', )):
+        yield name, str(content), EVA_ELEMENTS
+    xiv_tags = (
+        ('*vol_list_-f_all_show_proxy=yes/cli.xml', VOLUME_ELEMENTS),
+        ('*all_mappings_list/cli.xml', MAP_ELEMENTS),
+        ('*host_list_-f_all/cli.xml', HOST_ELEMENTS))
+    for name, content in raw_tar_content(
+            (xiv_bundle(directory, scale), ),
+            tuple(pattern for pattern, _ in xiv_tags)):
+        for pattern, tags in xiv_tags:
+            if name.endswith(pattern.lstrip('*')):
+                # the sheets drop the command line before the document
+                yield name, '\n'.join(str(content).split('\n')[1:]), tags
+    for name, content in raw_gz_content((isilon_bundle(directory, scale), )):
+        yield name, str(content), ISILON_ELEMENTS
+
+
+def check_extractors(documents: Any) -> List[str]:
+    """Runs both extractors over the documents, from text and from bytes
+
+    :param documents: (name, document, tags)
+    :return: a line per mismatch
+    """
+    mismatches = []  # type: List[str]
+    for name, document, tags in documents:
+        expected = xmltodict.parse(document)
+        from_text = extract_elements(document, tags)
+        from_bytes = extract_elements(
+            BytesIO(document.encode('utf-8')), tags)
+        for tag in tags:
+            value = search_tag_value(expected, tag)
+            if from_text[tag] != value or from_bytes[tag] != value:
+                mismatches.append('{}: {} differs'.format(name, tag))
+    return mismatches
+
+
+def main(argv: Any) -> int:
+    """Equivalence check entry point
+
+    :param argv: sys.argv, the optional scale of the bundles
+    :return: 1 when any value differs
+    """
+    random.seed(0)
+    scale = int(argv[1]) if len(argv) > 1 else 2
+    with tempfile.TemporaryDirectory() as directory:
+        documents = list(xml_documents(directory, scale))
+        mismatches = check_extractors(documents)
+    print('\n'.join(mismatches) or '{} documents, no mismatch'.format(
+        len(documents)))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
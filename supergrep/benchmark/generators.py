@@ -0,0 +1,955 @@
+"""Synthetic collection bundles, valid input for the vendor templates
+
+Every generator writes a bundle with the layout of a real collection into
+a directory and returns the bundle path. The scale is the number of
+arrays (VNX, VMAX, Celerra, 3PAR), of systems (XIV, EVA, IBM DS), of
+performance samples (XtremIO) or of nodes (Isilon), each array holding a
+fixed number of objects (see the keyword arguments).
+"""
+import csv
+import gzip
+import io
+import json
+import os
+import random
+import tarfile
+from xml.sax.saxutils import escape
+from zipfile import ZIP_DEFLATED, ZipFile
+
+__all__ = ('celerra_bundle', 'eva_bundle', 'ibmds_bundle', 'isilon_bundle',
+           'three_par_bundle', 'vmax_bundle', 'vnx_bundle', 'xiv_bundle',
+           'xtremio_bundle')
+
+NAVISECCLI = r'C:\Navisphere\NavisecCli.exe -np'
+
+# LUNs of each VNX storage group
+GROUP_LUNS = 20
+
+
+def vnx_cfg_info(array: int, disks: int, luns: int, noise: int) -> str:
+    """SPA_cfg_info.txt of an array
+
+    :param array:
+    :param disks:
+    :param luns: in storage groups of GROUP_LUNS
+    :param noise: lines of an (unparsed) event log section
+    :return:
+    """
+    lines = [
+        '{} arrayname'.format(NAVISECCLI),
+        'Array Name:  VNX{:04d}'.format(array),
+        '',
+        '{} getagent'.format(NAVISECCLI),
+        'Agent Rev:           7.33.9 (1.55)',
+        'Name:                K10',
+        'Desc:                SP A',
+        'Node:                A-CKM00{:07d}'.format(array),
+        'Physical Node:       K10',
+        'Signature:           {}'.format(3000000 + array),
+        'Peer Signature:      {}'.format(4000000 + array),
+        'Revision:            05.33.009.5.155',
+        'SCSI Id:             0',
+        'Model:               VNX5400',
+        'Model Type:          Rackmount',
+        'Prom Rev:            23.30.00',
+        'SP Memory:           16384',
+        'Serial No:           CKM00{:07d}'.format(array),
+        'SP Identifier:       A',
+        'Cabinet:             DPE7',
+        '',
+        '{} getarrayuid'.format(NAVISECCLI),
+        '',
+        'Hostname           Array UID',
+        '------------------ -----------------------------------------------',
+        'vnx{:04d}-spa       50:06:01:60:88:60:{:02X}:{:02X}'.format(
+            array, array // 256 % 256, array % 256),
+        '------------------ -----------------------------------------------',
+        '',
+        '{} getdisk'.format(NAVISECCLI),
+        '-' * 40,
+    ]
+    for disk in range(disks):
+        lines += [
+            'Bus {} Enclosure {}  Disk {}'.format(
+                disk // 375, disk // 15 % 25, disk % 15),
+            'Vendor Id:               SEAGATE',
+            'Product Id:              ST900MM0 CLAR900',
+            'Product Revision:        LS1E',
+            'Lun:                     {}'.format(disk),
+            'Type:                    {}: RAID5'.format(disk // 5),
+            'State:                   Enabled',
+            'Hot Spare:               NO',
+            'Prct Rebuilt:            100',
+            'Capacity:                {}'.format(
+                random.choice((274845, 549691, 839656))),
+            'Private:                 0',
+            'Number of Luns:          1',
+            'Raid Group ID:           {}'.format(disk // 5),
+            'Drive Type:              SAS',
+            'Current Speed:           6Gbps',
+            'Maximum Speed:           6Gbps',
+            '',
+        ]
+    lines += ['-' * 40, '', '{} getlun'.format(NAVISECCLI)]
+    for lun in range(luns):
+        lines += [
+            'LOGICAL UNIT NUMBER {}'.format(lun),
+            'Name                        LUN {}'.format(lun),
+            'RAID Type:                  RAID5',
+            'RAIDGroup ID:               {}'.format(lun % 40),
+            'State:                      Bound',
+            'Element Size:               128',
+            'Current owner:              SP {}'.format('AB'[lun % 2]),
+            'Default Owner:              SP {}'.format('AB'[lun % 2]),
+            'LUN Capacity(Megabytes):    {}'.format(
+                random.choice((10240, 51200, 102400))),
+            'LUN Capacity(Blocks):       {}'.format(
+                random.choice((20971520, 104857600))),
+            'UID:                        60:06:01:60:{:02X}:{:02X}:00:00'.format(
+                array % 256, lun % 256),
+            'Is Private:                 NO',
+            'Snapshots List:             Not Available',
+            'MirrorView Name if any:     Not Mirrored',
+            '',
+        ]
+    lines += ['*' * 40, '{} storagegroup -list'.format(NAVISECCLI)]
+    groups = range(-(-luns // GROUP_LUNS))
+    for group in groups:
+        lines += [
+            'Storage Group Name:    SG_{:04d}'.format(group),
+            'Storage Group UID:     {:02X}:{:02X}:{:02X}:00'.format(
+                array // 256 % 256, array % 256, group % 256),
+            'HBA/SP Pairs:',
+            '',
+            '  HBA UID                                          SP Name     '
+            'SPPort',
+            '  -------                                          -------     '
+            '------',
+        ]
+        lines += ['  20:00:00:00:C9:{:02X}:{:02X}:{:02X}:10:00:00:00:C9:{:02X}'
+                  ':{:02X}:{:02X}   SP {}         {}'.format(
+                      array % 256, group % 256, hba, array % 256,
+                      group % 256, hba, 'AB'[hba % 2], hba // 2)
+                  for hba in range(4)]
+        lines += [
+            '',
+            'HLU/ALU Pairs:',
+            '',
+            '  HLU Number     ALU Number',
+            '  ----------     ----------',
+        ]
+        lines += ['    {}              {}'.format(hlu, alu) for hlu, alu in
+                  enumerate(range(group * GROUP_LUNS,
+                                  min(luns, (group + 1) * GROUP_LUNS)))]
+        lines += ['Shareable:             YES', '']
+    lines += ['*' * 40, '{} port -messner -list -all'.format(NAVISECCLI)]
+    # every tenth storage group has no server logged in
+    for group in (group for group in groups if group % 10):
+        for server in range(2):
+            lines += [
+                'Information about each HBA:',
+                '',
+                'HBA UID:                 20:00:00:00:C9:{:02X}:{:02X}:{:02X}'
+                ':10:00:00:00:C9:{:02X}:{:02X}:{:02X}'.format(
+                    array % 256, group % 256, server, array % 256,
+                    group % 256, server),
+                'Server Name:             host{:04d}-{}'.format(group, server),
+                'Server IP Address:       10.{}.{}.{}'.format(
+                    array % 256, group % 256, server),
+                'Information about each port of this HBA:',
+                '',
+                '    SP Name:               SP {}'.format('AB'[server]),
+                '    SP Port ID:            0',
+                '    Logged In:             YES',
+                '    StorageGroup Name:     SG_{:04d}'.format(group),
+                '',
+            ]
+    lines += ['*' * 40, '{} getlog'.format(NAVISECCLI)]
+    lines += ['{:02d}/{:02d}/2018 {:02d}:{:02d}:{:02d} N/A (7100)Event {} '
+              'logged by the Navisphere Agent on SP A'.format(
+                  n % 12 + 1, n % 28 + 1, n % 24, n % 60, n % 60, n)
+              for n in range(noise)]
+    return '\r\n'.join(lines) + '\r\n'
+
+
+def vnx_bundle(directory: str, scale: int, disks: int = 120,
+               luns: int = 400, noise: int = 5000) -> str:
+    """Site survey zip with one nested zip per VNX array
+
+    :param directory:
+    :param scale: number of arrays
+    :param disks: per array
+    :param luns: per array
+    :param noise: event log lines per array
+    :return:
+    """
+    path = os.path.join(directory, 'vnx_bundle.zip')
+    with ZipFile(path, 'w', ZIP_DEFLATED) as bundle:
+        for array in range(scale):
+            nested = io.BytesIO()
+            with ZipFile(nested, 'w', ZIP_DEFLATED) as array_zip:
+                array_zip.writestr(
+                    'SPA_cfg_info.txt',
+                    vnx_cfg_info(array, disks, luns, noise))
+            bundle.writestr('VNX{:04d}.zip'.format(array), nested.getvalue())
+    return path
+
+
+def vmax_devinfo(sid: str, groups: int, devices: int) -> str:
+    """symaccess list devinfo output of an array
+
+    :param sid:
+    :param groups: initiator groups
+    :param devices: per initiator group
+    :return:
+    """
+    lines = []
+    for group in range(groups):
+        lines += [
+            '',
+            'Symmetrix ID                : {}'.format(sid),
+            'Initiator Group Name        : IG_host{:04d}'.format(group),
+            'Last update time            : 10:12:01 AM on Mon Mar 12,2018',
+            'Group last update time      : 10:12:01 AM on Mon Mar 12,2018',
+            '',
+            '   Host Initiators',
+            '     {',
+            '       WWN  : 10000000c9{:06x}'.format(group),
+            '              [alias: host{:04d}/10000000c9{:06x}]'.format(
+                group, group),
+            '     }',
+            '',
+            '   Sym    Host    Cap(MB)',
+        ]
+        for device in range(devices):
+            symdev = '{:05X}'.format(group * devices + device)
+            lines += [
+                '   {}  07E:000  Not Visible  {:X}  (M)  {}  MV_host{:04d}'.format(
+                    symdev, device, random.choice((10241, 51201)), group),
+                '          08E:000  Not Visible  {:X}  (M)  MV_host{:04d}'.format(
+                    device, group),
+            ]
+        lines += ['   Total Capacity  {}'.format(devices * 10241), '']
+    return '\n'.join(lines)
+
+
+def vmax_list_wwn(sid: str, devices: int) -> str:
+    """symdev list -wwn output of an array
+
+    :param sid:
+    :param devices:
+    :return:
+    """
+    lines = [
+        '',
+        'Symmetrix ID: {}'.format(sid),
+        '',
+        '        Device Name          Config        Attr  WWN',
+        '----- --------------------- ------------- ---- ----------------',
+    ]
+    lines += ['{:05X} Not Visible           TDEV           (M)  '
+              '6000097000{}53{:010d}'.format(device, sid, device)
+              for device in range(devices)]
+    return '\n'.join(lines) + '\n'
+
+
+def symstat_times(samples: int) -> list:
+    """Timestamps of the symstat samples
+
+    :param samples:
+    :return:
+    """
+    return ['{:02d}:{:02d}:{:02d}'.format(
+        10 + sample // 60 % 12, sample % 60, 26) for sample in range(samples)]
+
+
+def vmax_backend(devices: int, samples: int) -> str:
+    """symstat -type backend output of an array
+
+    :param devices:
+    :param samples:
+    :return:
+    """
+    lines = [
+        '',
+        '                 DEVICE                    IO/sec        KB/sec'
+        '     Prefetch  Tracks',
+        '                                         READ  WRITE   READ  WRITE'
+        '   Tracks/sec  Used',
+        '',
+    ]
+    for time in symstat_times(samples):
+        lines += ['{} {:05X} (Not Visible    ) {:6} {:6} {:6} {:6} {:6} '
+                  '{:6}'.format(time, device, random.randint(0, 500),
+                                random.randint(0, 500),
+                                random.randint(0, 9000),
+                                random.randint(0, 9000),
+                                random.randint(0, 50),
+                                random.randint(0, 3000))
+                  for device in range(devices)]
+    return '\n'.join(lines) + '\n'
+
+
+def vmax_disks(disks: int, samples: int) -> str:
+    """symstat -type disks output of an array
+
+    :param disks:
+    :param samples:
+    :return:
+    """
+    times = symstat_times(samples)
+    lines = [
+        '',
+        '                 DISK          IO/sec        KB/sec',
+        '{}                    READ  WRITE   READ  WRITE'.format(times[0]),
+        '',
+    ]
+    for time in times:
+        lines += ['{} DF-{}{}:{} {:6} {:6} {:6} {:6}'.format(
+            time, disk // 32 + 1, 'ABCD'[disk // 8 % 4], disk % 8,
+            random.randint(0, 200), random.randint(0, 200),
+            random.randint(0, 9000), random.randint(0, 9000))
+                  for disk in range(disks)]
+    lines += ['', 'Total       ------  ------  ------  ------', '']
+    return '\n'.join(lines)
+
+
+def vmax_requests(devices: int, samples: int) -> str:
+    """symstat -type requests output of an array
+
+    :param devices:
+    :param samples:
+    :return:
+    """
+    lines = [
+        '',
+        '                 DEVICE                  IO/sec        KB/sec'
+        '     % Hits   % Seq  Num WP',
+        '                                       READ  WRITE   READ  WRITE'
+        '  RD  WRT  RD  WRT  Tracks',
+        '',
+    ]
+    for time in symstat_times(samples):
+        lines += ['{} {:05X} (Not Visible    ) {:6} {:6} {:6} {:6} {:3} {:3} '
+                  '{:3} {:3} {:6}'.format(
+                      time, device, random.randint(0, 500),
+                      random.randint(0, 500), random.randint(0, 9000),
+                      random.randint(0, 9000), random.randint(0, 100),
+                      random.randint(0, 100), random.randint(0, 100),
+                      random.randint(0, 100), random.randint(0, 3000))
+                  for device in range(devices)]
+    lines += ['', 'Total      {:6} {:6}'.format(0, 0), '']
+    return '\n'.join(lines)
+
+
+def vmax_bundle(directory: str, scale: int, groups: int = 100,
+                devices: int = 20, disks: int = 64,
+                samples: int = 10) -> str:
+    """Zip with the symcli and symstat outputs of scale VMAX arrays
+
+    The symstat outputs are at the root of the zip, named after the
+    Symmetrix ID like the collection script does.
+
+    :param directory:
+    :param scale: number of arrays
+    :param groups: initiator groups per array
+    :param devices: devices per initiator group
+    :param disks: per array
+    :param samples: of each symstat output
+    :return:
+    """
+    path = os.path.join(directory, 'vmax_bundle.zip')
+    with ZipFile(path, 'w', ZIP_DEFLATED) as bundle:
+        for array in range(scale):
+            sid = '{:012d}'.format(196800100 + array)
+            bundle.writestr(
+                '{}/{}_symaccess_list_devinfo.txt'.format(sid, sid),
+                vmax_devinfo(sid, groups, devices))
+            bundle.writestr(
+                '{}/{}_symdev_list_wwn.txt'.format(sid, sid),
+                vmax_list_wwn(sid, groups * devices))
+            bundle.writestr(
+                '{}_perf_type_backend.txt'.format(sid),
+                vmax_backend(groups * devices // 10, samples))
+            bundle.writestr(
+                '{}_perf_type_disks.txt'.format(sid),
+                vmax_disks(disks, samples))
+            bundle.writestr(
+                '{}_perf_type_requests.txt'.format(sid),
+                vmax_requests(groups * devices // 10, samples))
+    return path
+
+
+def xtremio_bundle(directory: str, scale: int) -> str:
+    """Zip with an XtremIO performance_history.csv of scale samples
+
+    :param directory:
+    :param scale: number of samples
+    :return:
+    """
+    lines = ['Timestamp,Write-BW (MB/s),Read-BW (MB/s),Write-IOPS,Read-IOPS,'
+             'Write-Latency (usec),Read-Latency (usec),Avg-Latency (usec)']
+    for sample in range(scale):
+        lines.append('2018-03-{:02d} {:02d}:{:02d}:00,{},{},{},{},{},{},{}'.format(
+            sample // 1440 % 28 + 1, sample // 60 % 24, sample % 60,
+            random.randint(1, 900), random.randint(1, 900),
+            random.randint(100, 90000), random.randint(100, 90000),
+            random.randint(100, 2000), random.randint(100, 2000),
+            random.randint(100, 2000)))
+    path = os.path.join(directory, 'xtremio_bundle.zip')
+    with ZipFile(path, 'w', ZIP_DEFLATED) as bundle:
+        bundle.writestr('xms/performance_history.csv', '\n'.join(lines) + '\n')
+    return path
+
+
+def isilon_drives(node: int, lnn: int, drives: int) -> str:
+    """isi devices list --format=json line of a node of a cluster
+
+    :param node: cluster
+    :param lnn: logical node number
+    :param drives:
+    :return:
+    """
+    return 'isilon-{}-{}: {}'.format(node, lnn, json.dumps([{
+        'lnum': drive, 'baynum': drive + 1, 'lnn': lnn,
+        'purpose_description': 'A drive used for normal data storage',
+        'blocks': 7814037168, 'serial': 'Z1Z{:03d}{:02d}{:03d}'.format(
+            node, lnn, drive),
+        'wwn': '5000C500{:04X}{:02X}{:02X}'.format(node, lnn, drive),
+        'logical_block_length': 512, 'ui_state': 'HEALTHY',
+        'physical_block_length': 512,
+        'firmware': {'desired_firmware': 'SN04',
+                     'current_firmware': 'SN04'},
+        'id': drive, 'media_type': 'HDD', 'interface_type': 'SATA',
+        'handle': 'da{}'.format(drive), 'devname': 'da{}'.format(drive + 1),
+        'chassis': 1, 'purpose': 'STORAGE', 'y_loc': drive // 4,
+        'x_loc': drive % 4, 'present': True,
+        'locnstr': 'Bay {}'.format(drive + 1), 'model': 'ST4000NM0033'
+    } for drive in range(drives)]))
+
+
+def isilon_commands(node: int, entries: int) -> list:
+    """(command, collected data) of the commands the Isilon sheets read
+
+    :param node:
+    :param entries: drives, exports, shares, quotas and policies
+    :return:
+    """
+    nodes = 4
+    return [
+        ('isi_for_array isi devices list --format=json', '\n'.join(
+            isilon_drives(node, lnn, entries // nodes)
+            for lnn in range(1, nodes + 1))),
+        ('isi_for_array isi_hw_status', '\n'.join(
+            'isilon-{}-{}: {}: {}'.format(node, lnn, component, status)
+            for lnn in range(1, nodes + 1)
+            for component, status in (
+                ('SerNo', 'SX410-{:04d}-{:02d}'.format(node, lnn)),
+                ('Product', 'X410-4U-Dual-64GB-2x1GE-2x10GE SFP+-34TB'),
+                ('HWGen', 'CTO (CTO Hardware)'), ('PwrSupl', 'PS1, OK')))),
+        ('isi nfs exports list --format=csv -a -z', '\n'.join(
+            ['ID,Zone,Paths,Description'] + [
+                '{},System,/ifs/data/nfs{:04d},export {}'.format(
+                    export + 1, export, export)
+                for export in range(entries)])),
+        ('isi smb shares list --format=csv -a -z', '\n'.join(
+            ['Share Name,Path'] + [
+                'share{:04d},/ifs/data/smb{:04d}'.format(share, share)
+                for share in range(entries)])),
+        ('isi quota quotas list --format=json', json.dumps([{
+            'path': '/ifs/data/nfs{:04d}'.format(quota),
+            'type': 'directory', 'appliesto': None,
+            'thresholds': {'hard': 10 ** 12, 'soft': None,
+                           'advisory': 8 * 10 ** 11},
+            'usage': {'physical': random.randint(0, 10 ** 12),
+                      'logical': random.randint(0, 10 ** 12),
+                      'inodes': random.randint(0, 10 ** 6)}
+        } for quota in range(entries)])),
+        ('isi sync policies list --format=json', json.dumps([{
+            'name': 'policy{:04d}'.format(policy),
+            'schedule': 'every day at 22:00',
+            'source_root_path': '/ifs/data/nfs{:04d}'.format(policy),
+            'enabled': True,
+            'target_path': '/ifs/dr/nfs{:04d}'.format(policy),
+            'last_success': 1520000000 + policy, 'action': 'sync',
+            'id': '{:032x}'.format(policy), 'target_host': 'isilon-dr'
+        } for policy in range(entries // 10)])),
+    ]
+
+
+def isilon_bundle(directory: str, scale: int, entries: int = 400) -> str:
+    """Zip with one gzipped Isilon node dump XML per node
+
+    Each dump holds the commands the sheets read, see isilon_commands.
+
+    :param directory:
+    :param scale: number of nodes
+    :param entries: of each command
+    :return:
+    """
+    path = os.path.join(directory, 'isilon_bundle.zip')
+    with ZipFile(path, 'w') as bundle:
+        for node in range(scale):
+            details = ''.join(
+                '<command_details><cmd>{}</cmd><target>'
+                '<collected_data>{}</collected_data></target>'
+                '</command_details>'.format(escape(cmd), escape(data))
+                for cmd, data in isilon_commands(node, entries))
+            xml = ('<?xml version="1.0"?><dump><component_details><name>'
+                   'isilon-{0}</name><hostname>isilon-{0}</hostname>'
+                   '<model>X410</model><os>8.0.0.4</os>'
+                   '</component_details>{1}</dump>').format(node, details)
+            bundle.writestr('isilon-{}.xml.gz'.format(node),
+                            gzip.compress(xml.encode('utf-8')))
+    return path
+
+
+def celerra_outputs(array: int, servers: int, filesystems: int) -> list:
+    """(command output file, content) of a Celerra control station
+
+    :param array:
+    :param servers: physical and virtual data movers
+    :param filesystems: per physical data mover
+    :return:
+    """
+    hostname = 'Output from: /bin/hostname\ncelerra{:04d}-cs0\n'.format(array)
+    nas_server = [
+        'Output from: /nas/bin/nas_server -list -all',
+        'id      type  acl  slot groupID  state  name',
+    ]
+    nas_server += ['{:<7} 1     0    {:<4} 0        0      server_{}'.format(
+        server + 1, server + 2, server + 2) for server in range(servers)]
+    nas_server += ['', 'id       acl  server   mountedfs       rootfs  name']
+    nas_server += ['{:<8} 0    {:<8} {:<15} {:<7} vdm_{:03d}'.format(
+        server + 1, server % servers + 1, 100 + server, 200 + server, server)
+        for server in range(servers)]
+    server_df = ['Output from: /nas/bin/server_df ALL']
+    for server in range(servers):
+        server_df += [
+            'server_{} :'.format(server + 2),
+            'Filesystem          kbytes         used        avail capacity '
+            'Mounted on',
+        ]
+        for filesystem in range(filesystems):
+            kbytes = random.choice((104857600, 524288000, 1073741824))
+            used = random.randint(0, kbytes)
+            server_df.append('fs_{:02d}_{:04d} {:>18} {:>12} {:>12} {:>5}% '
+                             '/fs_{:02d}_{:04d}'.format(
+                                 server, filesystem, kbytes, used,
+                                 kbytes - used, used * 100 // kbytes,
+                                 server, filesystem))
+        server_df.append('')
+    server_export = []  # type: list
+    for server in range(servers):
+        server_export += [
+            'Output from: /nas/bin/server_export server_{} -list -all'.format(
+                server + 2),
+            'server_{} :'.format(server + 2),
+        ]
+        for filesystem in range(filesystems):
+            path = '/fs_{:02d}_{:04d}'.format(server, filesystem)
+            if filesystem % 3:
+                server_export.append(
+                    'export "{}" rw=host{:04d} root=host{:04d} '
+                    'access=host{:04d}'.format(
+                        path, filesystem, filesystem, filesystem))
+            if filesystem % 3 != 1:
+                server_export.append(
+                    'share "{}$" "{}" umask=022 maxusr=4294967295 '
+                    'netbios=CELERRA{:04d} comment="share {}"'.format(
+                        path[1:], path, array, filesystem))
+    return [
+        ('hostname', hostname),
+        ('nas_server-list', '\n'.join(nas_server) + '\n'),
+        ('server_export', '\n'.join(server_export) + '\n'),
+        ('server_df', '\n'.join(server_df)),
+    ]
+
+
+def celerra_bundle(directory: str, scale: int, servers: int = 8,
+                   filesystems: int = 200) -> str:
+    """Zip with the cmd_outputs of scale Celerra control stations
+
+    :param directory:
+    :param scale: number of arrays
+    :param servers: data movers per array
+    :param filesystems: per data mover
+    :return:
+    """
+    path = os.path.join(directory, 'celerra_bundle.zip')
+    with ZipFile(path, 'w', ZIP_DEFLATED) as bundle:
+        for array in range(scale):
+            for name, content in celerra_outputs(array, servers, filesystems):
+                bundle.writestr('celerra{:04d}/cmd_outputs/{}'.format(
+                    array, name), content)
+    return path
+
+
+def tar_bytes(members: list, mode: str = 'w:bz2') -> bytes:
+    """Tar archive of (name, text) members, in memory
+
+    :param members:
+    :param mode:
+    :return:
+    """
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode=mode) as tar:
+        for name, text in members:
+            data = text.encode('utf-8')
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = 1520000000
+            tar.addfile(info, io.BytesIO(data))
+    return archive.getvalue()
+
+
+def three_par_outputs(array: int, disks: int) -> list:
+    """(file name, content) of the 3PAR CLI outputs of an array
+
+    :param array:
+    :param disks:
+    :return:
+    """
+    name, serial = '3par{:04d}'.format(array), '16{:05d}'.format(array)
+    showsys = '\n'.join([
+        '                                                   '
+        '---------------(MB)----------------',
+        '   ID ---Name--- ---Model---- -Serial- Nodes Master TotalCap '
+        'AllocCap FreeCap FailedCap',
+        '{:>5} {:<10} HP_3PAR 7400 {:<8} {:>5} {:>6} {:>8} {:>8} {:>7} '
+        '{:>9}'.format(array, name, serial, 2, 0, disks * 838656,
+                       disks * 419328, disks * 419328, 0),
+    ]) + '\n'
+    showsys_d = 'General\n-------\nSystem Name  : {}\nLocation     : ' \
+                'DC{} Room 1\n'.format(name, array % 4)
+    showversion = 'Release version 3.2.2.612 (MU4)\nPatches:  None\n'
+    showpd = [
+        '                               ----Size(MB)----- ----Ports----',
+        ' Id CagePos Type RPM State      Total    Free A      B      Cap(GB)',
+    ]
+    for disk in range(disks):
+        free = random.randint(0, 838656)
+        showpd.append('{:>3} {}:{}:0   FC    10 normal    838656 {:>7} '
+                      '{}:0:1* {}:0:2  900'.format(
+                          disk, disk // 24, disk % 24, free, disk % 2,
+                          (disk + 1) % 2))
+    showpd += ['-' * 70, '{:>3} total              {:>10} {:>7}'.format(
+        disks, disks * 838656, 0)]
+    return [
+        ('showsys.out', showsys),
+        ('showsys_-d.out', showsys_d),
+        ('showversion.out', showversion),
+        ('showpd.out', '\n'.join(showpd) + '\n'),
+    ]
+
+
+def three_par_bundle(directory: str, scale: int, disks: int = 480) -> str:
+    """Zip with one .tbz2 of 3PAR CLI outputs per array
+
+    :param directory:
+    :param scale: number of arrays
+    :param disks: per array
+    :return:
+    """
+    path = os.path.join(directory, '3par_bundle.zip')
+    with ZipFile(path, 'w') as bundle:
+        for array in range(scale):
+            name = '3par{:04d}'.format(array)
+            bundle.writestr('{}.tbz2'.format(name), tar_bytes([
+                ('{}/{}'.format(name, file_name), content)
+                for file_name, content in three_par_outputs(array, disks)]))
+    return path
+
+
+def xcli_xml(command: str, elements: str) -> str:
+    """cli.xml of an XIV xcli command
+
+    :param command:
+    :param elements:
+    :return:
+    """
+    return ('Starting command {}\n<XCLIRETURN STATUS="SUCCESS" '
+            'COMMAND_LINE="{}"><OUTPUT>{}</OUTPUT></XCLIRETURN>\n').format(
+                command, command, elements)
+
+
+def xcli_txt(command: str, lines: str) -> str:
+    """cli.txt of an XIV xcli command
+
+    :param command:
+    :param lines:
+    :return:
+    """
+    return ('Starting command /xiv/admin/xcli.py --ignore-trace-dumper -u '
+            'xiv_development -p {}\n{}').format(command, lines)
+
+
+def xiv_outputs(system: int, hosts: int, volumes: int, pools: int = 8,
+                disks: int = 180) -> list:
+    """(command directory, file, content) of the xcli outputs of a system
+
+    Besides the volume and host documents, the cod_list, version_get,
+    conf_get and list outputs give a row of every XIV sheet.
+
+    :param system:
+    :param hosts:
+    :param volumes: mapped to each host
+    :param pools: the volumes are spread over
+    :param disks:
+    :return:
+    """
+    cod_list = xcli_txt('cod_list -f all', (
+        'Name                         Value\n'
+        'consumed_capacity            {2}\n'
+        'machine_model                214\n'
+        'machine_serial_number        78{0:05d}\n'
+        'machine_type                 2810\n'
+        'system_id                    {1}\n'
+        'system_name                  XIV{0:04d}\n').format(
+            system, 10000 + system, random.randint(10000, 90000)))
+    version_get = xcli_txt('version_get', (
+        'Version\n'
+        '---------   \n'
+        '11.6.{}.a\n').format(system % 3))
+    used = random.randint(10000, 160000)
+    conf_system = xcli_txt('conf_get path=system', (
+        'system:\n'
+        '  capacity:\n'
+        '    soft = "161326"\n'
+        '    free_soft = "{0}"\n'
+        '    raw_capacity = "243000"\n'
+        '    used_capacity_soft = "{1}"\n'
+        '    consumed_capacity = "{1}"\n'
+        '  system_state:\n'
+        '    system_state = "on"\n'
+        '    redundancy_status = "Full Redundancy"\n').format(
+            161326 - used, used))
+    # 12 disks per module
+    disk_ids = ['1:Disk:{}:{}'.format(disk // 12 + 1, disk % 12 + 1)
+                for disk in range(disks)]
+    misc_status = xcli_txt(
+        'conf_get path=misc.status', 'sas_disks:\n' + ''.join(
+            '  disk_{}:\n    component_id = "{}"\n'.format(disk, disk_id)
+            for disk, disk_id in enumerate(disk_ids)))
+    disk_list = xcli_txt('disk_list -f all', (
+        'Component ID   Status   Currently Functioning   Capacity   '
+        'Target Status   Vendor   Model\n') + ''.join(
+            '{}   OK   yes   4TB   HITACHI   HUS724040ALS640\n'.format(
+                disk_id) for disk_id in disk_ids))
+    pool_list = xcli_txt('pool_list -f all', (
+        'Name   Size (GB)   Soft Vols (GB)   Snap Size (GB)   '
+        'Soft Empty (GB)   Hard Size (GB)   Hard Vols (GB)   Locked   '
+        'Hard Snaps (GB)   Hard Empty (GB)   Perf Class Name   Domain   '
+        'Create Compressed Volumes\n') + ''.join(
+            'pool_{0}   {1}   {2}   {3}   {4}   {1}   {2}   no   0   {4}'
+            '      no\n'.format(pool, 20000, 12000, 2000, 6000)
+            for pool in range(pools)))
+    vol_list = ''.join(
+        '<volume id="{0}"><id value="{0}"/><name value="vol_{0:05d}"/>'
+        '<size value="103"/><size_MiB value="98304"/>'
+        '<capacity value="201326592"/><serial value="{0}"/>'
+        '<cg_name value=""/><sg_name value=""/><sg_snapshot_of value=""/>'
+        '<locked value="no"/><snapshot_time value=""/>'
+        '<snapshot_time_on_master value=""/><pool_name value="pool_{1}"/>'
+        '<used_capacity value="{2}"/><locked_by_pool value="no"/>'
+        '<snapshot_internal_role value=""/><mirrored value="no"/>'
+        '<compressed value="no"/><ratio value="0"/><saving value="0"/>'
+        '<online value="yes"/><metadata_mismatch value="no"/>'
+        '</volume>'.format(volume, volume % pools, random.randint(0, 103))
+        for volume in range(hosts * volumes))
+    mappings = ''.join(
+        '<map id="{0}"><cluster_id value="-1"/><host_id value="{0}"/>'
+        '<luns>{1}</luns></map>'.format(host, ''.join(
+            '<lun id="{0}"><volume_id value="{1}"/><lun value="{0}"/>'
+            '</lun>'.format(lun, host * volumes + lun)
+            for lun in range(volumes)))
+        for host in range(hosts))
+    host_list = ''.join(
+        '<host id="{0}"><cluster_id value="-1"/><id value="{0}"/>'
+        '<creator value="xiv_development"/><name value="host{0:04d}"/>'
+        '<cluster value=""/><fc_ports value="10000000C9{0:06X}"/>'
+        '<type value="default"/><iscsi_chap_name value=""/>'
+        '<perf_class value=""/></host>'.format(host)
+        for host in range(hosts))
+    return [
+        ('cod_list_-f_all', 'cli.txt', cod_list),
+        ('version_get', 'cli.txt', version_get),
+        ('conf_get_path=system', 'cli.txt', conf_system),
+        ('conf_get_path=misc.status', 'cli.txt', misc_status),
+        ('disk_list_-f_all', 'cli.txt', disk_list),
+        ('pool_list_-f_all', 'cli.txt', pool_list),
+        ('vol_list_-f_all_show_proxy=yes', 'cli.xml',
+         xcli_xml('vol_list -f all show_proxy=yes', vol_list)),
+        ('all_mappings_list', 'cli.xml',
+         xcli_xml('all_mappings_list', mappings)),
+        ('host_list_-f_all', 'cli.xml',
+         xcli_xml('host_list -f all', host_list)),
+    ]
+
+
+def xiv_bundle(directory: str, scale: int, hosts: int = 100,
+               volumes: int = 10) -> str:
+    """Zip with one .tar.bz2 of xcli outputs per XIV system
+
+    :param directory:
+    :param scale: number of systems
+    :param hosts: per system
+    :param volumes: mapped to each host
+    :return:
+    """
+    path = os.path.join(directory, 'xiv_bundle.zip')
+    with ZipFile(path, 'w') as bundle:
+        for system in range(scale):
+            name = 'XIV{:04d}'.format(system)
+            bundle.writestr('{}.tar.bz2'.format(name), tar_bytes([
+                ('{}/{}/{}'.format(name, command, file_name), content)
+                for command, file_name, content
+                in xiv_outputs(system, hosts, volumes)]))
+    return path
+
+
+def eva_config(system: int, objects: int) -> str:
+    """EVA_config.xml of a system
+
+    Every object has the host ports, device ports and disk slots the
+    Controller and Disk Enclosure sheets expect of each object.
+
+    :param system:
+    :param objects:
+    :return:
+    """
+    entries = ''.join(
+        '<object><objectname>\\EVA{0:04d}\\Hardware\\{1:05d}</objectname>'
+        '<objecttype>controller</objecttype>'
+        '<controllername>Controller {1}</controllername>'
+        '<datablocksize>512</datablocksize><modelnumber>HSV340'
+        '</modelnumber><productnumber>AJ932A</productnumber>'
+        '<serialnumber>PAA{0:04d}{1:05d}</serialnumber>'
+        '<firmwareversion>11200000</firmwareversion>'
+        '<systemtype>HSV340</systemtype>'
+        '<totalstoragespace>{2}</totalstoragespace>'
+        '<availablestoragespace>{3}</availablestoragespace>'
+        '<usedstoragespace>{4}</usedstoragespace>'
+        '<cachememory><cachecondition>good</cachecondition>'
+        '<readcapacity>4096</readcapacity><writecapacity>2048'
+        '</writecapacity><mirrorcapacity>2048</mirrorcapacity>'
+        '</cachememory>'
+        '<hostports>{5}</hostports><deviceports>{6}</deviceports>'
+        '{7}</object>'.format(
+            system, entry, 2 ** 40, 2 ** 39, 2 ** 39, ''.join(
+                '<hostport><portname>FP{0}</portname><topology>fabric'
+                '</topology><hostportaddress>50014380{1:08X}</hostportaddress>'
+                '</hostport>'.format(port, entry * 4 + port)
+                for port in range(1, 5)), ''.join(
+                '<deviceport><portname>DP-{0}A</portname><switchtype>'
+                'loop_switch</switchtype></deviceport>'.format(port)
+                for port in range(1, 3)), ''.join(
+                '<diskslot><name>Bay {0}</name><state>installed</state>'
+                '</diskslot>'.format(slot) for slot in range(1, 13)))
+        for entry in range(objects))
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n<objects>{}'
+            '</objects>\n').format(entries)
+
+
+def eva_bundle(directory: str, scale: int, objects: int = 500) -> str:
+    """Zip with one EVA_config.xml per EVA system
+
+    :param directory:
+    :param scale: number of systems
+    :param objects: per system
+    :return:
+    """
+    path = os.path.join(directory, 'eva_bundle.zip')
+    with ZipFile(path, 'w', ZIP_DEFLATED) as bundle:
+        for system in range(scale):
+            bundle.writestr('EVA{:04d}/EVA_config.xml'.format(system),
+                            eva_config(system, objects))
+    return path
+
+
+def ibmds_export(system: int, drives: int, volumes: int) -> str:
+    """DS8000 GUI export csv of a system, one section per object type
+
+    :param system:
+    :param drives:
+    :param volumes:
+    :return:
+    """
+    name = 'DS{:04d}'.format(system)
+    sections = [
+        ([name, 'Online', 'DS8886', '8.8.20', '88.20.112.0', '2831-985',
+          '75DA{:03d}'.format(system), '1234-5678-9ABC-DEF0',
+          '5005076309FFD{:03X}'.format(system), '1', '24', '1024', '480',
+          '2018-03-01T10:00:00', '2017-01-01T10:00:00', 'Automatic'],
+         ['Name', 'State', 'Product', 'Release', 'Bundle', 'MTM', 'S/N',
+          'Machine Signature', 'WWNN', 'Number of Frames', 'Processors',
+          'System Memory (GB)', 'Storage Capacity (TB)',
+          'Last Power on Time', 'Install Time', 'Power Control Mode'], 1),
+        (['Easy Tier', 'Yes', '480', 'FB', 'ABCD-EF01-2345-6789'],
+         ['Name', 'Enabled', 'Capacity (TiB)', 'Storage Type', 'Key Code'],
+         4),
+        (['1', '1', 'Normal', '24', '1200', 'Enterprise', '',
+          'SN{:04d}'.format(system), 'R1-A1'],
+         ['ID', 'Frame', 'State', 'Number of Drives', 'Drive Capacity (GB)',
+          'Drive Class', 'Install Time', 'S/N', 'Location'], drives // 24),
+        (['SN{:04d}'.format(system), 'Normal', 'A1', '1200', 'Enterprise',
+          'FC-AL', '16', 'A1B2', 'R1-A1-D1', '', 'Supported'],
+         ['S/N', 'State', 'Array', 'Drive Capacity (GB)', 'Drive Class',
+          'Interface', 'Interface Rate (Gbps)', 'Firmware', 'Location',
+          'WWNN', 'Encryption'], drives),
+        (['A1', 'Assigned', 'P0', 'FB', '7866', '5000', '1200'],
+         ['ID', 'State', 'Pool', 'Storage Type', 'Total Capacity (GiB)',
+          'Allocated Capacity (GiB)', 'Drive Capacity (GB)'], drives // 8),
+        (['vol', 'Normal', 'FB', '100', '100', 'P0', '0', '0', 'ESE',
+          'Extent', '00', '0', '2107-900', 'FB 512', '', '', '1', '', '',
+          '0'],
+         ['Name', 'State', 'Storage Type', 'Total Capacity (GiB)',
+          'Allocated Capacity (GiB)', 'Pool', 'Node', 'LUN ID',
+          'Thin-provisioning', 'Allocation Method', 'LSS', 'Address Group',
+          'MTM', 'Data Type', 'VOLSER', 'GUID', 'Number of Hosts', 'Scope',
+          'Performance Policy', 'Migrating Capacity'], volumes),
+        (['P0', 'FB', '94392', '60000', '1.0', '95', '60000', '0', '0', '0',
+          'Supported', 'Managed', str(drives // 8), str(volumes), '0'],
+         ['Name', 'Storage Type', 'Total Capacity (GiB)',
+          'Allocated Capacity (GiB)', 'Over-provisioned Ratio', 'Threshold',
+          'Allocated Capacity for Standard Volumes (GiB)',
+          'Allocated Capacity for ESE Volumes (GiB)',
+          'Allocated Capacity for TSE Repository (GiB)',
+          'Allocated Capacity for Metadata (GiB)', 'Encryption',
+          'Easy Tier', 'Number of Arrays', 'Volumes',
+          'Migrating Capacity'], 1),
+        (['10000000C9A1B2C3', 'Online', 'host', 'VMware', 'Any', '10', '4',
+          'LUN Polling', '512', 'VMware', 'V0'],
+         ['WWPN', 'State', 'Host', 'Type', 'Address Mode', 'Volumes',
+          'Number of Accessible I/O Ports', 'Address Discovery',
+          'Logical Block Size', 'Host Connect', 'Volume Group'],
+         volumes // 10),
+    ]
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+    for row, header, count in sections:
+        writer.writerow(header)
+        for number in range(count):
+            # the first column tells the objects apart
+            writer.writerow(['{}{:05d}'.format(row[0], number)
+                             if count > 1 else row[0]] + row[1:])
+        writer.writerow([])
+    return output.getvalue()
+
+
+def ibmds_bundle(directory: str, scale: int, drives: int = 480,
+                 volumes: int = 2000) -> str:
+    """Zip with one DS8000 export csv per system
+
+    :param directory:
+    :param scale: number of systems
+    :param drives: per system
+    :param volumes: per system
+    :return:
+    """
+    path = os.path.join(directory, 'ibmds_bundle.zip')
+    with ZipFile(path, 'w', ZIP_DEFLATED) as bundle:
+        for system in range(scale):
+            bundle.writestr('DS{:04d}/DS{:04d}_export.csv'.format(
+                system, system), ibmds_export(system, drives, volumes))
+    return path
@@ -0,0 +1,411 @@
+"""Benchmark runner, times each stage of every vendor over a synthetic bundle"""
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+from collections import namedtuple
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Callable, Dict, List
+
+from openpyxl import Workbook
+
+from supergrep.benchmark.generators import (
+    celerra_bundle, eva_bundle, ibmds_bundle, isilon_bundle,
+    three_par_bundle, vmax_bundle, vnx_bundle, xiv_bundle, xtremio_bundle)
+from supergrep.cache import member_text
+from supergrep.celerra import celerra
+from supergrep.celerra.cifs_share import SERVER_EXPORT_TMPL
+from supergrep.celerra.server_df import SERVER_DF_TMPL
+from supergrep.config import settings
+from supergrep.eva import eva
+from supergrep.eva.utils import parse_eva_docs
+from supergrep.ibmds import ibmds
+from supergrep.isilon import isilon
+from supergrep.isilon.utils import parse_isilon_docs, process_drives
+from supergrep.parsing import (
+    clear_template_registry, load_raw_content, parse_text, raw_gz_content,
+    raw_tar_content)
+from supergrep.three_par import three_par
+from supergrep.three_par.disks import SHOWPD_TMPL
+from supergrep.three_par.storage_array_summary import SHOWSYS_TMPL
+from supergrep.utils import (
+    ContentIndex, flatten_dict, ordered_jsons, write_rows)
+from supergrep.vmax import vmax
+from supergrep.vmax.list_wwn import LSTWWN_TMPL
+from supergrep.vmax.symdev_info import SYMDEV_TMPL
+from supergrep.vnx import vnx
+from supergrep.vnx.disks import GETDISK_TMPL
+from supergrep.vnx.luns import GETLUN_TMPL
+from supergrep.vnx.storage_array_summary import (
+    ARRAY_NAME_TMPL, GET_AGENT_TMPL, GET_ARRAY_UID_TMPL)
+from supergrep.xiv import xiv
+from supergrep.xiv.volumes import VOLUME_ELEMENTS
+from supergrep.xml_elements import extract_elements
+from supergrep.xtremio import xtremio
+from supergrep.xtremio.utils import compute_row
+
+__all__ = ('main', 'run_benchmarks')
+
+# generator: (directory, scale) -> bundle path
+# load: bundle path -> raw content, index: raw content -> ContentIndex
+# parse: ContentIndex -> rows, main: vendor entry point
+Vendor = namedtuple('Vendor', 'generator scale load index parse main')
+
+
+def template_rows(patterns: tuple, templates: tuple) -> Callable:
+    """Parse stage running the templates over the content of the patterns
+
+    :param patterns:
+    :param templates:
+    :return:
+    """
+    def parse(content_index: ContentIndex) -> list:
+        content = content_index.partitioned(patterns, '*' * 20 + '\n')
+        rows = []  # type: list
+        for template in templates:
+            for _, text in content.partitions:
+                rows += parse_text(member_text(text), template)
+        return rows
+
+    return parse
+
+
+def xtremio_rows(content_index: ContentIndex) -> list:
+    """Parse stage of the XtremIO performance history
+
+    :param content_index:
+    :return:
+    """
+    lines = member_text(content_index.relevant(
+        ('*performance_history.csv', ))).split('\n')
+    return [compute_row(line.split(',')) for line in lines[1:] if line]
+
+
+def isilon_rows(raw_content: list) -> list:
+    """Parse stage of the Isilon node dumps, up to the drive list
+
+    :param raw_content:
+    :return:
+    """
+    rows = []  # type: list
+    for component, commands in parse_isilon_docs(
+            [content for _, content in raw_content]):
+        drives, _ = process_drives(
+            commands.data('isi_for_array isi devices list --format?json'),
+            ['lnum', 'baynum', 'serial', 'ui_state', 'model'])
+        rows += [[component['hostname']] + row for row in drives]
+    return rows
+
+
+def xiv_rows(content_index: ContentIndex) -> list:
+    """Parse stage of the XIV vol_list cli.xml documents
+
+    :param content_index:
+    :return:
+    """
+    rows = []  # type: list
+    for content in content_index.separated(
+            ('*vol_list_-f_all_show_proxy=yes/cli.xml', )):
+        volumes = extract_elements(
+            '\n'.join(content.split('\n')[1:]), VOLUME_ELEMENTS)['volume']
+        rows += ordered_jsons(
+            [flatten_dict(volume) for volume in volumes],
+            ['id/@value', 'name/@value', 'size/@value', 'pool_name/@value'])
+    return rows
+
+
+def eva_rows(content_index: ContentIndex) -> list:
+    """Parse stage of the EVA_config.xml documents
+
+    :param content_index:
+    :return:
+    """
+    rows = []  # type: list
+    for objects in parse_eva_docs(
+            content_index.separated(('*EVA_config.xml', ))):
+        rows += ordered_jsons(objects, [
+            'objectname', 'systemtype', 'firmwareversion',
+            'totalstoragespace', 'availablestoragespace',
+            'usedstoragespace'])
+    return rows
+
+
+def ibmds_rows(content_index: ContentIndex) -> list:
+    """Parse stage of the IBM DS export csvs, every section
+
+    :param content_index:
+    :return:
+    """
+    return [row for content in content_index.separated(('*.csv', ))
+            for row in csv.reader(content.split('\n')) if row]
+
+
+VENDORS = {
+    'vnx': Vendor(
+        vnx_bundle, 10,
+        lambda bundle: list(load_raw_content((bundle, ), ('SPA_cfg_info.txt', ))),
+        lambda raw: ContentIndex(raw, ('SPA_cfg_info.txt', )),
+        template_rows(('SPA_cfg_info.txt', ), (
+            ARRAY_NAME_TMPL, GET_ARRAY_UID_TMPL, GET_AGENT_TMPL,
+            GETDISK_TMPL, GETLUN_TMPL)),
+        vnx.main),
+    'vmax': Vendor(
+        vmax_bundle, 10,
+        lambda bundle: list(load_raw_content((bundle, ), (
+            '*_symaccess_list_devinfo.txt', '*_symdev_list_wwn.txt'))),
+        lambda raw: ContentIndex(raw, (
+            '*_symaccess_list_devinfo.txt', '*_symdev_list_wwn.txt')),
+        lambda content_index: (
+            template_rows(('*_symaccess_list_devinfo.txt', ),
+                          (SYMDEV_TMPL, ))(content_index)
+            + template_rows(('*_symdev_list_wwn.txt', ),
+                            (LSTWWN_TMPL, ))(content_index)),
+        vmax.main),
+    'xtremio': Vendor(
+        xtremio_bundle, 50000,
+        lambda bundle: list(load_raw_content(
+            (bundle, ), ('*performance_history.csv', ))),
+        lambda raw: ContentIndex(raw, ('*performance_history.csv', )),
+        xtremio_rows,
+        xtremio.main),
+    'isilon': Vendor(
+        isilon_bundle, 10,
+        lambda bundle: raw_gz_content((bundle, )),
+        lambda raw: raw,
+        isilon_rows,
+        isilon.main),
+    'celerra': Vendor(
+        celerra_bundle, 10,
+        lambda bundle: list(load_raw_content((bundle, ), (
+            '*cmd_outputs/hostname', '*cmd_outputs/server_export',
+            '*cmd_outputs/server_df'))),
+        lambda raw: ContentIndex(raw, (
+            '*cmd_outputs/hostname', '*cmd_outputs/server_export',
+            '*cmd_outputs/server_df')),
+        lambda content_index: (
+            template_rows(('*cmd_outputs/hostname',
+                           '*cmd_outputs/server_export'),
+                          (SERVER_EXPORT_TMPL, ))(content_index)
+            + template_rows(('*cmd_outputs/hostname',
+                             '*cmd_outputs/server_df'),
+                            (SERVER_DF_TMPL, ))(content_index)),
+        celerra.main),
+    '3par': Vendor(
+        three_par_bundle, 10,
+        lambda bundle: list(raw_tar_content((bundle, ), (
+            '*showsys.out', '*showsys_-d.out', '*showversion.out',
+            '*showpd.out'))),
+        lambda raw: ContentIndex(raw, (
+            '*showsys.out', '*showsys_-d.out', '*showversion.out',
+            '*showpd.out')),
+        lambda content_index: (
+            template_rows(('*showsys.out', '*showsys_-d.out',
+                           '*showversion.out'),
+                          (SHOWSYS_TMPL, ))(content_index)
+            + template_rows(('*showsys.out', '*showpd.out'),
+                            (SHOWPD_TMPL, ))(content_index)),
+        three_par.main),
+    'xiv': Vendor(
+        xiv_bundle, 10,
+        lambda bundle: list(raw_tar_content((bundle, ), (
+            '*cod_list_-f_all/cli.txt',
+            '*vol_list_-f_all_show_proxy=yes/cli.xml'))),
+        lambda raw: ContentIndex(raw, (
+            '*cod_list_-f_all/cli.txt',
+            '*vol_list_-f_all_show_proxy=yes/cli.xml')),
+        xiv_rows,
+        xiv.main),
+    'eva': Vendor(
+        eva_bundle, 10,
+        lambda bundle: list(load_raw_content(
+            (bundle, ), ('*EVA_config.xml', ))),
+        lambda raw: ContentIndex(raw, ('*EVA_config.xml', )),
+        eva_rows,
+        eva.main),
+    'ibmds': Vendor(
+        ibmds_bundle, 10,
+        lambda bundle: list(load_raw_content((bundle, ), ('*.csv', ))),
+        lambda raw: ContentIndex(raw, ('*.csv', )),
+        ibmds_rows,
+        ibmds.main),
+}
+
+
+def time_stage(func: Callable, repeat: int) -> tuple:
+    """Times a stage, returns its timings and the result of its last run
+
+    :param func:
+    :param repeat:
+    :return: (seconds of each run, result, error)
+    """
+    timings = []  # type: List[float]
+    result = None
+    for _ in range(repeat):
+        clear_template_registry()
+        start = time.perf_counter()
+        try:
+            result = func()
+        except Exception:  # pylint: disable=broad-except
+            return timings, None, traceback.format_exc()
+        timings.append(time.perf_counter() - start)
+    return timings, result, None
+
+
+def save_workbook(rows: list) -> int:
+    """Write and save stages, the rows into a new workbook saved in memory
+
+    :param rows:
+    :return: size of the saved workbook
+    """
+    workbook = Workbook()
+    write_rows(workbook.active, rows)
+    output = BytesIO()
+    workbook.save(output)
+    return len(output.getvalue())
+
+
+def benchmark_vendor(name: str, vendor: Vendor, scale: int, repeat: int,
+                     directory: str) -> List[dict]:
+    """Runs the stage and end to end benchmarks of a vendor
+
+    :param name:
+    :param vendor:
+    :param scale:
+    :param repeat:
+    :param directory:
+    :return: one result per stage
+    """
+    bundle = vendor.generator(directory, scale)
+    results = []  # type: List[dict]
+    outputs = {}  # type: Dict[str, Any]
+    stages = (
+        ('load', lambda: vendor.load(bundle)),
+        ('filter', lambda: vendor.index(outputs['load'])),
+        ('parse', lambda: vendor.parse(outputs['filter'])),
+        ('write', lambda: write_rows(Workbook().active, outputs['parse'])),
+        ('save', lambda: save_workbook(outputs['parse'])),
+        ('end_to_end', lambda: vendor.main(
+            (bundle, ), os.path.join(directory, '{}.xlsx'.format(name)))),
+    )
+    for stage, func in stages:
+        if stage != 'end_to_end' and any(
+                result['error'] for result in results):
+            continue
+        timings, outputs[stage], error = time_stage(func, repeat)
+        results.append({
+            'vendor': name,
+            'stage': stage,
+            'scale': scale,
+            'bundle_bytes': os.path.getsize(bundle),
+            'rows': len(outputs.get('parse') or []),
+            'runs': len(timings),
+            'seconds_min': round(min(timings), 6) if timings else None,
+            'seconds_median': round(
+                statistics.median(timings), 6) if timings else None,
+            'error': error
+        })
+    return results
+
+
+def run_benchmarks(vendors: List[str], scale: int = None, repeat: int = 3,
+                   seed: int = 0) -> dict:
+    """Runs the benchmarks of the vendors in a temporary directory
+
+    :param vendors:
+    :param scale: None for the default scale of each vendor
+    :param repeat:
+    :param seed: of the synthetic data
+    :return: machine readable results
+    """
+    random.seed(seed)
+    settings.parse_workers = 1
+    results = []  # type: List[dict]
+    with tempfile.TemporaryDirectory() as directory:
+        for name in vendors:
+            vendor = VENDORS[name]
+            results += benchmark_vendor(
+                name, vendor, scale or vendor.scale, repeat, directory)
+    return {
+        'created': datetime.now().isoformat(),
+        'supergrep': settings.version,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'prefilter': settings.prefilter,
+        'seed': seed,
+        'results': results
+    }
+
+
+def compare(baseline: dict, current: dict) -> List[str]:
+    """Lines comparing the median timings with a baseline run
+
+    :param baseline:
+    :param current:
+    :return:
+    """
+    before = {(result['vendor'], result['stage']): result
+              for result in baseline['results']}
+    lines = []
+    for result in current['results']:
+        previous = before.get((result['vendor'], result['stage']))
+        if not previous or not previous['seconds_median'] \
+                or result['seconds_median'] is None:
+            continue
+        lines.append('{:8} {:11} {:10.4f}s {:10.4f}s {:7.2f}x'.format(
+            result['vendor'], result['stage'], previous['seconds_median'],
+            result['seconds_median'],
+            result['seconds_median'] / previous['seconds_median']))
+    return lines
+
+
+def main(argv: Any) -> int:
+    """Benchmark entry point
+
+    :param argv: sys.argv
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='supergrep.benchmark')
+    parser.add_argument(
+        '-v', '--vendors', nargs='+', choices=sorted(VENDORS),
+        default=sorted(VENDORS), help='vendors to benchmark')
+    parser.add_argument(
+        '-s', '--scale', type=int,
+        help='arrays, nodes or samples of each synthetic bundle')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=3, help='runs of each stage')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--no-prefilter', action='store_true',
+        help='benchmark without the textfsm line prefilter')
+    parser.add_argument('-o', '--output', help='path of the JSON results')
+    parser.add_argument(
+        '-c', '--compare', help='JSON results of a previous run')
+    options = parser.parse_args(argv[1:])
+    settings.prefilter = not options.no_prefilter
+
+    report = run_benchmarks(
+        options.vendors, options.scale, options.repeat, options.seed)
+    if options.output:
+        with open(options.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    for result in report['results']:
+        print('{:8} {:11} {}'.format(
+            result['vendor'], result['stage'],
+            'failed' if result['error'] else '{:.4f}s'.format(
+                result['seconds_median'])))
+    if options.compare:
+        with open(options.compare) as baseline:
+            print('\n'.join(compare(json.load(baseline), report)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
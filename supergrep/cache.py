@@ -0,0 +1,178 @@
+"""On-disk cache of parsed rows, shared between runs"""
+import hashlib
+import json
+import sqlite3
+from typing import Any, Callable, Dict, Optional
+
+from supergrep.config import settings
+
+__all__ = ('DeferredText', 'MemberText', 'cached_rows', 'close_cache',
+           'content_key', 'join_members', 'member_text', 'store_rows',
+           'text_size')
+
+# Bump when the stored rows change meaning (e.g. a textfsm upgrade)
+CACHE_VERSION = '1'
+
+# Open connections, keyed by database path (one per process)
+_CONNECTIONS = dict()  # type: Dict[str, sqlite3.Connection]
+
+
+class MemberText(str):
+    """Decoded text of archive members, with the signature of the members
+
+    The signature is taken from the archive headers (name, CRC32 or mtime,
+    size) and identifies the text without hashing it. Texts joined by the
+    content index are signed with the signatures of all their members.
+    """
+
+    def __new__(cls, text: str, signature: tuple) -> 'MemberText':
+        member_text = super().__new__(cls, text)
+        member_text.signature = signature
+        return member_text
+
+    def __getnewargs__(self) -> tuple:
+        return str(self), self.signature
+
+
+class DeferredText:
+    """Text of archive members, read and decoded when it is first used
+
+    Carries the signature the decoded MemberText has, so the rows parsed
+    from it are found in the on-disk cache without reading the members at
+    all. Partitioned content keeps its partitions, deferred as well.
+    Anything else that needs the text gets it from member_text.
+    """
+
+    def __init__(self, load: Callable[[], str], signature: Optional[tuple],
+                 size: int, partitions: tuple = None) -> None:
+        self._load = load
+        self._text = None  # type: Optional[str]
+        self.signature = signature
+        self.size = size
+        self.partitions = partitions
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def text(self) -> str:
+        """The decoded text, loaded once"""
+        if self._text is None:
+            self._text = self._load()
+        return self._text
+
+
+def member_text(content: Any) -> Any:
+    """Text of content, decoded first when it is deferred
+
+    :param content:
+    :return:
+    """
+    return content.text if isinstance(content, DeferredText) else content
+
+
+def text_size(content: Any) -> int:
+    """Size of content, from the archive headers when it is deferred
+
+    :param content:
+    :return:
+    """
+    return content.size if isinstance(content, DeferredText) else len(content)
+
+
+def join_members(separator: str, texts: list) -> Any:
+    """Joins member texts, signed when every text is signed
+
+    Texts that are all signed, some of them deferred, give a deferred text.
+
+    :param separator:
+    :param texts:
+    :return:
+    """
+    signatures = tuple(getattr(text, 'signature', None) for text in texts)
+    if texts and None not in signatures and any(
+            isinstance(text, DeferredText) for text in texts):
+        return DeferredText(
+            lambda: join_members(separator, list(map(member_text, texts))),
+            (separator, ) + signatures,
+            sum(map(text_size, texts)) + len(separator) * (len(texts) - 1))
+    joined = separator.join(map(member_text, texts))
+    if not texts or None in signatures:
+        return joined
+    return MemberText(joined, (separator, ) + signatures)
+
+
+def content_key(content: str, template_key: str) -> str:
+    """Cache key of the rows a template gives for a content
+
+    Signed content is keyed by its members' signatures, any other content
+    by the digest of its text.
+
+    :param content:
+    :param template_key:
+    :return:
+    """
+    signature = getattr(content, 'signature', None)
+    if signature is not None:
+        identity = repr(signature).encode('utf-8')
+    else:
+        identity = str(content).encode('utf-8', 'surrogatepass')
+    digest = hashlib.sha1(identity).hexdigest()
+    return '{}:{}:{}'.format(CACHE_VERSION, template_key, digest)
+
+
+def _connection() -> Optional[sqlite3.Connection]:
+    """Connection to the cache database, None when caching is off
+
+    :return:
+    """
+    path = settings.cache_path
+    if not path:
+        return None
+    if path not in _CONNECTIONS:
+        connection = sqlite3.connect(path, timeout=60)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS parsed_rows '
+            '(key TEXT PRIMARY KEY, rows TEXT NOT NULL)')
+        connection.commit()
+        _CONNECTIONS[path] = connection
+    return _CONNECTIONS[path]
+
+
+def cached_rows(key: str) -> Any:
+    """Rows stored under a key, None when missing or caching is off
+
+    :param key:
+    :return:
+    """
+    connection = _connection()
+    if connection is None:
+        return None
+    found = connection.execute(
+        'SELECT rows FROM parsed_rows WHERE key = ?', (key, )).fetchone()
+    return None if found is None else json.loads(found[0])
+
+
+def store_rows(key: str, rows: list) -> None:
+    """Stores the rows under a key, when caching is on
+
+    :param key:
+    :param rows:
+    """
+    connection = _connection()
+    if connection is None:
+        return
+    with connection:
+        connection.execute(
+            'INSERT OR REPLACE INTO parsed_rows (key, rows) VALUES (?, ?)',
+            (key, json.dumps(rows)))
+
+
+def close_cache() -> None:
+    """Closes the cache databases opened by this process"""
+    for connection in _CONNECTIONS.values():
+        connection.close()
+    _CONNECTIONS.clear()
@@ -1,12 +1,11 @@
 """Backend Disk Info Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, column_format, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 
 BACKEND_DISK_TMPL = textwrap.dedent("""\
@@ -45,6 +44,7 @@ BACKEND_DISK_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Backend Disk Info worksheet
 
@@ -55,22 +55,11 @@ def process(workbook: Any, content: str) -> None:
 
     headers = get_parser_header(BACKEND_DISK_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     backend_storage_out = run_parser_over(content, BACKEND_DISK_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, backend_storage_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, backend_storage_out)
 
     sheet_process_output(
         worksheet,
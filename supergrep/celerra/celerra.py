@@ -1,27 +1,43 @@
 """Celerra command entry point"""
 import os
 
-from openpyxl import load_workbook
-
-from supergrep.celerra.backend_disk_info import process as backend_disk_info
-from supergrep.celerra.backend_storage import process as backend_storage
-from supergrep.celerra.backend_storage_details import process as backend_storage_details
-from supergrep.celerra.cifs_share import process as cifs_share
-from supergrep.celerra.disk_groups import process as disk_groups
-from supergrep.celerra.fs_dedupe import process as fs_dedupe
-from supergrep.celerra.nas_fs_info_all import process as nas_fs_info_all
-from supergrep.celerra.nas_license import process as nas_license
-from supergrep.celerra.nas_pool_info_all import process as nas_pool_info_all
-from supergrep.celerra.nas_replicate_info import process as nas_replicate_info
-from supergrep.celerra.nas_summary import process as nas_summary
-from supergrep.celerra.physical_dm import process as physical_dm
-from supergrep.celerra.pool_configuration import process as pool_configuration
-from supergrep.celerra.server_df import process as server_df
-from supergrep.celerra.system_details import process as system_details
-from supergrep.celerra.virtual_dm import process as virtual_dm
-from supergrep.celerra.volume_size import process as volume_size
+from supergrep.celerra.backend_disk_info import (
+    BACKEND_DISK_TMPL, process as backend_disk_info)
+from supergrep.celerra.backend_storage import (
+    BACKEND_TMPL, process as backend_storage)
+from supergrep.celerra.backend_storage_details import (
+    BACKEND_DETAILS_TMPL, process as backend_storage_details)
+from supergrep.celerra.cifs_share import (
+    SERVER_EXPORT_TMPL, process as cifs_share)
+from supergrep.celerra.disk_groups import (
+    DISK_GROUPS_TMPL, process as disk_groups)
+from supergrep.celerra.fs_dedupe import FS_DEDUPE_TMPL, process as fs_dedupe
+from supergrep.celerra.nas_fs_info_all import (
+    NAS_FS_TMPL, process as nas_fs_info_all)
+from supergrep.celerra.nas_license import (
+    NAS_LICENSE_TMPL, process as nas_license)
+from supergrep.celerra.nas_pool_info_all import (
+    NAS_POOL_INFO_TMPL, process as nas_pool_info_all)
+from supergrep.celerra.nas_replicate_info import (
+    NAS_REPLICATE_TMPL, process as nas_replicate_info)
+from supergrep.celerra.nas_summary import (
+    NAS_SUMMARY_TMPL, process as nas_summary)
+from supergrep.celerra.physical_dm import (
+    NAS_SERVER_TMPL, process as physical_dm)
+from supergrep.celerra.pool_configuration import (
+    POOL_CONFIG_TMPL, process as pool_configuration)
+from supergrep.celerra.server_df import SERVER_DF_TMPL, process as server_df
+from supergrep.celerra.system_details import (
+    SYSTEM_DETAILS_TMPL, process as system_details)
+from supergrep.celerra.virtual_dm import (
+    NAS_VIRTUAL_TMPL, process as virtual_dm)
+from supergrep.celerra.volume_size import (
+    NAS_VOLUME_TMPL, process as volume_size)
+from supergrep.instrumentation import stage
 from supergrep.parsing import load_raw_content
-from supergrep.utils import get_bundle_dir, get_relevant_content
+from supergrep.scheduler import prefetch_parsers, sheet_jobs
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
 
 __all__ = ('main',)
 
@@ -34,7 +50,7 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\celerra-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path, stream=False)
 
     raw_content_patterns = (
         '*cmd_outputs/hostname',
@@ -55,76 +71,96 @@ def main(input_files: str, output_file: str) -> None:
     )
 
     raw_content = load_raw_content(tuple(input_files), raw_content_patterns)
-
-    system_details_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[1],
-                      raw_content_patterns[6],
-                      raw_content_patterns[7]), '*' * 20 + '\n')
-
-    nas_summary_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[2]))
-
-    nas_license_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[3]), '*' * 20 + '\n')
-
-    pool_configuration_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[4]), '*' * 20 + '\n')
-
-    nas_pool_info_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[5]), '*' * 20 + '\n')
-
-    disk_groups_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[4]), '*' * 20 + '\n')
-
-    backend_storage_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[4]), '*' * 20 + '\n')
-
-    backend_disk_info_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[4]), '*' * 20 + '\n')
-
-    backend_details_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[4]), '*' * 20 + '\n')
-
-    physical_dm_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[8]), '*' * 20 + '\n')
-
-    virtual_dm_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[8]), '*' * 20 + '\n')
-
-    cifs_share_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[9]), '*' * 20 + '\n')
-
-    serverd_df_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[10]), '*' * 20 + '\n')
-
-    fs_dedupe_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[11]), '*' * 20 + '\n')
-
-    nas_fs_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[12]), '*' * 20 + '\n')
-
-    nas_replicate_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[13]), '*' * 20 + '\n')
-
-    volume_size_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[14]), '*' * 20 + '\n')
+    content_index = ContentIndex(raw_content, raw_content_patterns)
+
+    system_details_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[1],
+         raw_content_patterns[6],
+         raw_content_patterns[7]), '*' * 20 + '\n')
+
+    nas_summary_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[2]))
+
+    nas_license_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[3]), '*' * 20 + '\n')
+
+    pool_configuration_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[4]), '*' * 20 + '\n')
+
+    nas_pool_info_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[5]), '*' * 20 + '\n')
+
+    disk_groups_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[4]), '*' * 20 + '\n')
+
+    backend_storage_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[4]), '*' * 20 + '\n')
+
+    backend_disk_info_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[4]), '*' * 20 + '\n')
+
+    backend_details_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[4]), '*' * 20 + '\n')
+
+    physical_dm_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[8]), '*' * 20 + '\n')
+
+    virtual_dm_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[8]), '*' * 20 + '\n')
+
+    cifs_share_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[9]), '*' * 20 + '\n')
+
+    serverd_df_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[10]), '*' * 20 + '\n')
+
+    fs_dedupe_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[11]), '*' * 20 + '\n')
+
+    nas_fs_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[12]), '*' * 20 + '\n')
+
+    nas_replicate_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[13]), '*' * 20 + '\n')
+
+    volume_size_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[14]), '*' * 20 + '\n')
+
+    prefetch_parsers(
+        sheet_jobs(system_details_content, SYSTEM_DETAILS_TMPL)
+        + sheet_jobs(nas_summary_content, NAS_SUMMARY_TMPL)
+        + sheet_jobs(nas_license_content, NAS_LICENSE_TMPL)
+        + sheet_jobs(pool_configuration_content, POOL_CONFIG_TMPL)
+        + sheet_jobs(nas_pool_info_content, NAS_POOL_INFO_TMPL)
+        + sheet_jobs(disk_groups_content, DISK_GROUPS_TMPL)
+        + sheet_jobs(backend_storage_content, BACKEND_TMPL)
+        + sheet_jobs(backend_disk_info_content, BACKEND_DISK_TMPL)
+        + sheet_jobs(backend_details_content, BACKEND_DETAILS_TMPL)
+        + sheet_jobs(physical_dm_content, NAS_SERVER_TMPL)
+        + sheet_jobs(virtual_dm_content, NAS_VIRTUAL_TMPL)
+        + sheet_jobs(cifs_share_content, SERVER_EXPORT_TMPL)
+        + sheet_jobs(serverd_df_content, SERVER_DF_TMPL)
+        + sheet_jobs(fs_dedupe_content, FS_DEDUPE_TMPL)
+        + sheet_jobs(nas_fs_content, NAS_FS_TMPL)
+        + sheet_jobs(nas_replicate_content, NAS_REPLICATE_TMPL)
+        + sheet_jobs(volume_size_content, NAS_VOLUME_TMPL))
 
     system_details(workbook, system_details_content)
     nas_summary(workbook, nas_summary_content)
@@ -144,4 +180,5 @@ def main(input_files: str, output_file: str) -> None:
     nas_replicate_info(workbook, nas_replicate_content)
     volume_size(workbook, volume_size_content)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
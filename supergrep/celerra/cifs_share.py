@@ -1,17 +1,15 @@
 """SMB, NFS, Multiprotocol Sheets"""
 import textwrap
-from collections import namedtuple
 from operator import itemgetter
 from typing import Any
 
 from cytoolz import groupby
-from openpyxl.styles import Alignment
 
 from supergrep.celerra.utils import classify_rows
-from supergrep.formatting import (
-    build_header, column_format, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 SERVER_EXPORT_TMPL = textwrap.dedent("""\
     Value Required,Filldown Hostname (\S+)
@@ -39,6 +37,7 @@ SERVER_EXPORT_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process SMB, NFS, Multiprotocol worksheets
 
@@ -70,22 +69,8 @@ def process(workbook: Any, content: str) -> None:
     for sheet, data_list in zip(sheets, [share, export, multi]):
         worksheet = workbook.get_sheet_by_name(sheet)
         build_header(worksheet, row_tuples[sheet])
-        RowTuple = namedtuple('RowTuple', row_tuples[sheet])
-
-        final_col, final_row = 0, 0
-        for row_n, row_tuple in enumerate(map(RowTuple._make, data_list), 2):
-            for col_n, col_value in \
-                    enumerate(row_tuple._asdict().values(), ord('A')):
-                cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-                if isinstance(col_value, str):
-                    cell.value = str.strip(col_value)
-                else:
-                    cell.alignment = Alignment(wrapText=True)
-                    cell.value = '\n'.join(col_value)
-                style_value_cell(cell)
-                set_cell_to_number(cell)
-                final_col = col_n
-            final_row = row_n
+
+        final_col, final_row = write_rows(worksheet, data_list)
 
         sheet_process_output(
             worksheet,
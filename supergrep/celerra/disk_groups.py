@@ -1,12 +1,11 @@
 """Disk Groups Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, column_format, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 DISK_GROUPS_TMPL = textwrap.dedent("""\
     Value Required,Filldown Hostname (\S+)
@@ -58,6 +57,7 @@ DISK_GROUPS_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Disk Groups worksheet
 
@@ -68,23 +68,12 @@ def process(workbook: Any, content: str) -> None:
 
     headers = get_parser_header(DISK_GROUPS_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     disk_groups_out = run_parser_over(content, DISK_GROUPS_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, disk_groups_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            if chr(col_n) not in ('B', ):
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, disk_groups_out, text_cols='B')
 
     sheet_process_output(
         worksheet,
@@ -1,14 +1,11 @@
 """nas_replicate_info Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from openpyxl.styles import Alignment
-
-from supergrep.formatting import (
-    build_header, column_format, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 
 NAS_REPLICATE_TMPL = textwrap.dedent("""\
@@ -64,6 +61,7 @@ NAS_REPLICATE_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process nas_replicate_info worksheet
 
@@ -74,27 +72,12 @@ def process(workbook: Any, content: str) -> None:
 
     headers = get_parser_header(NAS_REPLICATE_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     nas_replicate_out = run_parser_over(content, NAS_REPLICATE_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, nas_replicate_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            style_value_cell(cell)
-            if chr(col_n) not in ('B',):
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, nas_replicate_out, text_cols='B')
 
     sheet_process_output(
         worksheet,
@@ -1,14 +1,12 @@
 """System Details Sheet"""
 import textwrap
-from collections import namedtuple, Counter
+from collections import Counter
 from typing import Any
 
-from openpyxl.styles import Alignment
-
-from supergrep.formatting import (
-    build_header, column_format, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 
 SYSTEM_DETAILS_TMPL = textwrap.dedent("""\
@@ -54,6 +52,7 @@ SYSTEM_DETAILS_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process System Details worksheet
 
@@ -64,8 +63,6 @@ def process(workbook: Any, content: str) -> None:
 
     headers = get_parser_header(SYSTEM_DETAILS_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     system_details_out = run_parser_over(content, SYSTEM_DETAILS_TMPL)
@@ -77,20 +74,7 @@ def process(workbook: Any, content: str) -> None:
             [det for det in det_counts], \
             [str(count) for count in det_counts.values()]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, system_details_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, system_details_out)
 
     sheet_process_output(
         worksheet,
@@ -1,12 +1,11 @@
 """VIRTUAL DM Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, column_format, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 NAS_VIRTUAL_TMPL = textwrap.dedent("""\
     Value Required,Filldown Hostname (\S+)
@@ -35,6 +34,7 @@ NAS_VIRTUAL_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process VIRTUAL DM worksheet
 
@@ -45,22 +45,11 @@ def process(workbook: Any, content: str) -> None:
 
     headers = get_parser_header(NAS_VIRTUAL_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     nas_virtual_out = run_parser_over(content, NAS_VIRTUAL_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, nas_virtual_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, nas_virtual_out)
 
     sheet_process_output(
         worksheet,
@@ -9,6 +9,27 @@ class Settings:
     prog_name = 'supergrep'
     version = '0.1'
     title = 'SuperGrep version {}'.format(version)
+    # worker processes for the textfsm stage, None means one per CPU
+    parse_workers = None
+    # drop the lines no template rule matches before running textfsm
+    prefilter = True
+    # worker processes of the batch mode, None means one per CPU
+    batch_workers = None
+    # stream the output workbook instead of filling the template in memory
+    write_only = False
+    # format of the output, xlsx or the extension of one of the sinks
+    output_format = 'xlsx'
+    # sqlite file caching the parsed rows between runs, None disables it
+    cache_path = None
+    # write a JSON report of the time, memory and rows of every stage
+    report = False
+    # trace the memory of every stage in the report (slower, skews timings)
+    report_memory = False
+    # write the cProfile stats of every sheet
+    profile = False
+    # clitable index of the parse entry point, and the Vendor it matches
+    template_index = None
+    vendor = None
 
 
 settings = Settings()
@@ -1,21 +1,19 @@
 """Disk Enclosure sheet"""
-from collections import namedtuple
 from typing import Any
 
-import xmltodict
-
 from supergrep.eva.utils import merge_dicts
 from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.utils import (
-    sheet_process_output, search_tag_value, ordered_jsons, flatten_dict,
-    write_excel)
+    sheet_process_output, ordered_jsons, flatten_dict, write_rows)
 
 
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process Controller worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'Disk Enclosure'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
@@ -25,7 +23,6 @@ def process(workbook: Any, contents: list) -> None:
         'ProductId', 'ProductNumber', 'DiskSlot'
     ]
 
-    RowTuple = namedtuple('RowTuple', excel_header)
     build_header(worksheet, excel_header)
 
     header = [
@@ -34,11 +31,8 @@ def process(workbook: Any, contents: list) -> None:
     ]
 
     disk_data = []  # type: list
-    for content in contents:
-        doc = xmltodict.parse(content)
-
-        raw_disk_data = [flatten_dict(det_dict)
-                         for det_dict in search_tag_value(doc, 'object')]
+    for objects in docs:
+        raw_disk_data = [flatten_dict(det_dict) for det_dict in objects]
         for main_dict in raw_disk_data:
             entry = list(ordered_jsons([main_dict], ['diskslot']))
             if entry:
@@ -46,7 +40,7 @@ def process(workbook: Any, contents: list) -> None:
                 main_dict = flatten_dict(main_dict)
                 disk_data += ordered_jsons([main_dict], header)
 
-    final_col, final_row = write_excel(disk_data, worksheet, RowTuple, 'A')
+    final_col, final_row = write_rows(worksheet, disk_data)
     sheet_process_output(
         worksheet,
         'DiskEnclosureTable',
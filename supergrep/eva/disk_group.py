@@ -1,19 +1,17 @@
 """Disk Group sheet"""
-from collections import namedtuple
 from typing import Any
 
-import xmltodict
-
 from supergrep.formatting import build_header
-from supergrep.utils import (
-    sheet_process_output, search_tag_value, ordered_jsons, write_excel)
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, ordered_jsons, write_rows
 
 
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process Disk Group worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'Disk Group'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
@@ -25,9 +23,6 @@ def process(workbook: Any, contents: list) -> None:
     ]
     object_excel_header = ['ObjectName', 'TotalUngroupedDisks', 'XMLCapacityGB']
 
-    DiskTuple = namedtuple('DiskTuple', disk_excel_header)
-    ObjectTuple = namedtuple('ObjectTuple', object_excel_header)
-
     build_header(worksheet, disk_excel_header)
     build_header(worksheet, object_excel_header, 'I')
 
@@ -39,15 +34,14 @@ def process(workbook: Any, contents: list) -> None:
     object_header = ['objectname', 'totalungroupeddisks', 'xmlcapacitygb']
 
     disk_data, object_data = [], []  # type: list, list
-    for content in contents:
-        doc = xmltodict.parse(content)
+    for objects in docs:
         disk_data += list(
-            ordered_jsons(search_tag_value(doc, 'object'), disk_header))
+            ordered_jsons(objects, disk_header))
 
         object_data += list(
-            ordered_jsons(search_tag_value(doc, 'object'), object_header))
+            ordered_jsons(objects, object_header))
 
-    final_col, final_row = write_excel(disk_data, worksheet, DiskTuple, 'A')
+    final_col, final_row = write_rows(worksheet, disk_data)
     sheet_process_output(
         worksheet,
         'DiskTable',
@@ -55,7 +49,7 @@ def process(workbook: Any, contents: list) -> None:
         final_col,
         final_row)
 
-    final_col, final_row = write_excel(object_data, worksheet, ObjectTuple, 'I')
+    final_col, final_row = write_rows(worksheet, object_data, start_col='I')
     sheet_process_output(
         worksheet,
         'ObjectTable',
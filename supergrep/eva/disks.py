@@ -1,20 +1,18 @@
 """Disks sheet"""
-from collections import namedtuple
 from typing import Any
 
-import xmltodict
-
 from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.utils import (
-    flatten_dict, ordered_jsons, sheet_process_output, search_tag_value,
-    write_excel)
+    flatten_dict, ordered_jsons, sheet_process_output, write_rows)
 
 
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process Disks worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'Disks'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
@@ -25,8 +23,6 @@ def process(workbook: Any, contents: list) -> None:
         'FormattedCapacity', 'Occupancy'
     ]
 
-    HostTuple = namedtuple('HostTuple', disks_excel_header)
-
     build_header(worksheet, disks_excel_header)
 
     disks_header = [
@@ -36,14 +32,11 @@ def process(workbook: Any, contents: list) -> None:
     ]
 
     disk_data = []  # type: list
-    for content in contents:
-        doc = xmltodict.parse(content)
-
-        raw_disk_data = [flatten_dict(det_dict)
-                         for det_dict in search_tag_value(doc, 'object')]
+    for objects in docs:
+        raw_disk_data = [flatten_dict(det_dict) for det_dict in objects]
         disk_data += ordered_jsons(raw_disk_data, disks_header)
 
-    final_col, final_row = write_excel(disk_data, worksheet, HostTuple, 'A')
+    final_col, final_row = write_rows(worksheet, disk_data)
     sheet_process_output(
         worksheet,
         'DisksTable',
@@ -1,17 +1,18 @@
 """EVA command entry point"""
 import os
 
-from openpyxl import load_workbook
-
 from supergrep.eva.controller import process as controller
 from supergrep.eva.disk_enclosure import process as disks_enclosure
 from supergrep.eva.disk_group import process as disk_group
 from supergrep.eva.disks import process as disks
 from supergrep.eva.hosts import process as hosts
 from supergrep.eva.storage_inventory import process as storage_inventory
+from supergrep.eva.utils import parse_eva_docs
 from supergrep.eva.virtual_disks import process as virtual_disks
+from supergrep.instrumentation import stage
 from supergrep.parsing import load_raw_content
-from supergrep.utils import get_bundle_dir, get_separated_content
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
 
 __all__ = ('main',)
 
@@ -24,22 +25,24 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\eva-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path, stream=False)
 
     raw_content_patterns = (
         '*EVA_config.xml',
     )
     raw_content = load_raw_content(tuple(input_files), raw_content_patterns)
+    content_index = ContentIndex(raw_content, raw_content_patterns)
 
-    eva_content = get_separated_content(
-        raw_content, (raw_content_patterns[0], ))
+    eva_docs = parse_eva_docs(content_index.separated(
+        (raw_content_patterns[0], )))
 
-    storage_inventory(workbook, eva_content)
-    controller(workbook, eva_content)
-    disk_group(workbook, eva_content)
-    virtual_disks(workbook, eva_content)
-    hosts(workbook, eva_content)
-    disks(workbook, eva_content)
-    disks_enclosure(workbook, eva_content)
+    storage_inventory(workbook, eva_docs)
+    controller(workbook, eva_docs)
+    disk_group(workbook, eva_docs)
+    virtual_disks(workbook, eva_docs)
+    hosts(workbook, eva_docs)
+    disks(workbook, eva_docs)
+    disks_enclosure(workbook, eva_docs)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
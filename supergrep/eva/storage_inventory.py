@@ -1,19 +1,17 @@
 """Storage Inventory sheet"""
-from collections import namedtuple
 from typing import Any
 
-import xmltodict
-
 from supergrep.formatting import build_header
-from supergrep.utils import (
-    ordered_jsons, sheet_process_output, search_tag_value, write_excel)
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import ordered_jsons, sheet_process_output, write_rows
 
 
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process Storage Inventory worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'Storage Inventory'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
@@ -23,8 +21,6 @@ def process(workbook: Any, contents: list) -> None:
         'TotalStorageSpace', 'AvailableStorageSpace', 'UsedStorageSpace'
     ]
 
-    SystemTuple = namedtuple('SystemTuple', system_excel_header)
-
     build_header(worksheet, system_excel_header)
 
     system_header = [
@@ -33,12 +29,11 @@ def process(workbook: Any, contents: list) -> None:
     ]
 
     system_data = []  # type: list
-    for content in contents:
-        doc = xmltodict.parse(content)
+    for objects in docs:
         system_data += list(
-            ordered_jsons(search_tag_value(doc, 'object'), system_header))
+            ordered_jsons(objects, system_header))
 
-    final_col, final_row = write_excel(system_data, worksheet, SystemTuple, 'A')
+    final_col, final_row = write_rows(worksheet, system_data)
     sheet_process_output(
         worksheet,
         'SystemTable',
@@ -1,4 +1,29 @@
-"""Isilon utilities"""
+"""EVA utilities"""
+from supergrep.scheduler import parse_documents
+from supergrep.xml_elements import extract_elements
+
+# Elements of an EVA_config.xml the sheets read
+EVA_ELEMENTS = ('object', )
+
+
+def parse_eva_doc(content: str) -> list:
+    """Parses an EVA XML document, in a worker process
+
+    :param content:
+    :return: the 'object' entries of the document
+    """
+    return extract_elements(content, EVA_ELEMENTS)['object']
+
+
+def parse_eva_docs(contents: list) -> list:
+    """Parses every EVA XML document once for all the sheets
+
+    The documents are parsed across the process pool of the parse stage.
+
+    :param contents:
+    :return: the 'object' entries of each document
+    """
+    return parse_documents(parse_eva_doc, contents)
 
 
 def merge_dicts(dicts: list) -> dict:
@@ -1,20 +1,18 @@
 """Virtual Disks sheet"""
-from collections import namedtuple
 from typing import Any
 
-import xmltodict
-
 from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.utils import (
-    flatten_dict, ordered_jsons, sheet_process_output, search_tag_value,
-    write_excel)
+    flatten_dict, ordered_jsons, sheet_process_output, write_rows)
 
 
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process Virtual Disks worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'Virtual Disks'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
@@ -24,9 +22,6 @@ def process(workbook: Any, contents: list) -> None:
         'FamilyName', 'AllocatedCapacity', 'HostName', 'HostOSMode'
     ]
 
-    FamilyTuple = namedtuple('FamilyTuple', family_excel_header)
-    HostTuple = namedtuple('HostTuple', host_excel_header)
-
     build_header(worksheet, family_excel_header)
     build_header(worksheet, host_excel_header, 'E')
 
@@ -39,17 +34,14 @@ def process(workbook: Any, contents: list) -> None:
     ]
 
     family_data, host_data = [], []  # type: list, list
-    for content in contents:
-        doc = xmltodict.parse(content)
-
+    for objects in docs:
         family_data += list(
-            ordered_jsons(search_tag_value(doc, 'object'), family_header))
+            ordered_jsons(objects, family_header))
 
-        raw_host_data = [flatten_dict(det_dict)
-                         for det_dict in search_tag_value(doc, 'object')]
+        raw_host_data = [flatten_dict(det_dict) for det_dict in objects]
         host_data += ordered_jsons(raw_host_data, host_header)
 
-    final_col, final_row = write_excel(family_data, worksheet, FamilyTuple, 'A')
+    final_col, final_row = write_rows(worksheet, family_data)
     sheet_process_output(
         worksheet,
         'FamilyTable',
@@ -57,7 +49,7 @@ def process(workbook: Any, contents: list) -> None:
         final_col,
         final_row)
 
-    final_col, final_row = write_excel(host_data, worksheet, HostTuple, 'E')
+    final_col, final_row = write_rows(worksheet, host_data, start_col='E')
     sheet_process_output(
         worksheet,
         'HostTable',
@@ -1,8 +1,8 @@
 """Spreadsheet formatting"""
-from contextlib import suppress
-from typing import List
+import re
+from typing import Any, Callable, Dict, List
+from weakref import WeakKeyDictionary
 
-from cytoolz import concat
 from openpyxl.cell import Cell
 from openpyxl.styles import Border, Color, Font, PatternFill, Side
 from openpyxl.styles.colors import BLACK
@@ -18,6 +18,14 @@ THIN_BLACK_BORDER = Border(
 # header styles
 SOLID_BLUE_FILL = PatternFill(patternType='solid', fgColor=Color('FF00B0F0'))
 HEADER_FONT = Font(name='Arial', bold=True, italic=False, size=10)
+# cell values written as numbers, leading zeros (eg. 007) are kept as text
+INTEGER_RE = re.compile(r'[-+]?(0|[1-9]\d*)$')
+NUMBER_RE = re.compile(
+    r'[-+]?((0|[1-9]\d*)(\.\d*)?|\.\d+)([eE][-+]?\d+)?$')
+# longest line written in each column of a worksheet, see widen_columns
+_COLUMN_LENGTHS = WeakKeyDictionary()  # type: WeakKeyDictionary
+# value styles
+BOLD_FONT = Font(bold=True, size=11)
 
 
 def build_header(
@@ -30,10 +38,13 @@ def build_header(
     :param headers:
     :param start_col:
     """
+    lengths = dict()  # type: Dict[str, int]
     for col_n, header in enumerate(headers, ord(start_col)):
         cell = worksheet['{}1'.format(column_format(col_n))]
         cell.value = header
         style_header_cell(cell)
+        lengths[cell.column] = len(str(header))
+    widen_columns(worksheet, lengths)
 
 
 def add_worksheet_table(
@@ -60,42 +71,77 @@ def add_worksheet_table(
     worksheet.add_table(tab)
 
 
-def set_cell_to_number(cell: Cell, cell_format: str = '0') -> Cell:
-    """Sets the data type on a cell
+def typed_column(values: List[str]) -> list:
+    """Converts the values of a column to numbers when they are numbers
 
-    Sets the data type on a cell to number if the value of the cell is a number.
-    Will not work on a list of numbers (cannot be processed as a single number).
+    The column is scanned once to pick a single conversion for it: int when
+    every value is an integer, float when every value is a number, and a
+    check per value only for the columns that mix numbers and text.
+    Blank values, and numbers written with leading zeros (ids such as
+    007, which int would turn into 7), are left as they are.
 
-    :param cell:
-    :param cell_format:
+    :param values:
+    :return:
+    """
+    filled = [value for value in values if value]
+    if not filled:
+        return values
+    if all(map(INTEGER_RE.match, filled)):
+        convert = int  # type: Callable
+    elif all(map(NUMBER_RE.match, filled)):
+        convert = float
+    elif any(map(NUMBER_RE.match, filled)):
+        convert = to_number
+    else:
+        return values
+    return [convert(value) if value else value for value in values]
+
+
+def to_number(value: str) -> Any:
+    """Converts a value to int or float when it is a number
+
+    :param value:
     :return:
     """
-    if cell.value and not cell.column == 'A':
-        if cell.value.isdigit():
-            cell.data_type = 'n'
-            cell.number_format = cell_format
-        with suppress(ValueError):
-            if float(cell.value):
-                cell.data_type = 'n'
-                cell.number_format = cell_format
-    return cell
+    if INTEGER_RE.match(value):
+        return int(value)
+    if NUMBER_RE.match(value):
+        return float(value)
+    return value
+
+
+def widen_columns(worksheet: Worksheet, lengths: Dict[str, int]) -> None:
+    """Records the longest line written in the columns of a worksheet
+
+    :param worksheet:
+    :param lengths: length of the longest line by column
+    """
+    widths = _COLUMN_LENGTHS.setdefault(worksheet, dict())
+    for column, length in lengths.items():
+        widths[column] = max(widths.get(column, 0), length)
 
 
 def compute_column_dimensions(worksheet: Worksheet) -> None:
     """Provide good defaults for column dimensions
 
+    The lengths are the ones recorded by widen_columns as the header and the
+    rows were written, so the cells are not walked again.
+
     :param worksheet:
     """
-    for column_cells in worksheet.columns:
-        cell_values = concat(
-            [str(cell.value).split('\n') for cell in column_cells])
-        length = max(len(cell_value or '') for cell_value in cell_values)
-        if length > 150:
-            worksheet.column_dimensions[
-                column_cells[0].column].width = length + 5
-        else:
-            worksheet.column_dimensions[
-                column_cells[0].column].width = (length + 2) * 1.2
+    for column, length in _COLUMN_LENGTHS.get(worksheet, dict()).items():
+        worksheet.column_dimensions[column].width = column_width(length)
+
+
+def column_width(length: int) -> float:
+    """Column width that fits a value of that length
+
+    :param length:
+    :return:
+    """
+    if length > 150:
+        return length + 5
+    return (length + 2) * 1.2
 
 
 def setup_auto_filter(worksheet: Worksheet, headers: List[str]) -> None:
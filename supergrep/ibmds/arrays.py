@@ -2,12 +2,13 @@
 import csv
 from typing import Any
 
-from supergrep.formatting import build_header, set_cell_to_number, \
-    style_value_cell
+from supergrep.formatting import build_header
 from supergrep.ibmds.utils import get_rows
-from supergrep.utils import sheet_process_output
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, write_rows
 
 
+@sheet_stage
 def process(workbook: Any, content: list) -> None:
     """Process Arrays worksheet
 
@@ -30,16 +31,7 @@ def process(workbook: Any, content: list) -> None:
         arrays_rows = get_rows(storage_csv, header[1:])
         rows += [system_name[0] + feat_row for feat_row in arrays_rows]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(rows, 2):
-        for col_n, col_value in \
-                enumerate(row_tuple, ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            set_cell_to_number(cell)
-            style_value_cell(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
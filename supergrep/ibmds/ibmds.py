@@ -1,8 +1,6 @@
 """IBM DS command entry point"""
 import os
 
-from openpyxl import load_workbook
-
 from supergrep.ibmds.arrays import process as arrays
 from supergrep.ibmds.drives import process as drives
 from supergrep.ibmds.features import process as features
@@ -11,8 +9,10 @@ from supergrep.ibmds.san_hosts import process as san_hosts
 from supergrep.ibmds.storage_controllers import process as storage_controllers
 from supergrep.ibmds.storage_enclosures import process as storage_enclosures
 from supergrep.ibmds.volumes import process as volumes
+from supergrep.instrumentation import stage
 from supergrep.parsing import load_raw_content
-from supergrep.utils import get_bundle_dir, get_separated_content
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
 
 __all__ = ('main',)
 
@@ -25,15 +25,16 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\ibmds-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path, stream=False)
 
     raw_content_patterns = (
         '*.csv',
     )
     raw_content = load_raw_content(tuple(input_files), raw_content_patterns)
+    content_index = ContentIndex(raw_content, raw_content_patterns)
 
-    ibmds_content = get_separated_content(
-        raw_content, (raw_content_patterns[0], ))
+    ibmds_content = content_index.separated(
+        (raw_content_patterns[0], ))
 
     storage_controllers(workbook, ibmds_content)
     features(workbook, ibmds_content)
@@ -44,4 +45,5 @@ def main(input_files: str, output_file: str) -> None:
     pools(workbook, ibmds_content)
     san_hosts(workbook, ibmds_content)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
@@ -1,5 +1,5 @@
 """IBM DS utilities"""
-from collections import Generator
+from typing import Generator
 from contextlib import suppress
 
 
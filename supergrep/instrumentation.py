@@ -0,0 +1,237 @@
+"""Per sheet and per stage timing, memory and row counts of a run"""
+import cProfile
+import json
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from logging import getLogger
+from typing import Any, Callable, Dict, Iterator, List
+
+from supergrep.config import settings
+
+__all__ = ('instrumented_stage', 'run_instrumented', 'sheet_scope',
+           'sheet_stage', 'stage')
+
+logger = getLogger(__name__)
+
+# Stages being timed, innermost last, and the records of the finished ones
+_ACTIVE = []  # type: List[dict]
+_RECORDS = []  # type: List[dict]
+# Profile of each sheet, while --profile is on
+_PROFILES = OrderedDict()  # type: Dict[str, cProfile.Profile]
+
+
+def _enabled() -> bool:
+    return settings.report or settings.profile
+
+
+def _current_sheet() -> str:
+    for active in reversed(_ACTIVE):
+        if active['sheet']:
+            return active['sheet']
+    return ''
+
+
+@contextmanager
+def stage(name: str, sheet: str = '') -> Iterator[dict]:
+    """Records the wall time, CPU time and memory of a stage
+
+    Stages nest, a stage inside a sheet stage is recorded for that sheet.
+    A stage nested in a stage of the same name is not recorded again. The
+    caller can set the 'rows' of the yielded record. The memory is only
+    recorded while tracemalloc traces (settings.report_memory).
+
+    :param name:
+    :param sheet:
+    :return: the record of the stage
+    """
+    if not _enabled() or any(active['stage'] == name for active in _ACTIVE):
+        yield {}
+        return
+    tracing = tracemalloc.is_tracing()
+    reset_peak = getattr(tracemalloc, 'reset_peak', None) if tracing else None
+    memory = None
+    if tracing:
+        if _ACTIVE and reset_peak is not None:
+            parent = _ACTIVE[-1]
+            parent['peak'] = max(parent['peak'] or 0,
+                                 tracemalloc.get_traced_memory()[1])
+        if reset_peak is not None:
+            reset_peak()
+        memory = tracemalloc.get_traced_memory()[0]
+    record = {
+        'stage': name,
+        'sheet': sheet or _current_sheet(),
+        'rows': None,
+        'memory_delta': None,
+        'memory_peak_delta': None,
+        'peak': memory
+    }
+    _ACTIVE.append(record)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield record
+    finally:
+        record['wall_seconds'] = time.perf_counter() - wall
+        record['cpu_seconds'] = time.process_time() - cpu
+        _ACTIVE.pop()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            record['memory_delta'] = current - memory
+            if reset_peak is not None:
+                record['peak'] = max(record['peak'], peak)
+                record['memory_peak_delta'] = record['peak'] - memory
+                if _ACTIVE:
+                    _ACTIVE[-1]['peak'] = max(_ACTIVE[-1]['peak'] or 0,
+                                              record['peak'])
+        del record['peak']
+        _RECORDS.append(record)
+
+
+def instrumented_stage(name: str, rows: Callable = None) -> Callable:
+    """Decorates a function whose calls are recorded as a stage
+
+    :param name:
+    :param rows: counts the rows in the result of the function
+    :return:
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled():
+                return func(*args, **kwargs)
+            with stage(name) as record:
+                result = func(*args, **kwargs)
+                if record and rows is not None:
+                    record['rows'] = rows(result)
+            return result
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def sheet_scope(sheet: str) -> Iterator[None]:
+    """Records the stages run inside it for a sheet
+
+    The sheet is also profiled on its own with --profile.
+
+    :param sheet:
+    """
+    if not _enabled():
+        yield
+        return
+    with stage('sheet', sheet):
+        if not settings.profile:
+            yield
+            return
+        profile = _PROFILES.setdefault(sheet, cProfile.Profile())
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+
+
+def sheet_stage(func: Callable) -> Callable:
+    """Decorates the process function of a sheet module
+
+    The parse and write stages inside it are recorded for the sheet (the
+    module name without the supergrep prefix), see sheet_scope.
+
+    :param func:
+    :return:
+    """
+    sheet = func.__module__.replace('supergrep.', '', 1)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with sheet_scope(sheet):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def summarise(records: List[dict]) -> List[dict]:
+    """Totals of the records of each sheet and stage, in run order
+
+    :param records:
+    :return:
+    """
+    totals = OrderedDict()  # type: Dict[tuple, dict]
+    for record in records:
+        key = record['sheet'], record['stage']
+        total = totals.setdefault(key, {
+            'sheet': record['sheet'], 'stage': record['stage'], 'calls': 0,
+            'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'rows': None,
+            'memory_delta': None, 'memory_peak_delta': None})
+        total['calls'] += 1
+        total['wall_seconds'] += record['wall_seconds']
+        total['cpu_seconds'] += record['cpu_seconds']
+        if record['memory_delta'] is not None:
+            total['memory_delta'] = (
+                (total['memory_delta'] or 0) + record['memory_delta'])
+        if record['rows'] is not None:
+            total['rows'] = (total['rows'] or 0) + record['rows']
+        if record.get('memory_peak_delta') is not None:
+            total['memory_peak_delta'] = max(
+                total['memory_peak_delta'] or 0, record['memory_peak_delta'])
+    return list(totals.values())
+
+
+def _write_report(output_file: str) -> None:
+    """Writes the report and the profiles of the run next to its output
+
+    A file that cannot be written is logged, the run itself is not failed
+    for it.
+
+    :param output_file:
+    """
+    base = os.path.splitext(output_file)[0]
+    try:
+        if settings.report:
+            with open('{}.report.json'.format(base), 'w') as report:
+                json.dump({'output_file': output_file,
+                           'stages': summarise(_RECORDS)}, report, indent=2)
+        for sheet, profile in _PROFILES.items():
+            pstats.Stats(profile).dump_stats('{}.{}.pstats'.format(
+                base, re.sub(r'[^\w.-]', '_', sheet)))
+    except OSError as error:
+        logger.error('Cannot write the report of {}: {}'.format(
+            output_file, error))
+
+
+def run_instrumented(func: Callable, templates: Any, input_files: Any,
+                     output_file: str) -> Any:
+    """Runs an entry point, writing its report and profiles when asked
+
+    With settings.report the stages are written to <output>.report.json,
+    with settings.profile the pstats of each sheet to
+    <output>.<sheet>.pstats, both next to the output workbook. Memory is
+    only traced with settings.report_memory, tracemalloc slows the run.
+    The stages outside any sheet are recorded for the entry point (its
+    module name without the supergrep prefix).
+
+    :param func: entry point
+    :param templates:
+    :param input_files:
+    :param output_file:
+    :return: the result of the entry point
+    """
+    if not _enabled():
+        return func(templates, input_files, output_file)
+    del _RECORDS[:]
+    _PROFILES.clear()
+    tracing = tracemalloc.is_tracing()
+    if settings.report and settings.report_memory and not tracing:
+        tracemalloc.start()
+    try:
+        with stage('total', func.__module__.replace('supergrep.', '', 1)):
+            return func(templates, input_files, output_file)
+    finally:
+        if tracemalloc.is_tracing() and not tracing:
+            tracemalloc.stop()
+        _write_report(output_file)
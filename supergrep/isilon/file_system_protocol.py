@@ -1,16 +1,16 @@
 """File System by Protocol Summary sheet"""
-from collections import namedtuple
 from operator import itemgetter
 from typing import Any
 
 from cytoolz.curried import groupby
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.isilon.utils import get_multiprotocol
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 
+@sheet_stage
 def process(workbook: Any, nfs_rows: list, smb_rows: list) -> None:
     """Process File System by Protocol Sheet
 
@@ -23,23 +23,13 @@ def process(workbook: Any, nfs_rows: list, smb_rows: list) -> None:
 
     headers = ['Hostname', 'FileSystem', 'Path', 'Type']
 
-    RowTuple = namedtuple('RowTuple', headers)
     build_header(worksheet, headers)
 
     key_columns = (0, 1)
     rows = groupby(itemgetter(*key_columns), nfs_rows + smb_rows)
     rows = [get_multiprotocol(rows[i]) for i in rows]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
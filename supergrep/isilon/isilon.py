@@ -1,8 +1,7 @@
 """Isilon command entry point"""
 import os
 
-from openpyxl import load_workbook
-
+from supergrep.instrumentation import stage
 from supergrep.isilon.count_logical import process as count_logical
 from supergrep.isilon.count_modified import process as count_modified
 from supergrep.isilon.drive_list import process as drive_list
@@ -30,9 +29,9 @@ from supergrep.isilon.top_level_directories import \
     process as top_level_directories
 from supergrep.isilon.zone_list import process as zone_list
 from supergrep.parsing import raw_tar_content
-from supergrep.isilon.utils import isilon_raw_content
-from supergrep.utils import (
-    get_bundle_dir, get_separated_content, relevant_content_file_join)
+from supergrep.isilon.utils import isilon_raw_content, parse_isilon_docs
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
 
 __all__ = ('main',)
 
@@ -45,7 +44,7 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\isilon-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path, stream=False)
 
     raw_content_patterns = (
         '*.xml.gz',
@@ -60,48 +59,50 @@ def main(input_files: str, output_file: str) -> None:
 
     raw_content = list(isilon_raw_content(tuple(input_files)))
 
-    perf_raw_content = []  # type: list
-    for input_file in raw_content:
-        perf_raw_content += raw_tar_content(
-            (input_file[0], ), raw_content_patterns[1:])
+    perf_raw_content = list(raw_tar_content(
+        tuple(input_files), raw_content_patterns[1:]))
+
+    isilon_index = ContentIndex(
+        raw_content, (raw_content_patterns[0], raw_content_patterns[7]))
+    perf_index = ContentIndex(perf_raw_content, raw_content_patterns[1:7])
 
-    isilon_content = get_separated_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[7]))
+    isilon_docs = parse_isilon_docs(isilon_index.separated(
+        (raw_content_patterns[0],
+         raw_content_patterns[7])))
 
-    top_level_content = relevant_content_file_join(
-        perf_raw_content, (raw_content_patterns[1], ))
+    top_level_content = perf_index.file_joined(
+        (raw_content_patterns[1], ))
 
-    count_logical_content = relevant_content_file_join(
-        perf_raw_content, (raw_content_patterns[2], ))
+    count_logical_content = perf_index.file_joined(
+        (raw_content_patterns[2], ))
 
-    throughput_content = relevant_content_file_join(
-        perf_raw_content, (raw_content_patterns[3], ))
+    throughput_content = perf_index.file_joined(
+        (raw_content_patterns[3], ))
 
-    count_modified_content = relevant_content_file_join(
-        perf_raw_content, (raw_content_patterns[4], ))
+    count_modified_content = perf_index.file_joined(
+        (raw_content_patterns[4], ))
 
-    latency_content = relevant_content_file_join(
-        perf_raw_content, (raw_content_patterns[5], ))
+    latency_content = perf_index.file_joined(
+        (raw_content_patterns[5], ))
 
-    ops_content = relevant_content_file_join(
-        perf_raw_content, (raw_content_patterns[6], ))
+    ops_content = perf_index.file_joined(
+        (raw_content_patterns[6], ))
 
-    storage_inventory(workbook, isilon_content)
-    storage_pool_summary(workbook, isilon_content)
-    license_summary(workbook, isilon_content)
-    nfs_rows = nfs_exports_list(workbook, isilon_content)
-    smb_rows = smb_shares_list(workbook, isilon_content)
-    quotas(workbook, isilon_content)
+    storage_inventory(workbook, isilon_docs)
+    storage_pool_summary(workbook, isilon_docs)
+    license_summary(workbook, isilon_docs)
+    nfs_rows = nfs_exports_list(workbook, isilon_docs)
+    smb_rows = smb_shares_list(workbook, isilon_docs)
+    quotas(workbook, isilon_docs)
     file_system_protocol(workbook, nfs_rows, smb_rows)
-    nfs_exports_zone(workbook, isilon_content)
-    smb_shares_zone(workbook, isilon_content)
-    zone_list(workbook, isilon_content)
-    protocol_stats(workbook, isilon_content)
-    pstat(workbook, isilon_content)
-    drive_list(workbook, isilon_content)
-    hw_status(workbook, isilon_content)
-    sync_policies(workbook, isilon_content)
+    nfs_exports_zone(workbook, isilon_docs)
+    smb_shares_zone(workbook, isilon_docs)
+    zone_list(workbook, isilon_docs)
+    protocol_stats(workbook, isilon_docs)
+    pstat(workbook, isilon_docs)
+    drive_list(workbook, isilon_docs)
+    hw_status(workbook, isilon_docs)
+    sync_policies(workbook, isilon_docs)
     perf_data = top_level_directories(workbook, top_level_content), \
         throughput(workbook, throughput_content), \
         ops(workbook, ops_content), \
@@ -111,4 +112,5 @@ def main(input_files: str, output_file: str) -> None:
     performance_dashboard(workbook, perf_data)
     count_modified(workbook, count_modified_content)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
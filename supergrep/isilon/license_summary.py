@@ -1,15 +1,11 @@
 """License Summary Summary sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-import xmltodict
-
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
-from supergrep.isilon.utils import collected_data
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output, search_tag_value
+from supergrep.utils import sheet_process_output, write_rows
 
 LICENSE_TMPL = textwrap.dedent("""\
     Value Name (.+)
@@ -24,46 +20,31 @@ LICENSE_TMPL = textwrap.dedent("""\
 """)
 
 
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process License Summary worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'License Summary'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = ['Hostname'] + get_parser_header(LICENSE_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)
     build_header(worksheet, headers)
 
     rows = []  # type: list
-    for content in contents:
-        doc = xmltodict.parse(content)
-        component_details = search_tag_value(doc, 'component_details')
-        command_details = search_tag_value(doc, 'command_details')
-
+    for component_details, commands in docs:
         licenses = []  # type: list
         host = component_details['hostname']
-        for entry in command_details:
-            license_content = collected_data(
-                entry, 'cmd', 'isi license*[licenses]*list')
-            licenses = run_parser_over(
-                license_content, LICENSE_TMPL)\
-                if license_content else licenses
+        license_content = commands.data('isi license*[licenses]*list')
+        licenses = run_parser_over(
+            license_content, LICENSE_TMPL)\
+            if license_content else licenses
         rows += [[host] + row for row in licenses]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -1,44 +1,36 @@
 """NFS Exports List Summary sheet"""
 import csv
-from collections import namedtuple
 from typing import Any
 
-import xmltodict
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.isilon.utils import squash
+from supergrep.utils import sheet_process_output, write_rows
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
-from supergrep.isilon.utils import collected_data, squash
-from supergrep.utils import sheet_process_output, search_tag_value
 
-
-def process(workbook: Any, contents: list) -> list:
+@sheet_stage
+def process(workbook: Any, docs: list) -> list:
     """Process NFS Exports List worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'NFS Exports List'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = ['Hostname', 'ID', 'Zone', 'Paths', 'Description']
 
-    RowTuple = namedtuple('RowTuple', headers)
     build_header(worksheet, headers)
 
     rows = []  # type: Any
     bad_rows = 0
-    for content in contents:
-        doc = xmltodict.parse(content)
-        component_details = search_tag_value(doc, 'component_details')
-        command_details = search_tag_value(doc, 'command_details')
-
+    for component_details, commands in docs:
         exports = []  # type: list
         host = component_details['hostname']
-        for entry in command_details:
-            exports_content = collected_data(
-                entry, 'cmd', 'isi nfs exports list --format?csv -a -z')
-            exports = list(csv.reader(exports_content.split('\n'))
-                           if exports_content else exports)
+        exports_content = commands.data(
+            'isi nfs exports list --format?csv -a -z')
+        exports = list(csv.reader(exports_content.split('\n'))
+                       if exports_content else exports)
         bad_rows += len(list(filter(
             lambda x: len(x) != 4 and len(x) > 1, exports)))
         rows += [
@@ -46,16 +38,7 @@ def process(workbook: Any, contents: list) -> list:
             for row in filter(lambda x: len(x) == 4, exports)
         ]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -2,21 +2,18 @@
 from contextlib import suppress
 from typing import Any, Iterable
 
-import xmltodict
-from openpyxl.styles import Alignment
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.isilon.utils import process_nfs_zones
+from supergrep.utils import sheet_process_output, write_rows
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
-from supergrep.isilon.utils import (
-    collected_alias_data, collected_data, process_nfs_zones)
-from supergrep.utils import sheet_process_output, search_tag_value
 
-
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process NFS Exports by Zone worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'NFS Exports by Zone'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
@@ -44,44 +41,26 @@ def process(workbook: Any, contents: list) -> None:
     build_header(worksheet, headers)
 
     rows = []  # type: list
-    for content in contents:
-        doc = xmltodict.parse(content)
-        component_details = search_tag_value(doc, 'component_details')
-        command_details = search_tag_value(doc, 'command_details')
-
+    for component_details, commands in docs:
         nfs_zone, nfs_alias_zone = [], []  # type: Iterable, Iterable
         host = component_details['hostname']
-        for entry in command_details:
-            with suppress(TypeError):
-                nfs_zone_alias_content = collected_alias_data(
-                    entry, 'cmd', 'isi nfs exports list by zone **format?json')
-                nfs_zone_content = collected_data(
-                    entry, 'cmd', 'isi nfs exports list by zone **format?json')
+        with suppress(TypeError):
+            nfs_zone_alias_content = commands.alias_data(
+                'isi nfs exports list by zone **format?json')
+            nfs_zone_content = commands.data(
+                'isi nfs exports list by zone **format?json')
 
-                nfs_alias_zone = process_nfs_zones(
-                    nfs_zone_alias_content, headers[1:]) \
-                    if nfs_zone_alias_content else nfs_alias_zone
-                nfs_zone = process_nfs_zones(
-                    ''.join(nfs_zone_content), headers[1:]) \
-                    if nfs_zone_content else nfs_zone
+            nfs_alias_zone = process_nfs_zones(
+                nfs_zone_alias_content, headers[1:]) \
+                if nfs_zone_alias_content else nfs_alias_zone
+            nfs_zone = process_nfs_zones(
+                ''.join(nfs_zone_content), headers[1:]) \
+                if nfs_zone_content else nfs_zone
 
         nfs_zone = list(nfs_zone) + list(nfs_alias_zone)
         rows += [[host] + row for row in nfs_zone]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(rows, 2):
-        for col_n, col_value in \
-                enumerate(row_tuple, ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
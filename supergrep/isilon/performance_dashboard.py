@@ -5,12 +5,13 @@ from typing import Any
 
 from cytoolz.curried import groupby
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.isilon.utils import perf_dashboard
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 
+@sheet_stage
 def process(workbook: Any, content: tuple) -> None:
     """Process Performance Dashboard worksheet
 
@@ -41,16 +42,7 @@ def process(workbook: Any, content: tuple) -> None:
 
     rows.append(['Total'] + list(map(str, perf_dashboard(content))))
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(rows, 2):
-        for col_n, col_value in \
-                enumerate(row_tuple, ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            set_cell_to_number(cell, '0.00')
-            style_value_cell(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows, number_format='0.00')
 
     sheet_process_output(
         worksheet,
@@ -1,15 +1,11 @@
 """Protocol Stats sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any, Iterable
 
-import xmltodict
-
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
-from supergrep.isilon.utils import collected_data
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import run_parser_over, get_parser_header
-from supergrep.utils import sheet_process_output, search_tag_value
+from supergrep.utils import sheet_process_output, write_rows
 
 PROTOCOL_TMPL = textwrap.dedent("""\
     Value Ops (\S+)
@@ -30,45 +26,30 @@ PROTOCOL_TMPL = textwrap.dedent("""\
 """)
 
 
-def process(workbook: Any, contents: list) -> None:
+@sheet_stage
+def process(workbook: Any, docs: list) -> None:
     """Process Protocol Stats worksheet
 
     :param workbook:
-    :param contents:
+    :param docs:
     """
     worksheet_name = 'Protocol Stats'
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = ['Hostname'] + get_parser_header(PROTOCOL_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)
     build_header(worksheet, headers)
 
     rows = []  # type: list
-    for content in contents:
-        doc = xmltodict.parse(content)
-        component_details = search_tag_value(doc, 'component_details')
-        command_details = search_tag_value(doc, 'command_details')
-
+    for component_details, commands in docs:
         protocols = []  # type: Iterable
         host = component_details['hostname']
-        for entry in command_details:
-            protocol_content = collected_data(
-                entry, 'cmd', 'isi statistics protocol')
-            protocols = run_parser_over(protocol_content, PROTOCOL_TMPL) \
-                if protocol_content else protocols
+        protocol_content = commands.data('isi statistics protocol')
+        protocols = run_parser_over(protocol_content, PROTOCOL_TMPL) \
+            if protocol_content else protocols
         rows += [[host] + row for row in protocols]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -4,43 +4,127 @@ import re
 from collections import defaultdict
 from contextlib import suppress
 from fnmatch import fnmatch
-from typing import Any, Generator, Iterable
+from operator import itemgetter
+from typing import Any, Dict, Generator, Iterable
 
-from cytoolz import first
+from cytoolz import concat, first
 
-from supergrep.parsing import decode_bytes, raw_gz_content
-from supergrep.utils import column_sum, ordered_jsons, flatten_dict, percentile
+from supergrep.parsing import raw_gz_content, read_file_text
+from supergrep.scheduler import parse_documents
+from supergrep.utils import (
+    column_sum, ordered_jsons, flatten_dict, percentile)
+from supergrep.xml_elements import extract_elements
 
+# Elements of a node dump the sheets read
+ISILON_ELEMENTS = ('component_details', 'command_details')
 
-def collected_data(content: dict, key: str, value: str) -> Any:
-    """Returns target collected_data if we are at the desired key value
 
-    :param content:
-    :param key:
-    :param value:
+def target_data(entry: dict) -> Any:
+    """Returns the collected_data of a command_details entry
+
+    :param entry:
     :return:
     """
-    with suppress(TypeError):
-        if fnmatch(content[key], value):
-            if isinstance(content['target'], list):
-                return [data['collected_data'] for data in content['target']
-                        if isinstance(data['collected_data'], str)]
-            return content['target']['collected_data']
+    with suppress(KeyError, TypeError):
+        if isinstance(entry['target'], list):
+            return [data['collected_data'] for data in entry['target']
+                    if isinstance(data['collected_data'], str)]
+        return entry['target']['collected_data']
     return None
 
 
-def collected_alias_data(content: dict, key: str, value: str) -> Any:
-    """Returns target collected_data if we are at the desired key/@alias value
+class CommandIndex:
+    """Collected data of a node dump, indexed by command string and alias
+
+    Like the former linear scans over command_details, a lookup returns the
+    data of the last matching entry which has any. Commands given as
+    patterns fall back to fnmatch over the distinct commands once, the
+    result being memoised.
+    """
+
+    def __init__(self, command_details: Any) -> None:
+        if isinstance(command_details, dict):
+            command_details = [command_details]
+        self._commands = {
+            'cmd': defaultdict(list), 'alias': defaultdict(list)
+        }  # type: Dict[str, Dict[str, list]]
+        self._matches = dict()  # type: Dict[tuple, Any]
+        for position, entry in enumerate(command_details or []):
+            with suppress(KeyError, TypeError):
+                cmd = entry['cmd']
+                if isinstance(cmd, str):
+                    self._commands['cmd'][cmd].append(
+                        (position, target_data(entry)))
+                elif not isinstance(entry['target'], list):
+                    self._commands['alias'][cmd['@alias']].append(
+                        (position, entry['target']['collected_data']))
+
+    @staticmethod
+    def _last(entries: Iterable) -> Any:
+        """Returns the last collected data that is not empty
+
+        :param entries:
+        :return:
+        """
+        found = None
+        for _, data in sorted(entries, key=itemgetter(0)):
+            found = data if data else found
+        return found
+
+    def _lookup(self, kind: str, command: str) -> Any:
+        """Finds the collected data for a command or a command pattern
+
+        :param kind: 'cmd' or 'alias'
+        :param command:
+        :return:
+        """
+        commands = self._commands[kind]
+        if not any(char in command for char in '*?['):
+            return self._last(commands.get(command, []))
+        key = (kind, command)
+        if key not in self._matches:
+            self._matches[key] = self._last(concat(
+                entries for cmd, entries in commands.items()
+                if fnmatch(cmd, command)))
+        return self._matches[key]
+
+    def data(self, command: str) -> Any:
+        """Collected data of the command
+
+        :param command:
+        :return:
+        """
+        return self._lookup('cmd', command)
+
+    def alias_data(self, alias: str) -> Any:
+        """Collected data of the command with the alias
+
+        :param alias:
+        :return:
+        """
+        return self._lookup('alias', alias)
+
+
+def parse_isilon_doc(content: str) -> tuple:
+    """Parses an Isilon XML document, in a worker process
 
     :param content:
-    :param key:
-    :param value:
-    :return:
+    :return: (component_details, CommandIndex)
     """
-    with suppress(TypeError):
-        if fnmatch(content[key]['@alias'], value):
-            return content['target']['collected_data']
-    return None
+    elements = extract_elements(content, ISILON_ELEMENTS)
+    return (elements['component_details'],
+            CommandIndex(elements['command_details']))
+
+
+def parse_isilon_docs(contents: list) -> list:
+    """Parses every Isilon XML document once for all the sheets
+
+    The node dumps are parsed across the process pool of the parse stage.
+
+    :param contents:
+    :return: (component_details, CommandIndex) for each document
+    """
+    return parse_documents(parse_isilon_doc, contents)
 
 
 def quotas_json(content: list) -> Generator:
@@ -260,9 +344,7 @@ def isilon_raw_content(input_files: tuple) -> Iterable:
     raw_content = list()  # type: list
     for input_file in input_files:
         if input_file.endswith('.xml'):
-            with open(input_file, 'rb') as input_xml:
-                raw_content.append(
-                    (input_file, decode_bytes(input_xml.readlines())))
+            raw_content.append((input_file, read_file_text(input_file)))
         else:
             raw_content += raw_gz_content((input_file, ))
     return raw_content
@@ -1,10 +1,14 @@
 """Main module of application"""
-
+import os
 from logging import getLogger
 from typing import Any
 
+from supergrep.batch import collect_jobs, run_batch
 from supergrep.config import settings
+from supergrep.instrumentation import run_instrumented
 from supergrep.parseargs import parse_args
+from supergrep.parsing import clear_parsed, close_nested_zips
+from supergrep.sinks import SINKS
 
 logger = getLogger(__name__)
 
@@ -35,8 +39,19 @@ def main(argv: Any) -> Any:
     :return:
     """
     show_banner()
-    func, template, input_files, output_file = parse_args(argv[1:])
-    if not output_file.endswith('.xlsx'):
-        logger.error('output filename should end with .xlsx')
+    func, template, input_files, output_file, batch = parse_args(argv[1:])
+    if batch:
+        return run_batch(
+            func, template, collect_jobs(batch, output_file), output_file)
+    output_format = os.path.splitext(output_file)[1][1:].lower()
+    if output_format != 'xlsx' and output_format not in SINKS:
+        logger.error('output filename should end with {}'.format(
+            ', '.join('.{}'.format(extension)
+                      for extension in ['xlsx'] + list(SINKS))))
         return 1
-    func(template, input_files, output_file)
+    settings.output_format = output_format
+    try:
+        return run_instrumented(func, template, input_files, output_file)
+    finally:
+        clear_parsed()
+        close_nested_zips()
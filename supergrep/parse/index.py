@@ -0,0 +1,93 @@
+"""textfsm (clitable) index of templates, dispatching by command"""
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+__all__ = ('TemplateIndex', 'expand_completion')
+
+
+def expand_completion(command: str) -> str:
+    """Expands the abc[[xyz]] completions of an index command
+
+    Each completion becomes abc(x(y(z)?)?)?, as in textfsm's clitable.
+
+    :param command:
+    :return:
+    """
+    def completion(match: Any) -> str:
+        word = match.group()[2:-2]
+        return '(' + '('.join(word) + ')?' * len(word)
+
+    return re.sub(r'(\[\[.+?\]\])', completion, command)
+
+
+class TemplateIndex:
+    """Template index file in the clitable format (see examples/index)
+
+    Rows map Hostname, Vendor and Command regular expressions to the
+    templates (colon separated, relative to the index file) for that
+    command. As in clitable the first matching row wins and attributes
+    that are not given are not checked.
+
+    The Command patterns of the rows left for a hostname and vendor are
+    compiled into a single regular expression, one named group per row,
+    so a command is dispatched by a single match instead of trying the
+    rows one by one.
+    """
+
+    def __init__(self, index_file: str) -> None:
+        base_dir = os.path.dirname(os.path.abspath(index_file))
+        with open(index_file, 'r') as index:
+            lines = [line.strip() for line in index
+                     if line.strip() and not line.lstrip().startswith('#')]
+        header = [field.strip() for field in lines[0].split(',')]
+        if 'Template' not in header or 'Command' not in header:
+            raise ValueError(
+                'The {} index has no Template or Command column'.format(
+                    index_file))
+        self._rows = list()  # type: List[Dict[str, Any]]
+        for line in lines[1:]:
+            fields = dict(zip(header, (field.strip()
+                                       for field in line.split(','))))
+            row = {key: re.compile(value)
+                   for key, value in fields.items()
+                   if key not in ('Template', 'Command') and value}
+            row['Command'] = expand_completion(fields['Command'])
+            row['Template'] = tuple(
+                os.path.join(base_dir, template)
+                for template in fields['Template'].split(':'))
+            self._rows.append(row)
+        self._dispatch = dict()  # type: Dict[tuple, tuple]
+
+    def _dispatcher(self, attributes: tuple) -> tuple:
+        """Combined command regex and rows for the other attributes
+
+        :param attributes: (name, value) pairs
+        :return:
+        """
+        if attributes not in self._dispatch:
+            rows = [row for row in self._rows
+                    if all(name not in row or row[name].match(value)
+                           for name, value in attributes)]
+            command_re = re.compile('|'.join(
+                '(?P<row{}>(?:{}))'.format(n, row['Command'])
+                for n, row in enumerate(rows))) if rows else None
+            self._dispatch[attributes] = command_re, rows
+        return self._dispatch[attributes]
+
+    def templates(self, command: str, hostname: Optional[str] = None,
+                  vendor: Optional[str] = None) -> tuple:
+        """Template files of the first row matching a command
+
+        :param command:
+        :param hostname:
+        :param vendor:
+        :return: empty when no row matches
+        """
+        attributes = tuple((name, value) for name, value in (
+            ('Hostname', hostname), ('Vendor', vendor)) if value is not None)
+        command_re, rows = self._dispatcher(attributes)
+        match = command_re and command_re.match(command)
+        if not match:
+            return ()
+        return rows[int(match.lastgroup[len('row'):])]['Template']
@@ -1,46 +1,168 @@
-"""Celerra command entry point"""
-import json
-import xmltodict
+"""Template driven command entry point"""
+import os
+import re
+from collections import defaultdict
+from contextlib import suppress
+from logging import getLogger
+from typing import Any, Dict, Generator, List
 
-from typing import Any
+from supergrep.cache import MemberText
+from supergrep.config import settings
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_scope, stage
+from supergrep.parse.index import TemplateIndex
+from supergrep.parsing import (
+    get_parser_header, get_template_sheets, read_file_text, run_parser_over,
+    stream_zips)
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import matches_any, sheet_process_output, write_rows
 
-from openpyxl import Workbook
+__all__ = ('main',)
 
-from supergrep.parsing import load_raw_content, run_parser_over
-from supergrep.utils import get_relevant_content
+logger = getLogger(__name__)
 
-__all__ = ('main',)
 
+def load_plain_file(input_file: str) -> MemberText:
+    """Loads an input file that is not an archive
+
+    :param input_file:
+    :return: None when the file is not utf-8 text
+    """
+    stat = os.stat(input_file)
+    with suppress(UnicodeDecodeError):
+        return MemberText(read_file_text(input_file),
+                          (input_file, stat.st_size, stat.st_mtime))
 
-def main(templates: Any, input_files: str, output_file: str) -> None:
-    """Celerra Entry point
 
-    :param templates:
+def stream_inputs(input_files: List[str], patterns: tuple) -> Generator:
+    """Yields the (file name, content) pairs matching any of the patterns
+
+    The members of .zip inputs are matched by name, other inputs by path.
+
     :param input_files:
-    :param output_file:
+    :param patterns:
+    :return:
+    """
+    zip_files = tuple(input_file for input_file in input_files
+                      if input_file.endswith('.zip'))
+    for file_content in stream_zips(zip_files, patterns):
+        yield file_content
+    for input_file in input_files:
+        if input_file not in zip_files and matches_any(input_file, patterns):
+            yield input_file, load_plain_file(input_file)
+
+
+def table_name(sheet: str) -> str:
+    """Name of the table of a sheet, only letters, digits and underscores
+
+    :param sheet:
+    :return:
+    """
+    return '{}Table'.format(re.sub(r'\W', '', sheet.title().replace(' ', '')))
+
+
+def file_command(file_name: str) -> tuple:
+    """Command and hostname of a command output, from its file name
+
+    The file name, without extension and with spaces for underscores, is
+    the command (show_ip_bgp_summary.txt -> show ip bgp summary), the
+    directory it is in is the hostname (None at the top level).
+
+    :param file_name:
+    :return:
     """
-    workbook = Workbook()
+    parts = file_name.replace('\\', '/').split('/')
+    command = os.path.splitext(parts[-1])[0].replace('_', ' ')
+    return command, parts[-2] if len(parts) > 1 else None
+
 
-    raw_content_patterns = (
-        '*cmd_outputs/hostname',
-    )
-    # import ipdb; ipdb.set_trace()
-    with open(templates, 'r') as temp:
-        temp_data = xmltodict.parse(''.join(temp.readlines()))['sgr']
-    import ipdb; ipdb.set_trace()
-    with open(input_files[0], 'r') as inp:
-        data = ''.join(inp.readlines())
+def index_sheets(index: TemplateIndex, file_name: str,
+                 template_sheets: Dict[str, dict]) -> List[str]:
+    """Sheets of the index templates for a file, added when first used
+
+    Each index template fills the sheet named after its file.
+
+    :param index:
+    :param file_name:
+    :param template_sheets:
+    :return:
+    """
+    command, hostname = file_command(file_name)
+    sheets = list()  # type: List[str]
+    for template_file in index.templates(command, hostname, settings.vendor):
+        sheet = os.path.basename(template_file)
+        if sheet.endswith('_template'):
+            sheet = sheet[:-len('_template')]
+        sheet = sheet[:31]
+        if sheet not in template_sheets:
+            with open(template_file, 'r') as template:
+                template_sheets[sheet] = {
+                    'file': template_file,
+                    'template': template.read(),
+                    'fname': ()
+                }
+        elif template_sheets[sheet]['file'] != template_file:
+            raise ValueError(
+                'Templates {} and {} both write the {} sheet'.format(
+                    template_sheets[sheet]['file'], template_file, sheet))
+        sheets.append(sheet)
+    return sheets
 
 
-    extracted_data = run_parser_over(data, temp_data['template'])
-    fname = temp_data['fname']
-    sheet = temp_data['sheet']
+def main(templates: Any, input_files: List[str], output_file: str) -> int:
+    """Template driven entry point
+
+    Every file is loaded once, all the templates whose <fname> patterns
+    match it run over it, and each template fills its own <sheet>. With a
+    template index (settings.template_index) the index templates for the
+    command of each file also run, each filling a sheet of its own.
+
+    :param templates: <sgr> xml template files
+    :param input_files:
+    :param output_file:
+    :return: 1 when no template ran, the workbook is then not written
+    """
+    template_sheets = get_template_sheets(list(templates or ()))
+    patterns = tuple(pattern for temp_sheet in template_sheets.values()
+                     for pattern in temp_sheet['fname'])
+    index = None
+    if settings.template_index:
+        index = TemplateIndex(settings.template_index)
+        patterns = ('*', )
+
+    sheet_rows = defaultdict(list)  # type: Dict[str, list]
+    for file_name, content in stream_inputs(input_files, patterns):
+        if not content:
+            continue
+        sheets = [sheet for sheet, temp_sheet in template_sheets.items()
+                  if matches_any(file_name, temp_sheet['fname'])]
+        if index is not None:
+            sheets += index_sheets(index, file_name, template_sheets)
+        for sheet in sheets:
+            with sheet_scope(sheet):
+                sheet_rows[sheet].extend(run_parser_over(
+                    content, template_sheets[sheet]['template']))
 
-    import ipdb; ipdb.set_trace()
-    # raw_content = load_raw_content(tuple(input_files), raw_content_patterns)
+    if not template_sheets:
+        # a workbook without sheets cannot be saved
+        logger.error('No template runs over the input files, {} is not '
+                     'written'.format(output_file))
+        return 1
 
-    # import ipdb; ipdb.set_trace()
-    # system_details_content = get_relevant_content(
-    #     raw_content, (raw_content_patterns[0], ), '*' * 20 + '\n')
+    workbook = open_output_workbook()
+    for sheet, temp_sheet in template_sheets.items():
+        with sheet_scope(sheet):
+            worksheet = workbook.create_sheet(sheet)
+            build_header(
+                worksheet, get_parser_header(temp_sheet['template']))
+            final_col, final_row = write_rows(worksheet, sheet_rows[sheet])
+            sheet_process_output(
+                worksheet,
+                table_name(sheet),
+                sheet,
+                final_col,
+                final_row)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
+    return 0
@@ -12,6 +12,7 @@ from supergrep.vmax import vmax
 from supergrep.vnx import vnx
 from supergrep.xiv import xiv
 from supergrep.parse import parse
+from supergrep.sinks import SINKS
 from supergrep.xtremio import xtremio
 
 
@@ -31,9 +32,52 @@ def build_parser() -> argparse.ArgumentParser:
         '-t', '--templates',
         help='Template files have to be xml format, <sgr> tag on first level,'
              '<fname>, <sheet>, <template> tags on second level', nargs='+')
+    parser.add_argument(
+        '-x', '--index',
+        help='textfsm index file (see examples/index), the templates of the '
+             'row matching the command of each input file are run')
+    parser.add_argument(
+        '--vendor', help='Vendor column value matched in the index file')
     parser.add_argument(
         '-i', '--input-files', help='paths to input files', nargs='+')
     parser.add_argument('-o', '--output-file', help='path to output file')
+    parser.add_argument(
+        '-w', '--write-only', action='store_true',
+        help='stream rows to the output workbook instead of keeping the '
+             'whole workbook in memory')
+    parser.add_argument(
+        '-f', '--format', choices=['xlsx'] + list(SINKS),
+        help='format of the workbooks written in batch mode, a single '
+             'output file takes the format of its extension')
+    parser.add_argument(
+        '-c', '--cache',
+        help='path to a cache file that keeps the parsed rows between runs, '
+             'unchanged input files and templates are not parsed again')
+    parser.add_argument(
+        '--no-prefilter', action='store_true',
+        help='pass every input line to textfsm, instead of only the lines '
+             'some rule of the template matches')
+    parser.add_argument(
+        '--report', action='store_true',
+        help='write the wall time, CPU time and rows of each sheet '
+             'and stage to <output file>.report.json')
+    parser.add_argument(
+        '--report-memory', action='store_true',
+        help='also trace the memory of each stage in the report, the '
+             'tracing slows the run down so its times are not comparable')
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='write the cProfile stats of each sheet to '
+             '<output file>.<sheet>.pstats')
+    parser.add_argument(
+        '-b', '--batch',
+        help='directory of bundles, or manifest with the comma separated '
+             'input files of a bundle per line, processed in parallel into '
+             'one workbook per bundle; the output file is then the output '
+             'directory')
+    parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='number of bundles processed at once in batch mode')
     return parser
 
 
@@ -74,8 +118,19 @@ def parse_args(argv: Any) -> tuple:
     # print(options['templates'])
     func = array_options['parse']
     temp = options.pop('templates')
+    settings.write_only = options.pop('write_only')
+    settings.output_format = options.pop('format') or 'xlsx'
+    settings.cache_path = options.pop('cache')
+    settings.batch_workers = options.pop('jobs')
+    settings.prefilter = not options.pop('no_prefilter')
+    settings.report = options.pop('report')
+    settings.report_memory = options.pop('report_memory')
+    settings.profile = options.pop('profile')
+    settings.template_index = options.pop('index')
+    settings.vendor = options.pop('vendor')
+    batch = options.pop('batch')
 
-    return func, temp, input_files, output_file
+    return func, temp, input_files, output_file, batch
 
 
 # def build_parser() -> argparse.ArgumentParser:
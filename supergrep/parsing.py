@@ -1,18 +1,177 @@
 """File parsing utilities"""
 import gzip
+import hashlib
+import mmap
+import os
+import re
 import tarfile
-from contextlib import suppress
-from io import StringIO, BytesIO
-from itertools import chain
-from typing import List, Generator, Union, IO, Iterable
-from zipfile import ZipFile
+from collections import OrderedDict
+from codecs import getincrementaldecoder
+from contextlib import contextmanager, suppress
+from functools import partial
+from io import StringIO
+from shutil import copyfileobj
+from tempfile import SpooledTemporaryFile
+from typing import (
+    Any, Dict, List, Generator, Optional, Pattern, Union, IO, Iterable,
+    Iterator)
+from zipfile import ZipFile, ZipInfo
 
 import textfsm
 import xmltodict
 
-from supergrep.utils import pattern_filter, tar_pattern_filter
+from supergrep.cache import (
+    DeferredText, MemberText, cached_rows, content_key, member_text,
+    store_rows)
+from supergrep.config import settings
+from supergrep.instrumentation import instrumented_stage
+from supergrep.utils import matches_any, pattern_filter, tar_pattern_filter
 
+# Nested zips bigger than this (in bytes) are spooled to disk
+NESTED_ZIP_SPOOL = 64 * 1024 ** 2
+# Bytes of a file decoded at a time
+DECODE_CHUNK = 1024 ** 2
 
+# Named groups of the rule regexes, and references to groups
+NAMED_GROUP_RE = re.compile(r'(?<!\\)\(\?P<\w+>')
+BACKREFERENCE_RE = re.compile(r'\(\?P=|\\[1-9]|\\g<')
+
+# Compiled textfsm templates, keyed by the digest of the template text
+_TEMPLATE_REGISTRY = dict()  # type: Dict[str, textfsm.TextFSM]
+
+# Line prefilters of the templates, keyed like the registry (None: no filter)
+_PREFILTERS = dict()  # type: Dict[str, Optional[Pattern]]
+
+
+class _Prefetched:
+    """Rows parsed ahead of time, with the run_parser_over calls left"""
+
+    __slots__ = ('content', 'rows', 'uses')
+
+    def __init__(self, content: str, rows: list, uses: int) -> None:
+        self.content = content
+        self.rows = rows
+        self.uses = uses
+
+
+# Rows parsed ahead of time (see supergrep.scheduler), used up on first read
+_PARSED = dict()  # type: Dict[tuple, _Prefetched]
+
+# Spooled nested zips the deferred members read from, closed after the run
+_NESTED_ZIPS = list()  # type: List[IO[bytes]]
+
+
+def template_key(template: str) -> str:
+    """Returns the registry key of a template
+
+    :param template:
+    :return:
+    """
+    return hashlib.sha1(template.encode('utf-8')).hexdigest()
+
+
+def get_fsm(template: str) -> textfsm.TextFSM:
+    """Returns a compiled FSM for a template, ready to parse
+
+    Templates are compiled once per process, afterwards the cached FSM
+    is only reset to its Start state before being handed out again.
+
+    :param template:
+    :return:
+    """
+    key = template_key(template)
+    fsm = _TEMPLATE_REGISTRY.get(key)
+    if fsm is None:
+        fsm = textfsm.TextFSM(StringIO(template))
+        _TEMPLATE_REGISTRY[key] = fsm
+    else:
+        fsm.Reset()
+    return fsm
+
+
+def get_prefilter(template: str) -> Optional[Pattern]:
+    """Returns a regex matching the lines at least one rule could match
+
+    textfsm ignores a line no rule of the current state matches, so the
+    lines no rule of any state matches can be dropped before parsing
+    without changing the rows. The rule regexes are joined, without their
+    named groups, into one pattern. Templates whose rules cannot be joined
+    (back references, inline flags) get no prefilter (None).
+
+    :param template:
+    :return:
+    """
+    key = template_key(template)
+    if key not in _PREFILTERS:
+        fsm = get_fsm(template)
+        rules = [rule.regex for state in fsm.states.values() for rule in state]
+        prefilter = None
+        if rules and not any(BACKREFERENCE_RE.search(rule) for rule in rules):
+            with suppress(re.error):
+                prefilter = re.compile('|'.join(
+                    '(?:{})'.format(NAMED_GROUP_RE.sub('(?:', rule))
+                    for rule in rules))
+        _PREFILTERS[key] = prefilter
+    return _PREFILTERS[key]
+
+
+def prefilter_lines(content: str, template: str) -> str:
+    """Drops the lines of content no rule of the template could match
+
+    :param content:
+    :param template:
+    :return:
+    """
+    prefilter = get_prefilter(template)
+    if prefilter is None:
+        return content
+    return '\n'.join(filter(prefilter.match, content.splitlines()))
+
+
+def clear_template_registry() -> None:
+    """Drops all the compiled templates and the rows parsed ahead of time"""
+    _TEMPLATE_REGISTRY.clear()
+    _PREFILTERS.clear()
+    clear_parsed()
+
+
+def clear_parsed() -> None:
+    """Drops the rows parsed ahead of time that no sheet used
+
+    Called at the end of each run, the entries keep their content alive.
+    """
+    _PARSED.clear()
+
+
+def close_nested_zips() -> None:
+    """Closes the spooled nested zips kept open for the deferred members
+
+    Called at the end of each run, once no sheet reads the members.
+    """
+    for nested_zip in _NESTED_ZIPS:
+        nested_zip.close()
+    del _NESTED_ZIPS[:]
+
+
+def store_parsed(
+        content: str,
+        template: str,
+        rows: list,
+        uses: int = 1) -> None:
+    """Keeps rows parsed elsewhere for the next run_parser_over calls
+
+    :param content:
+    :param template:
+    :param rows:
+    :param uses: number of run_parser_over calls expecting the rows
+    """
+    key = template_key(template), hash(content)
+    if key in _PARSED and _PARSED[key].content == content:
+        uses += _PARSED[key].uses
+    _PARSED[key] = _Prefetched(content, rows, uses)
+
+
+@instrumented_stage('parse', rows=len)
 def run_parser_over(content: str, template: str) -> list:     # pylint: disable=redefined-builtin
     """Run textfsm template over content
 
@@ -20,137 +179,401 @@ def run_parser_over(content: str, template: str) -> list:     # pylint: disable=
     :param template:
     :return:
     """
-    fsm = textfsm.TextFSM(StringIO(template))
-    result = fsm.ParseText(content)
+    partitions = getattr(content, 'partitions', None)
+    if partitions is not None:
+        return [row for _, rows in parse_partitions(content, template)
+                for row in rows]
+    key = template_key(template), hash(content)
+    parsed = _PARSED.get(key)
+    if parsed is not None and parsed.content == content:
+        parsed.uses -= 1
+        if parsed.uses > 0:
+            # sheets change the rows in place, later calls get their own copy
+            return [list(row) for row in parsed.rows]
+        del _PARSED[key]
+        return parsed.rows
+    cache_key = parsed_rows_key(content, template)
+    if cache_key is not None:
+        rows = cached_rows(cache_key)
+        if rows is not None:
+            return rows
+    result = parse_text(member_text(content), template)
+    if cache_key is not None:
+        store_rows(cache_key, result)
     return result
 
 
+def parse_text(content: str, template: str) -> list:
+    """Run textfsm template over content, bypassing every cache
+
+    :param content:
+    :param template:
+    :return:
+    """
+    if settings.prefilter:
+        content = prefilter_lines(content, template)
+    fsm = get_fsm(template)
+    return fsm.ParseText(content)
+
+
+def parsed_rows_key(content: str, template: str) -> Optional[str]:
+    """On-disk cache key of the rows, None when the cache is off
+
+    :param content:
+    :param template:
+    :return:
+    """
+    if not settings.cache_path:
+        return None
+    return content_key(content, template_key(template))
+
+
+def parse_partitions(content: str, template: str) -> List[tuple]:
+    """Run textfsm template over every array partition of content
+
+    Content that is not partitioned is a single partition with an empty key.
+
+    :param content:
+    :param template:
+    :return: (array key, rows) pairs
+    """
+    partitions = getattr(content, 'partitions', None)
+    if partitions is None:
+        return [('', run_parser_over(content, template))]
+    return [(key, run_parser_over(text, template))
+            for key, text in partitions]
+
+
 def get_parser_header(template: str) -> List[str]:
     """Return list of header columns for parser
 
     :param template:
     :return:
     """
-    fsm = textfsm.TextFSM(StringIO(template))
-    return fsm.header
+    return list(get_fsm(template).header)
+
+
+def read_zip_member(zip_file_name: Union[IO[bytes], str],
+                    file_name: str) -> MemberText:
+    """Decodes a member of a zip file, opening the zip file again
+
+    :param zip_file_name: path or binary file object
+    :param file_name:
+    :return: empty when the member is not utf-8 text
+    """
+    with ZipFile(zip_file_name, 'r') as zip_file:
+        return get_file_content(zip_file, file_name) or MemberText(
+            '', zip_file_signature(zip_file.getinfo(file_name)))
+
+
+def zip_file_signature(info: ZipInfo) -> tuple:
+    """Signature of a zip member, from its header
+
+    :param info:
+    :return:
+    """
+    return info.filename, info.CRC, info.file_size
 
 
-def get_file_content(zip_file: ZipFile, file_name: str) -> str:
+def get_file_content(zip_file: ZipFile, file_name: str,
+                     zip_file_name: Union[IO[bytes], str] = None) -> Any:
     """Loads the file content of a file in a zip file
 
+    The content is signed with the CRC32 and size of the zip header. With
+    the on-disk cache on and the zip file path (or file object) given, the
+    member is not read here: a DeferredText with the same signature reads
+    it when its text is needed, which is never when the rows of every
+    template that runs over it are in the cache.
+
     :param zip_file:
     :param file_name:
+    :param zip_file_name: path or binary file object of zip_file
     :return:
     """
+    info = zip_file.getinfo(file_name)
+    if settings.cache_path and zip_file_name is not None:
+        return DeferredText(
+            partial(read_zip_member, zip_file_name, file_name),
+            zip_file_signature(info), info.file_size)
     with suppress(UnicodeDecodeError):
-        return zip_file.open(file_name).read().decode('utf-8')
+        with zip_file.open(file_name) as member:
+            return MemberText(read_text(member), zip_file_signature(info))
 
 
-def load_zip(zip_file_name: Union[IO[bytes], str]) -> Generator:
-    """Loads files inside a nested .zip
+def stream_zip(
+        zip_file_name: Union[IO[bytes], str],
+        patterns: tuple) -> Generator:
+    """Loads only the files whose names match the patterns from a nested .zip
+
+    Member names are checked before any byte is read, nested .zips are
+    spooled to a temporary file (on disk once they outgrow NESTED_ZIP_SPOOL)
+    instead of being held whole in memory. With the on-disk cache on, the
+    members are deferred (see get_file_content) and a nested .zip is kept
+    open for them until close_nested_zips.
 
     :param zip_file_name:
+    :param patterns:
     :return:
     """
     with ZipFile(zip_file_name, 'r') as zip_file:
-        for nested_file in zip_file.filelist:  # type: ignore
+        for nested_file in zip_file.infolist():
             if nested_file.filename.endswith('.zip'):
-                nested_zip_name = BytesIO(
-                    zip_file.open(nested_file).read())
-                for x in load_zip(nested_zip_name):
-                    yield x
-            else:
+                nested_zip = SpooledTemporaryFile(NESTED_ZIP_SPOOL)
+                if settings.cache_path:
+                    _NESTED_ZIPS.append(nested_zip)
+                try:
+                    with zip_file.open(nested_file) as member:
+                        copyfileobj(member, nested_zip)
+                    nested_zip.seek(0)
+                    for x in stream_zip(nested_zip, patterns):
+                        yield x
+                finally:
+                    if not settings.cache_path:
+                        nested_zip.close()
+            elif matches_any(nested_file.filename, patterns):
                 yield (nested_file.filename,
-                       get_file_content(zip_file, nested_file.filename))
+                       get_file_content(zip_file, nested_file.filename,
+                                        zip_file_name))
 
 
-def load_zips(input_files: tuple) -> Generator:
-    """Loads the file content inside the input .zips
+def stream_zips(input_files: tuple, patterns: tuple) -> Generator:
+    """Loads the matching file content inside the input .zips
 
     :param input_files:
+    :param patterns:
     :return:
     """
     for first_zip_filename in input_files:
-        for x in load_zip(first_zip_filename):
+        for x in stream_zip(first_zip_filename, patterns):
             yield x
 
 
+@instrumented_stage('load', rows=len)
 def load_raw_content(input_files: tuple, patterns: tuple) -> Iterable:
     """Loads the data from all the needed input files
 
+    Only the files matching the patterns are read and decoded
+
     :param input_files:
     :param patterns:
     :return:
     """
-    return pattern_filter(load_zips(input_files), patterns)
+    return pattern_filter(stream_zips(input_files, patterns), patterns)
 
 
 def decode_bytes(nested_file_bytes: list) -> str:
     """Decodes the bytes of a file in utf-8, returns the file content as string
 
-    :param nested_file_bytes:
+    :param nested_file_bytes: lines of bytes
     :return:
     """
-    converted_to_str = ''
-    for line in nested_file_bytes:
-        converted_to_str += line.decode('utf-8')
-    return converted_to_str
+    return b''.join(nested_file_bytes).decode('utf-8')
 
 
-def get_files_from_tar(input_tar: str, patterns: tuple) -> list:
-    """Gets the needed files from a .tbz2 archive
+def iter_decoded(binary_file: IO[bytes],
+                 chunk_size: int = DECODE_CHUNK) -> Generator:
+    """Yields the utf-8 text of a binary file, one chunk at a time
 
-    :param input_tar:
-    :param patterns:
+    A character split between two chunks is held back until it is whole.
+
+    :param binary_file:
+    :param chunk_size: bytes read at a time
     :return:
     """
-    content_list = []
-    with tarfile.open(input_tar) as tar_file:
-        for nested_file in tar_pattern_filter(tar_file, patterns):
-            content_list.append(
-                (nested_file.name,
-                 decode_bytes(tar_file.extractfile(nested_file).readlines())))
-    return content_list
+    decoder = getincrementaldecoder('utf-8')()
+    for chunk in iter(partial(binary_file.read, chunk_size), b''):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', True)
+    if text:
+        yield text
+
 
+def read_text(binary_file: IO[bytes]) -> str:
+    """Reads and decodes a whole binary file in utf-8
 
+    The bytes are read in chunks, so only one chunk of them is held next
+    to the text.
+
+    :param binary_file:
+    :return:
+    """
+    return ''.join(iter_decoded(binary_file))
+
+
+@contextmanager
+def mapped_file(file_name: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Maps a file read-only in memory
+
+    The bytes are read from the page cache as they are used, they are not
+    copied into the Python heap. An empty file, which cannot be mapped, is
+    an empty bytes object.
+
+    :param file_name:
+    :return:
+    """
+    with open(file_name, 'rb') as binary_file:
+        if not os.fstat(binary_file.fileno()).st_size:
+            yield b''
+            return
+        with mmap.mmap(binary_file.fileno(), 0,
+                       access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def read_file_text(file_name: str) -> str:
+    """Decodes a whole file in utf-8, see read_text
+
+    :param file_name:
+    :return:
+    """
+    with open(file_name, 'rb') as binary_file:
+        return read_text(binary_file)
+
+
+def mapped_tar_text(input_tar: str, patterns: tuple) -> Dict[Any, str]:
+    """Text of the members of an uncompressed tar that match the patterns
+
+    The archive is mapped in memory and each member is decoded from its
+    slice of the map, as a memoryview, instead of being extracted.
+
+    :param input_tar:
+    :param patterns:
+    :return: TarInfo -> text, in archive order
+    :raises tarfile.ReadError: when the file is not an uncompressed tar
+    """
+    member_text = OrderedDict()  # type: Dict[tarfile.TarInfo, str]
+    with mapped_file(input_tar) as mapped:
+        if not len(mapped):
+            raise tarfile.ReadError('empty file')
+        with tarfile.open(fileobj=mapped, mode='r:') as tar_file, \
+                memoryview(mapped) as buffer:
+            for nested_file in tar_file:
+                if not nested_file.isfile() \
+                        or not matches_any(nested_file.name, patterns):
+                    continue
+                if nested_file.issparse():
+                    member_text[nested_file] = read_text(
+                        tar_file.extractfile(nested_file))
+                    continue
+                with buffer[nested_file.offset_data:nested_file.offset_data
+                            + nested_file.size] as member:
+                    member_text[nested_file] = str(member, 'utf-8')
+    return member_text
+
+
+def streamed_tar_text(input_tar: Union[str, IO],
+                      patterns: tuple) -> Dict[Any, str]:
+    """Text of the members of a tar that match the patterns
+
+    The archive, compressed or not, is read once as a stream, so it can be
+    a member of a zip opened in place. Only the matching members are read.
+
+    :param input_tar: path or binary file object
+    :param patterns:
+    :return: TarInfo -> text, in archive order
+    """
+    if isinstance(input_tar, str):
+        tar_file = tarfile.open(input_tar, 'r|*')
+    else:
+        tar_file = tarfile.open(fileobj=input_tar, mode='r|*')
+    member_text = OrderedDict()  # type: Dict[tarfile.TarInfo, str]
+    with tar_file:
+        for nested_file in tar_file:
+            if matches_any(nested_file.name, patterns):
+                member = tar_file.extractfile(nested_file)
+                if member is not None:
+                    member_text[nested_file] = read_text(member)
+    return member_text
+
+
+def get_files_from_tar(input_tar: Union[str, IO], patterns: tuple,
+                       signature: tuple = None) -> list:
+    """Gets the needed files from a .tar or .tbz2 archive
+
+    Uncompressed archive files are read from a memory map (see
+    mapped_tar_text), the others as a stream. The members are signed with
+    the signature of the archive followed by their name, size and mtime.
+
+    :param input_tar: path or binary file object
+    :param patterns:
+    :param signature: of the archive member the tar was read from, the
+        path, size and mtime of the tar file otherwise
+    :return:
+    """
+    member_text = None
+    if isinstance(input_tar, str):
+        if signature is None:
+            stat = os.stat(input_tar)
+            signature = input_tar, stat.st_size, stat.st_mtime
+        with suppress(tarfile.ReadError):
+            member_text = mapped_tar_text(input_tar, patterns)
+    if member_text is None:
+        member_text = streamed_tar_text(input_tar, patterns)
+    return [(nested_file.name,
+             MemberText(member_text[nested_file],
+                        tuple(signature or ()) + (
+                            nested_file.name, nested_file.size,
+                            nested_file.mtime)))
+            for nested_file in tar_pattern_filter(member_text, patterns)]
+
+
+@instrumented_stage('load', rows=len)
 def raw_tar_content(input_files: tuple, patterns: tuple) -> Iterable:
     """Opens .zip or .tbz2 files for 3par
 
-    The .zip case uses the filesystem
+    The archives inside a .zip are read straight from the zip, members
+    that are not tar archives are skipped
 
     :param input_files:
     :param patterns:
     :return:
     """
-    raw_content = chain()  # type: chain
+    raw_content = list()  # type: list
     for input_file in input_files:
         if input_file.endswith('.zip'):
             with ZipFile(input_file, 'r') as zf:
                 for nested_file in zf.filelist:  # type: ignore
-                    raw_content = chain(
-                        raw_content, get_files_from_tar(zf.extract(
-                            nested_file), patterns))
+                    with zf.open(nested_file) as nested_tar, \
+                            suppress(tarfile.ReadError):
+                        raw_content += get_files_from_tar(
+                            nested_tar, patterns,
+                            (nested_file.filename, nested_file.CRC,
+                             nested_file.file_size))
         else:
             with suppress(tarfile.ReadError):
-                raw_content = chain(
-                    raw_content, get_files_from_tar(input_file, patterns))
+                raw_content += get_files_from_tar(input_file, patterns)
     return raw_content
 
 
-def get_files_from_gz(input_gz: str) -> tuple:
+def get_files_from_gz(input_gz: Union[str, IO], signature: tuple = None,
+                      name: str = None) -> tuple:
     """Unpacks input .gz file
 
-    :param input_gz:
+    :param input_gz: path or binary file object
+    :param signature: of the archive member the file was read from, the
+        size and mtime of the file otherwise
+    :param name: of the archive member the file was read from
     :return:
     """
-    with gzip.open(input_gz) as gzip_file:
-        return gzip_file.filename, decode_bytes(gzip_file.readlines())
-
-
+    if isinstance(input_gz, str):
+        name = input_gz
+        if signature is None:
+            stat = os.stat(input_gz)
+            signature = input_gz, stat.st_size, stat.st_mtime
+        gzip_file = gzip.open(input_gz)
+    else:
+        gzip_file = gzip.GzipFile(fileobj=input_gz)
+    with gzip_file:
+        return name, MemberText(read_text(gzip_file), signature)
+
+
+@instrumented_stage('load', rows=len)
 def raw_gz_content(input_files: tuple) -> Iterable:
     """Opens .zip or .gz files for Isilon
 
-    The .zip case uses the filesystem
+    The .gz files inside a .zip are decompressed straight from the zip
 
     :param input_files:
     :return:
@@ -160,24 +583,39 @@ def raw_gz_content(input_files: tuple) -> Iterable:
         if input_file.endswith('.zip'):
             with ZipFile(input_file, 'r') as zf:
                 for nested_file in zf.filelist:  # type: ignore
-                    raw_content.append(get_files_from_gz(
-                        zf.extract(nested_file)))
+                    with zf.open(nested_file) as nested_gz:
+                        raw_content.append(get_files_from_gz(
+                            nested_gz,
+                            (nested_file.filename, nested_file.CRC,
+                             nested_file.file_size),
+                            nested_file.filename))
         else:
             raw_content.append(get_files_from_gz(input_file))
     return raw_content
 
 
-def get_template_sheets(template_files: list) -> dict:
-    """
+def get_template_sheets(template_files: list) -> Dict[str, dict]:
+    """Loads the <sgr> xml templates, keyed by their <sheet>
+
+    The <fname> tag holds the whitespace separated file name patterns the
+    <template> runs over.
 
     :param template_files:
     :return:
     """
-    temp_sheets = dict()  # type: dict
+    temp_sheets = OrderedDict()  # type: Dict[str, dict]
     for tfile in template_files:
         with open(tfile, 'r') as txml:
             temp_data = xmltodict.parse(''.join(txml.readlines()))['sgr']
-        temp_sheets[temp_data['sheet']]['template'] = temp_data['template']
-        temp_sheets[temp_data['sheet']]['fname'] = temp_data['fname']
+        sheet = temp_data['sheet']
+        if sheet in temp_sheets:
+            raise ValueError(
+                'Templates {} and {} both write the {} sheet'.format(
+                    temp_sheets[sheet]['file'], tfile, sheet))
+        temp_sheets[sheet] = {
+            'file': tfile,
+            'template': temp_data['template'] + '\n',
+            'fname': tuple(temp_data['fname'].split())
+        }
 
     return temp_sheets
@@ -0,0 +1,142 @@
+"""Hash joins over the rows of parsed command outputs
+
+The sheets combine the rows of several commands on some of their columns.
+Each join indexes one side in a dictionary, keyed by a key extractor, and
+streams the other side through it, so it runs in linear time whatever the
+number of rows. Every join streams its left rows in order, the right rows
+are the indexed ones.
+"""
+from collections import defaultdict
+from typing import Any, Callable, Dict, Generator, Iterable, List, Sequence
+
+__all__ = ('anti_join', 'column_key', 'hash_index', 'inner_join',
+           'left_join', 'merge_pairs', 'multiple_join')
+
+# row -> key of the row, always a tuple
+KeyFunction = Callable[[Sequence], tuple]
+
+
+def column_key(*columns: int, cast: Callable = None) -> KeyFunction:
+    """Key extractor of the values of some columns of a row
+
+    The key is a tuple even for a single column. With cast, eg. str or int,
+    each value is converted first, for columns parsed with different types.
+
+    :param columns: indexes
+    :param cast:
+    :return:
+    """
+    if cast is None:
+        return lambda row: tuple(row[column] for column in columns)
+    return lambda row: tuple(cast(row[column]) for column in columns)
+
+
+def hash_index(rows: Iterable[Sequence], key: KeyFunction) -> Dict[
+        tuple, List[Sequence]]:
+    """Rows grouped by their key, each group in the order of the rows
+
+    :param rows:
+    :param key:
+    :return:
+    """
+    index = defaultdict(list)  # type: Dict[tuple, List[Sequence]]
+    for row in rows:
+        index[key(row)].append(row)
+    return index
+
+
+def inner_join(left: Iterable[Sequence], right: Iterable[Sequence],
+               left_key: KeyFunction, right_key: KeyFunction = None,
+               pick: Callable = None) -> Generator:
+    """Yields the (left row, right row) pairs with the same key
+
+    :param left:
+    :param right:
+    :param left_key:
+    :param right_key: the left key when None
+    :param pick: picks the only right row joined to a left row from its
+        matches (eg. cytoolz first or last), every match is joined when None
+    :return:
+    """
+    index = hash_index(right, right_key or left_key)
+    for left_row in left:
+        matches = index.get(left_key(left_row))
+        if not matches:
+            continue
+        for right_row in matches if pick is None else [pick(matches)]:
+            yield left_row, right_row
+
+
+def left_join(left: Iterable[Sequence], right: Iterable[Sequence],
+              left_key: KeyFunction, right_key: KeyFunction = None,
+              default: Sequence = None, pick: Callable = None) -> Generator:
+    """Yields the (left row, right row) pairs with the same key, and the
+    (left row, default) pair of each left row without any
+
+    :param left:
+    :param right:
+    :param left_key:
+    :param right_key: the left key when None
+    :param default: right row of the left rows without a match
+    :param pick: see inner_join
+    :return:
+    """
+    index = hash_index(right, right_key or left_key)
+    for left_row in left:
+        matches = index.get(left_key(left_row)) or [default]
+        for right_row in matches if pick is None else [pick(matches)]:
+            yield left_row, right_row
+
+
+def anti_join(left: Iterable[Sequence], right: Iterable[Sequence],
+              left_key: KeyFunction, right_key: KeyFunction = None) -> \
+        Generator:
+    """Yields the left rows without any right row with the same key
+
+    :param left:
+    :param right:
+    :param left_key:
+    :param right_key: the left key when None
+    :return:
+    """
+    keys = set(map(right_key or left_key, right))
+    for left_row in left:
+        if left_key(left_row) not in keys:
+            yield left_row
+
+
+def merge_pairs(pairs: Iterable[tuple], drop: int = 0) -> Generator:
+    """Yields the row of each (left row, right row) pair of a join
+
+    The left row is followed by the right one, without its first drop
+    columns (the columns in common).
+
+    :param pairs:
+    :param drop:
+    :return:
+    """
+    for left_row, right_row in pairs:
+        yield list(left_row) + list(right_row[drop:])
+
+
+def multiple_join(common_columns: tuple, tables: List[Iterable]) -> List[
+        List[Any]]:
+    """Inner join of several tables on the same columns
+
+    The first len(common_columns) columns of every table but the first are
+    dropped from the joined rows. The rows are in the order of the last
+    table.
+
+    :param common_columns:
+    :param tables:
+    :return:
+    :raises ValueError: with less than two tables
+    """
+    if len(tables) < 2:
+        raise ValueError
+    key = column_key(*common_columns)
+    rows = tables[0]
+    for table in tables[1:]:
+        rows = [list(left_row) + list(right_row[len(common_columns):])
+                for right_row, left_row in inner_join(table, rows, key)]
+    return rows
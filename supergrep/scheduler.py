@@ -0,0 +1,128 @@
+"""Parallel textfsm stage for the sheet processors"""
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+from typing import Callable, Dict, Iterable, List, Optional
+
+from supergrep.config import settings
+from supergrep.instrumentation import instrumented_stage
+from supergrep.cache import cached_rows, member_text, store_rows
+from supergrep.parsing import parse_text, parsed_rows_key, store_parsed
+
+logger = getLogger(__name__)
+
+
+def parse_job(job: tuple) -> list:
+    """Runs the templates of a (content, templates) job, in a worker process
+
+    :param job:
+    :return: (rows, None) or (None, error) for each template
+    """
+    content, templates = job
+    results = list()  # type: list
+    for template in templates:
+        try:
+            results.append((parse_text(content, template), None))
+        except Exception as error:  # pylint: disable=broad-except
+            results.append((None, error))
+    return results
+
+
+def sheet_jobs(content: str, *templates: str) -> list:
+    """Declares the templates a sheet runs over its input content
+
+    Partitioned content gives one job per array partition, so the arrays
+    are parsed in parallel.
+
+    :param content:
+    :param templates:
+    :return:
+    """
+    partitions = getattr(content, 'partitions', None)
+    texts = [content] if partitions is None else [
+        text for _, text in partitions]
+    return [(text, template) for template in templates for text in texts]
+
+
+@instrumented_stage('prefetch')
+def prefetch_parsers(jobs: Iterable, max_workers: int = None) -> None:
+    """Runs the textfsm stage of the sheets across a process pool
+
+    textfsm runs only depend on the sheet input content, the data hand-offs
+    between sheets (e.g. storage groups -> LUNs -> LUNs pivot) happen after
+    parsing, so every job is independent. The rows are handed over to
+    run_parser_over, the sheets then run in their usual order and only do
+    the join and openpyxl write stages in this process.
+
+    The jobs are grouped by content, each content is sent to a worker once
+    with all the templates that run over it. Partitioned content is one
+    content per array partition.
+
+    A template that fails in a worker is left to the sheet, which parses
+    again and reports the error in order. Jobs found in the on-disk cache
+    (see supergrep.cache) skip the pool, the rows parsed by the pool are
+    added to it.
+
+    :param jobs: (content, template) pairs
+    :param max_workers:
+    """
+    # content id -> (content, {template: number of uses})
+    content_jobs = dict()  # type: Dict[int, tuple]
+    for content, template in jobs:
+        if content:
+            uses = content_jobs.setdefault(
+                id(content), (content, Counter()))[1]
+            uses[template] += 1
+    cache_keys = dict()  # type: Dict[tuple, Optional[str]]
+    for content, uses in content_jobs.values():
+        for template in list(uses):
+            cache_key = parsed_rows_key(content, template)
+            rows = None if cache_key is None else cached_rows(cache_key)
+            if rows is not None:
+                store_parsed(content, template, rows, uses.pop(template))
+            else:
+                cache_keys[id(content), template] = cache_key
+    content_jobs = {key: (content, uses)
+                    for key, (content, uses) in content_jobs.items() if uses}
+    workers = max_workers or settings.parse_workers or os.cpu_count() or 1
+    if workers < 2 or len(content_jobs) < 2:
+        return
+
+    with ProcessPoolExecutor(min(workers, len(content_jobs))) as executor:
+        futures = [(content, uses, executor.submit(
+            parse_job, (member_text(content), list(uses))))
+                   for content, uses in content_jobs.values()]
+        for content, uses, future in futures:
+            if future.exception() is not None:
+                logger.debug('Prefetch failed: {}'.format(future.exception()))
+                continue
+            for template, (rows, error) in zip(uses, future.result()):
+                if error is not None:
+                    logger.debug('Prefetch failed: {}'.format(error))
+                    continue
+                store_parsed(content, template, rows, uses[template])
+                if cache_keys[id(content), template] is not None:
+                    store_rows(cache_keys[id(content), template], rows)
+
+
+@instrumented_stage('parse', rows=len)
+def parse_documents(parse: Callable, contents: List[str],
+                    max_workers: int = None) -> list:
+    """Parses each document with parse, the documents across a process pool
+
+    For the vendors that read whole XML documents (Isilon, EVA) rather than
+    run textfsm templates. Each document is sent to one worker, parse must
+    be a module level function and its result picklable. With a single
+    document or worker, the documents are parsed in this process.
+
+    :param parse: function(document content)
+    :param contents:
+    :param max_workers:
+    :return: the result of parse for each document, in order
+    """
+    workers = max_workers or settings.parse_workers or os.cpu_count() or 1
+    if workers < 2 or len(contents) < 2:
+        return [parse(content) for content in contents]
+    with ProcessPoolExecutor(min(workers, len(contents))) as executor:
+        return list(executor.map(parse, contents))
@@ -0,0 +1,267 @@
+"""Columnar output sinks, an alternative to the xlsx workbook
+
+A SinkWorkbook stands in for the output workbook. Its worksheets keep the
+interface the sheet processors write through and only hold the values,
+every style is dropped. When the workbook is saved each table of each
+sheet is written by the sink of the output format: a CSV file per table,
+one JSON Lines file, or a Parquet file per table (needs pyarrow).
+"""
+import csv
+import json
+import os
+import re
+from collections import OrderedDict, defaultdict
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Generator, List
+
+from openpyxl.utils import (
+    column_index_from_string, coordinate_from_string, get_column_letter,
+    range_boundaries)
+from openpyxl.worksheet.table import Table
+
+from supergrep.workbook_templates import template_sheetnames
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+__all__ = ('SINKS', 'SinkWorkbook', 'SinkWorksheet', 'register_sink')
+
+
+class SinkCell:
+    """Value of a cell, the style attributes set on it are ignored"""
+
+    def __init__(self, cells: Dict[int, Any], row: int, col_idx: int) -> None:
+        self._cells = cells
+        self.row = row
+        self.col_idx = col_idx
+
+    @property
+    def column(self) -> str:
+        return get_column_letter(self.col_idx)
+
+    @property
+    def value(self) -> Any:
+        return self._cells.get(self.col_idx)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._cells[self.col_idx] = value
+
+
+class SinkWorksheet:
+    """Worksheet holding only the values of its cells and its tables
+
+    write_rows hands whole rows to write_values instead of addressing each
+    cell, the header and the other single cells go through cell.
+    """
+
+    def __init__(self, title: str) -> None:
+        self.title = title
+        self.auto_filter = None
+        self.column_dimensions = defaultdict(SimpleNamespace)
+        self._rows = defaultdict(dict)  # type: Dict[int, Dict[int, Any]]
+        self._tables = list()  # type: List[tuple]
+
+    def __getitem__(self, coordinate: str) -> SinkCell:
+        return self.cell(coordinate)
+
+    def cell(self, coordinate: str = None, row: int = None,
+             column: int = None) -> SinkCell:
+        """Cell at a coordinate, or at a row and column index
+
+        :param coordinate:
+        :param row:
+        :param column:
+        :return:
+        """
+        if coordinate is not None:
+            column_letter, row = coordinate_from_string(coordinate)
+            column = column_index_from_string(column_letter)
+        return SinkCell(self._rows[row], row, column)
+
+    def write_values(self, row: int, first_col: int, values: list) -> None:
+        """Sets the values of a row from a column index on
+
+        :param row:
+        :param first_col:
+        :param values:
+        """
+        self._rows[row].update(zip(range(first_col, first_col + len(values)),
+                                   values))
+
+    def add_table(self, table: Table) -> None:
+        self._tables.append((table.displayName, range_boundaries(table.ref)))
+
+    def tables(self) -> Generator:
+        """Yields the name, header and rows of each table of the sheet
+
+        The header is the first row of the table, missing cells are None.
+
+        :return:
+        """
+        for name, (min_col, min_row, max_col, max_row) in self._tables:
+            columns = range(min_col, max_col + 1)
+            rows = [[self._rows.get(row, {}).get(col_idx)
+                     for col_idx in columns]
+                    for row in range(min_row, max_row + 1)]
+            yield name, rows[0], rows[1:]
+
+
+class SinkWorkbook:
+    """Workbook whose tables are written by a sink when it is saved"""
+
+    def __init__(self, output_format: str, template_path: str = None) -> None:
+        self.output_format = output_format
+        self._sheets = OrderedDict()  # type: Dict[str, SinkWorksheet]
+        if template_path is not None:
+            for name in template_sheetnames(template_path):
+                self.create_sheet(name)
+
+    def create_sheet(self, title: str) -> SinkWorksheet:
+        self._sheets[title] = SinkWorksheet(title)
+        return self._sheets[title]
+
+    def get_sheet_by_name(self, name: str) -> SinkWorksheet:
+        return self._sheets[name]
+
+    def save(self, filename: str) -> None:
+        SINKS[self.output_format](filename, list(self._tables()))
+
+    def _tables(self) -> Generator:
+        """Yields the sheet, name, header and rows of every table
+
+        :return:
+        """
+        for sheet, worksheet in self._sheets.items():
+            for name, header, rows in worksheet.tables():
+                yield sheet, name, header, rows
+
+
+def column_names(header: list) -> List[str]:
+    """Unique names of the columns of a table, from its header row
+
+    Blank header cells are named after their column number.
+
+    :param header:
+    :return:
+    """
+    names = list()  # type: List[str]
+    for col_n, name in enumerate(header, 1):
+        name = str(name).strip() if name not in (None, '') \
+            else 'column{}'.format(col_n)
+        while name in names:
+            name = '{}_{}'.format(name, col_n)
+        names.append(name)
+    return names
+
+
+def table_paths(filename: str, tables: List[tuple]) -> List[str]:
+    """Path of the file of each table, next to the output file
+
+    A table is written to <output>.<sheet><extension>, or to
+    <output>.<sheet>.<table><extension> when its sheet has several tables.
+
+    :param filename:
+    :param tables: (sheet, name, header, rows)
+    :return:
+    """
+    base, extension = os.path.splitext(filename)
+    sheet_tables = defaultdict(int)  # type: Dict[str, int]
+    for sheet, _, _, _ in tables:
+        sheet_tables[sheet] += 1
+    paths = list()  # type: List[str]
+    for sheet, name, _, _ in tables:
+        stem = sheet if sheet_tables[sheet] == 1 \
+            else '{}.{}'.format(sheet, name)
+        paths.append('{}.{}{}'.format(
+            base, re.sub(r'[^\w.-]', '_', stem), extension))
+    return paths
+
+
+def blank_to_none(value: Any) -> Any:
+    return None if value == '' else value
+
+
+def write_csv(filename: str, tables: List[tuple]) -> None:
+    """Writes each table to a CSV file, its header on the first line
+
+    :param filename:
+    :param tables: (sheet, name, header, rows)
+    """
+    for path, (_, _, header, rows) in zip(table_paths(filename, tables),
+                                          tables):
+        with open(path, 'w', newline='', encoding='utf-8') as output:
+            writer = csv.writer(output)
+            writer.writerow(column_names(header))
+            writer.writerows(rows)
+
+
+def write_jsonl(filename: str, tables: List[tuple]) -> None:
+    """Writes every row of every table as a JSON object on its own line
+
+    Each object has the sheet and table of the row, and its values keyed
+    by the header of their column.
+
+    :param filename:
+    :param tables: (sheet, name, header, rows)
+    """
+    with open(filename, 'w', encoding='utf-8') as output:
+        for sheet, name, header, rows in tables:
+            names = column_names(header)
+            for row in rows:
+                record = OrderedDict((('sheet', sheet), ('table', name)))
+                record.update(zip(names, map(blank_to_none, row)))
+                output.write(json.dumps(record, default=str) + '\n')
+
+
+def parquet_column(values: list) -> list:
+    """Values of a column that pyarrow converts to a single type
+
+    Blanks are nulls, columns mixing numbers and text are all text.
+
+    :param values:
+    :return:
+    """
+    values = list(map(blank_to_none, values))
+    types = set(type(value) for value in values if value is not None)
+    if types <= {int, float}:
+        return values
+    return [None if value is None else str(value) for value in values]
+
+
+def write_parquet(filename: str, tables: List[tuple]) -> None:
+    """Writes each table to a Parquet file
+
+    :param filename:
+    :param tables: (sheet, name, header, rows)
+    """
+    for path, (_, _, header, rows) in zip(table_paths(filename, tables),
+                                          tables):
+        columns = zip(*rows) if rows else [()] * len(header)
+        pyarrow.parquet.write_table(pyarrow.Table.from_arrays(
+            [pyarrow.array(parquet_column(list(values)))
+             for values in columns],
+            column_names(header)), path)
+
+
+# output file extension -> function(output file, tables)
+SINKS = OrderedDict((
+    ('csv', write_csv),
+    ('jsonl', write_jsonl),
+))  # type: Dict[str, Callable]
+if pyarrow is not None:
+    SINKS['parquet'] = write_parquet
+
+
+def register_sink(extension: str, sink: Callable) -> None:
+    """Adds an output format, written by sink(output file, tables)
+
+    The tables are (sheet, name, header, rows) tuples.
+
+    :param extension: of the output files, without the dot
+    :param sink:
+    """
+    SINKS[extension] = sink
@@ -0,0 +1,208 @@
+"""Write-only (streaming) workbook output"""
+from collections import OrderedDict
+from typing import Any, Dict
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell
+from openpyxl.packaging.relationship import Relationship
+from openpyxl.utils import (
+    column_index_from_string, coordinate_from_string, range_boundaries)
+from openpyxl.worksheet.related import Related
+from openpyxl.worksheet.table import Table, TablePartList
+from openpyxl.writer.write_only import WriteOnlyWorksheet
+from openpyxl.xml.functions import tostring
+
+from supergrep.config import settings
+from supergrep.formatting import compute_column_dimensions
+from supergrep.sinks import SinkWorkbook
+from supergrep.workbook_templates import (
+    template_sheetnames, template_workbook)
+
+__all__ = ('StreamingWorkbook', 'StreamingWorksheet', 'open_output_workbook')
+
+
+class _TableWriteOnlyWorksheet(WriteOnlyWorksheet):
+    """Write-only worksheet that also writes its table parts
+
+    The write-only writer of openpyxl 2.4 saves the table definitions but
+    leaves them out of the sheet xml, so Excel never shows them.
+    """
+
+    def _write(self) -> str:
+        xml = super()._write()
+        if not self._tables:
+            return xml
+        table_parts = TablePartList()
+        for table in self._tables:
+            rel = Relationship(type=table._rel_type, Target='')
+            self._rels.append(rel)
+            table._rel_id = rel.Id
+            table_parts.append(Related(id=rel.Id))
+        return xml.replace(
+            '</worksheet>',
+            tostring(table_parts.to_tree()).decode() + '</worksheet>')
+
+
+class StreamingWorksheet:
+    """Cell addressed front for an openpyxl write-only worksheet
+
+    Sheet processors keep addressing cells as ``worksheet['B7']``. A row is
+    appended to the write-only worksheet, and dropped from memory, as soon
+    as a later row is addressed. The column widths, which a write-only
+    worksheet needs before its first row, are the ones recorded by
+    write_rows before it writes the cells.
+
+    Rows have to be addressed in ascending order, addressing a row that was
+    already streamed raises a ValueError.
+    """
+
+    def __init__(self, worksheet: Any) -> None:
+        self._worksheet = worksheet
+        self._rows = OrderedDict()  # type: Dict[int, Dict[int, Cell]]
+        self._header = dict()  # type: Dict[int, Cell]
+        self._streamed = 0
+
+    def __getitem__(self, coordinate: str) -> Cell:
+        return self.cell(coordinate)
+
+    def cell(self, coordinate: str = None, row: int = None,
+             column: int = None) -> Cell:
+        """Cell at a coordinate, or at a row and column index
+
+        :param coordinate:
+        :param row:
+        :param column:
+        :return:
+        """
+        if coordinate is not None:
+            column_letter, row = coordinate_from_string(coordinate)
+            column = column_index_from_string(column_letter)
+        if row <= self._streamed:
+            raise ValueError(
+                'Row {} of the {} sheet was already written'.format(
+                    row, self.title))
+        if row not in self._rows:
+            self._rows[row] = dict()
+            if row == 1:
+                self._header = self._rows[row]
+            self._stream(row)
+        cells = self._rows[row]
+        if column not in cells:
+            cells[column] = Cell(
+                self._worksheet, row=row, col_idx=column)
+        return cells[column]
+
+    @property
+    def title(self) -> str:
+        return self._worksheet.title
+
+    @property
+    def auto_filter(self) -> Any:
+        return self._worksheet.auto_filter
+
+    @auto_filter.setter
+    def auto_filter(self, value: Any) -> None:
+        self._worksheet.auto_filter = value
+
+    @property
+    def column_dimensions(self) -> Any:
+        return self._worksheet.column_dimensions
+
+    def add_table(self, table: Table) -> None:
+        """Add a table whose header row is the first row of the sheet
+
+        The column names are taken from the header cells, the write-only
+        worksheet cannot read them back when it is saved.
+
+        :param table:
+        """
+        table._initialise_columns()
+        min_col = range_boundaries(table.ref)[0]
+        for col_idx, column in enumerate(table.tableColumns, min_col):
+            if col_idx in self._header:
+                column.name = str(self._header[col_idx].value)
+        self._worksheet.add_table(table)
+
+    def close(self) -> None:
+        """Write the rows that are still held in memory"""
+        self._stream(None)
+
+    def _stream(self, current_row: Any) -> None:
+        """Append every held row before current_row (all when None)
+
+        :param current_row:
+        """
+        for row in list(self._rows):
+            if current_row is not None and row >= current_row:
+                break
+            if not self._streamed:
+                compute_column_dimensions(self)
+            self._append(row, self._rows.pop(row))
+
+    def _append(self, row: int, cells: Dict[int, Cell]) -> None:
+        """Append a row, padding the gaps left by the sheet processor
+
+        :param row:
+        :param cells:
+        """
+        for _ in range(self._streamed + 1, row):
+            self._worksheet.append([])
+        self._worksheet.append(
+            [cells.get(col_idx) for col_idx in range(1, max(cells or [0]) + 1)])
+        self._streamed = row
+
+
+class StreamingWorkbook:
+    """Write-only workbook with the sheets of a template workbook"""
+
+    def __init__(self, template_path: str = None) -> None:
+        self._workbook = Workbook(write_only=True)
+        self._sheets = OrderedDict()  # type: Dict[str, StreamingWorksheet]
+        if template_path is not None:
+            for name in template_sheetnames(template_path):
+                self.create_sheet(name)
+
+    def create_sheet(self, title: str) -> StreamingWorksheet:
+        """Appends a sheet to the workbook
+
+        :param title:
+        :return:
+        """
+        worksheet = _TableWriteOnlyWorksheet(
+            parent=self._workbook, title=title)
+        self._workbook._add_sheet(worksheet)
+        self._sheets[title] = StreamingWorksheet(worksheet)
+        return self._sheets[title]
+
+    def get_sheet_by_name(self, name: str) -> StreamingWorksheet:
+        return self._sheets[name]
+
+    def save(self, filename: str) -> None:
+        for worksheet in self._sheets.values():
+            worksheet.close()
+        self._workbook.save(filename)
+
+
+def open_output_workbook(template_path: str = None,
+                         stream: bool = True) -> Any:
+    """Open the workbook the sheet processors write into
+
+    A sink workbook when settings.output_format is not xlsx, a streaming
+    workbook when settings.write_only is set, a copy of the template
+    workbook otherwise (see template_workbook). Without a template the
+    workbook has no sheets, they are added with create_sheet.
+
+    :param template_path:
+    :param stream: False when the sheets do not write their rows in order,
+        the workbook is then never streamed
+    :return:
+    """
+    if settings.output_format != 'xlsx':
+        return SinkWorkbook(settings.output_format, template_path)
+    if settings.write_only and stream:
+        return StreamingWorkbook(template_path)
+    if template_path is None:
+        workbook = Workbook()
+        workbook.remove_sheet(workbook.active)
+        return workbook
+    return template_workbook(template_path)
@@ -1,12 +1,11 @@
 """Cage Details (3Par) Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOW_CAGE_TMPL = textwrap.dedent("""\
     Value Filldown Name (\S+)
@@ -32,6 +31,7 @@ SHOW_CAGE_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Cage Details (3Par) worksheet
 
@@ -41,22 +41,12 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name('Cage Details')
 
     headers = get_parser_header(SHOW_CAGE_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
 
     build_header(worksheet, headers)
 
     show_cage_out = run_parser_over(content, SHOW_CAGE_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, show_cage_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, show_cage_out)
 
     sheet_process_output(
         worksheet,
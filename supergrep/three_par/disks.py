@@ -1,12 +1,11 @@
 """Disks (3Par) Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOWPD_TMPL = textwrap.dedent("""\
     Value Filldown Name (\S+)
@@ -38,6 +37,7 @@ SHOWPD_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Disks (3Par) worksheet
 
@@ -47,23 +47,13 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name('Disks')
 
     headers = get_parser_header(SHOWPD_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
 
     headers[7], headers[8], headers[11] = 'Total(MB)', 'Free(MB)', 'Cap(GB)'
     build_header(worksheet, headers)
 
     show_pd_out = run_parser_over(content, SHOWPD_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, show_pd_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, show_pd_out)
 
     sheet_process_output(
         worksheet,
@@ -1,16 +1,14 @@
 """Hosts (3Par) Sheet"""
 import textwrap
-from collections import namedtuple
-from contextlib import suppress
-from operator import itemgetter
 from typing import Any
 
-from cytoolz import concat, groupby
+from cytoolz import concat, first
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.relational import column_key, inner_join, merge_pairs
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOWHOST_TMPL = textwrap.dedent("""\
     Value Filldown Name (\S+)
@@ -68,6 +66,7 @@ SHOWHOST_LINES_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Hosts (3Par) worksheet
 
@@ -81,32 +80,17 @@ def process(workbook: Any, content: str) -> None:
         get_parser_header(SHOWHOST_LINES_TMPL)[4:],
     ]))
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
-    show_hosts_out = groupby(
-        itemgetter(0, 1, 2, 3, 4), run_parser_over(content, SHOWHOST_TMPL))
-    show_hosts_lines_out = groupby(
-        itemgetter(0, 1, 2, 3), run_parser_over(content, SHOWHOST_LINES_TMPL))
-
-    rows = []
-    for idfier in show_hosts_out:
-        with suppress(KeyError):
-            for host_line, details_line in \
-                    zip(show_hosts_out[idfier], show_hosts_lines_out[idfier[:-1]]):
-                rows.append(host_line + details_line[4:])
-
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    show_hosts_out = run_parser_over(content, SHOWHOST_TMPL)
+    show_hosts_lines_out = run_parser_over(content, SHOWHOST_LINES_TMPL)
+
+    # each path of a host, with the details of the host
+    rows = list(merge_pairs(inner_join(
+        show_hosts_out, show_hosts_lines_out, column_key(0, 1, 2, 3),
+        pick=first), drop=4))
+
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -1,12 +1,11 @@
 """Ports (3Par) Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOWPORT_TMPL = textwrap.dedent("""\
     Value Filldown Name (\S+)
@@ -39,6 +38,7 @@ SHOWPORT_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Ports (3Par) worksheet
 
@@ -48,22 +48,12 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name('Ports')
 
     headers = get_parser_header(SHOWPORT_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
 
     build_header(worksheet, headers)
 
     show_ports_out = run_parser_over(content, SHOWPORT_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, show_ports_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, show_ports_out)
 
     sheet_process_output(
         worksheet,
@@ -1,12 +1,11 @@
 """Storage Array Summary (3Par) Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOWSYS_TMPL = textwrap.dedent("""\
     Value Name (\S+)
@@ -36,6 +35,7 @@ SHOWSYS_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Storage Array Summary (3Par) worksheet
 
@@ -45,22 +45,12 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name('Storage Array Summary')
 
     headers = get_parser_header(SHOWSYS_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
 
     build_header(worksheet, headers)
 
     showsys_out = run_parser_over(content, SHOWSYS_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, showsys_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, showsys_out)
 
     sheet_process_output(
         worksheet,
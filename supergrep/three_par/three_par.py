@@ -1,19 +1,24 @@
 """3Par command entry point"""
 import os
 
-from openpyxl import load_workbook
-
+from supergrep.instrumentation import stage
 from supergrep.parsing import raw_tar_content
-from supergrep.three_par.cage import process as cage
-from supergrep.three_par.cpg import process as cpg
-from supergrep.three_par.disks import process as disks
-from supergrep.three_par.hosts import process as hosts
-from supergrep.three_par.license_sheet import process as license_sheet
-from supergrep.three_par.nodes import process as nodes
-from supergrep.three_par.ports import process as ports
-from supergrep.three_par.storage_array_summary import process as storage_array_summary
-from supergrep.three_par.volumes import process as volumes
-from supergrep.utils import get_bundle_dir, get_relevant_content
+from supergrep.scheduler import prefetch_parsers, sheet_jobs
+from supergrep.streaming import open_output_workbook
+from supergrep.three_par.cage import SHOW_CAGE_TMPL, process as cage
+from supergrep.three_par.cpg import SHOWCPG_TMPL, process as cpg
+from supergrep.three_par.disks import SHOWPD_TMPL, process as disks
+from supergrep.three_par.hosts import (
+    SHOWHOST_TMPL, SHOWHOST_LINES_TMPL, process as hosts)
+from supergrep.three_par.license_sheet import (
+    SHOW_FEATURES_TMPL, process as license_sheet)
+from supergrep.three_par.nodes import SHOWNODE_TMPL, process as nodes
+from supergrep.three_par.ports import SHOWPORT_TMPL, process as ports
+from supergrep.three_par.storage_array_summary import (
+    SHOWSYS_TMPL, process as storage_array_summary)
+from supergrep.three_par.volumes import (
+    SHOWVV_TMPL, SHOWVV_CPG_TMPL, SHOWVLUN_TMPL, process as volumes)
+from supergrep.utils import ContentIndex, get_bundle_dir
 
 __all__ = ('main',)
 
@@ -26,7 +31,7 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\3par-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path)
 
     raw_content_patterns = (
         '*showsys.out',
@@ -46,46 +51,59 @@ def main(input_files: str, output_file: str) -> None:
     )
 
     raw_content = list(raw_tar_content(tuple(input_files), raw_content_patterns))
-
-    storage_array_summary_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[1],
-                      raw_content_patterns[2]), '*' * 20 + '\n')
-
-    disks_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[3]), '*' * 20 + '\n')
-
-    cage_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[4]), '*' * 20 + '\n')
-
-    ports_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[5]), '*' * 20 + '\n')
-
-    cpg_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[6]), '*' * 20 + '\n')
-
-    nodes_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[7]), '*' * 20 + '\n')
-
-    hosts_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[8]), '*' * 20 + '\n')
-
-    volumes_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[9],
-                      raw_content_patterns[10],
-                      raw_content_patterns[11]), '*' * 20 + '\n')
-
-    license_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[13],
-                      raw_content_patterns[12]), '*' * 20 + '\n')
+    content_index = ContentIndex(raw_content, raw_content_patterns)
+
+    storage_array_summary_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[1],
+         raw_content_patterns[2]), '*' * 20 + '\n')
+
+    disks_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[3]), '*' * 20 + '\n')
+
+    cage_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[4]), '*' * 20 + '\n')
+
+    ports_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[5]), '*' * 20 + '\n')
+
+    cpg_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[6]), '*' * 20 + '\n')
+
+    nodes_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[7]), '*' * 20 + '\n')
+
+    hosts_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[8]), '*' * 20 + '\n')
+
+    volumes_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[9],
+         raw_content_patterns[10],
+         raw_content_patterns[11]), '*' * 20 + '\n')
+
+    license_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[13],
+         raw_content_patterns[12]), '*' * 20 + '\n')
+
+    prefetch_parsers(
+        sheet_jobs(storage_array_summary_content, SHOWSYS_TMPL)
+        + sheet_jobs(disks_content, SHOWPD_TMPL)
+        + sheet_jobs(cage_content, SHOW_CAGE_TMPL)
+        + sheet_jobs(ports_content, SHOWPORT_TMPL)
+        + sheet_jobs(cpg_content, SHOWCPG_TMPL)
+        + sheet_jobs(nodes_content, SHOWNODE_TMPL)
+        + sheet_jobs(hosts_content, SHOWHOST_TMPL, SHOWHOST_LINES_TMPL)
+        + sheet_jobs(volumes_content, SHOWVV_TMPL, SHOWVV_CPG_TMPL,
+                     SHOWVLUN_TMPL)
+        + sheet_jobs(license_content, SHOW_FEATURES_TMPL))
 
     storage_array_summary(workbook, storage_array_summary_content)
     disks(workbook, disks_content)
@@ -97,4 +115,5 @@ def main(input_files: str, output_file: str) -> None:
     volumes(workbook, volumes_content)
     license_sheet(workbook, license_content)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
@@ -1,15 +1,14 @@
 """Volumes (3Par) Sheet"""
 import textwrap
-from collections import namedtuple
-from operator import itemgetter
 from typing import Any
 
-from cytoolz import concat, groupby
+from cytoolz import concat, first
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.relational import column_key, left_join, merge_pairs
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOWVV_TMPL = textwrap.dedent("""\
     Value Filldown Name (\S+)
@@ -93,6 +92,7 @@ SHOWVLUN_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Volumes (3Par) worksheet
 
@@ -107,34 +107,23 @@ def process(workbook: Any, content: str) -> None:
         get_parser_header(SHOWVLUN_TMPL)[3:],
     ]))
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
     build_header(worksheet, headers)
 
-    show_vv_out = groupby(
-        itemgetter(0, 1, 2), run_parser_over(content, SHOWVV_TMPL))
-    show_vv_cpg_out = groupby(
-        itemgetter(0, 1, 2), run_parser_over(content, SHOWVV_CPG_TMPL))
-    showv_lun_out = groupby(
-        itemgetter(0, 1, 2), run_parser_over(content, SHOWVLUN_TMPL))
-
-    rows = []  # type: list
-    for idfier in show_vv_out:
-        lun_out = showv_lun_out[idfier][0][3:] if \
-            idfier in showv_lun_out.keys() else ['']
-        for idx, entry in enumerate(show_vv_out[idfier]):
-            rows.append(
-                entry + show_vv_cpg_out[idfier][idx][4:] + lun_out)
-
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    show_vv_out = run_parser_over(content, SHOWVV_TMPL)
+    show_vv_cpg_out = run_parser_over(content, SHOWVV_CPG_TMPL)
+    showv_lun_out = run_parser_over(content, SHOWVLUN_TMPL)
+
+    # the CPGs of each volume by its name and id, then its first vlun
+    rows = merge_pairs(left_join(
+        show_vv_out, show_vv_cpg_out, column_key(0, 1, 2, 3),
+        default=[''] * len(get_parser_header(SHOWVV_CPG_TMPL)), pick=first),
+        drop=4)
+    rows = list(merge_pairs(left_join(
+        rows, showv_lun_out, column_key(0, 1, 2),
+        default=[''] * len(get_parser_header(SHOWVLUN_TMPL)), pick=first),
+        drop=3))
+
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -1,20 +1,27 @@
 """Various utilities"""
 import math
 import os
+import re
 import sys
 
-from fnmatch import fnmatch
+from collections import defaultdict
+from copy import copy
+from fnmatch import fnmatch, translate
+from functools import partial
 from logging import getLogger
-from operator import itemgetter
-from typing import Any, Callable, Iterable, List, Generator
+from os.path import normcase
+from typing import Any, Callable, Dict, Iterable, List, Generator
 
-from cytoolz.curried import (
-    compose, concat, drop, first, join, juxt, map, second, groupby)
+from cytoolz.curried import map, groupby, unique
 from openpyxl.styles import Alignment
+from openpyxl.utils import column_index_from_string, get_column_letter
 
+from supergrep.cache import (
+    DeferredText, join_members, member_text, text_size)
 from supergrep.formatting import (
-    add_worksheet_table, compute_column_dimensions, style_value_cell,
-    set_cell_to_number)
+    BOLD_FONT, add_worksheet_table, compute_column_dimensions,
+    style_value_cell, typed_column, widen_columns)
+from supergrep.instrumentation import instrumented_stage
 
 logger = getLogger(__name__)
 
@@ -34,6 +41,16 @@ def get_bundle_dir() -> str:
     return bundle_dir
 
 
+def matches_any(file_name: str, patterns: tuple) -> bool:
+    """Checks if a file name matches any of the patterns
+
+    :param file_name:
+    :param patterns:
+    :return:
+    """
+    return any(fnmatch(file_name, pattern) for pattern in patterns)
+
+
 def pattern_filter(raw_content: Iterable, patterns: tuple) -> list:
     """Filters the content by the file name if it matches any of the patterns
 
@@ -80,7 +97,7 @@ def get_relevant_content(
     :return:
     """
     ct = pattern_filter(raw_content, patterns)
-    return separator.join([content[1] for content in ct])
+    return separator.join([member_text(content[1]) for content in ct])
 
 
 def get_separated_content(
@@ -93,7 +110,7 @@ def get_separated_content(
     :return:
     """
     ct = pattern_filter(raw_content, patterns)
-    return [content[1] for content in ct]
+    return [member_text(content[1]) for content in ct]
 
 
 def relevant_content_file_join(
@@ -108,9 +125,151 @@ def relevant_content_file_join(
     :return:
     """
     ct = pattern_filter(raw_content, patterns)
-    return ['\n'.join(content) for content in ct]
+    return ['\n'.join((name, member_text(content))) for name, content in ct]
+
+
+class PartitionedContent(str):
+    """Content of several arrays, joined, that remembers each array's part
+
+    Reads as the joined content wherever a str is expected, the parsing
+    functions run the templates over every partition on its own so that
+    Filldown values never carry over from one array to the next.
+    """
+
+    def __new__(cls, partitions: list,
+                separator: str = '\n') -> 'PartitionedContent':
+        content = super().__new__(
+            cls, separator.join(member_text(text) for _, text in partitions))
+        content.partitions = tuple(partitions)
+        content.separator = separator
+        return content
+
+    def __getnewargs__(self) -> tuple:
+        return self.partitions, self.separator
+
+
+class ContentIndex:
+    """Raw content bucketed by file name pattern, built in a single pass
+
+    Answers the same queries as get_relevant_content, get_separated_content
+    and relevant_content_file_join (with the same ordering as pattern_filter)
+    without scanning every file again for every query.
+    """
+
+    @instrumented_stage('filter')
+    def __init__(self, raw_content: Iterable, patterns: tuple) -> None:
+        self._groups = dict()  # type: Dict[str, Dict[str, list]]
+        self._joined = dict()  # type: Dict[tuple, str]
+        self._partitioned = dict()  # type: Dict[tuple, PartitionedContent]
+        self._raw_content = list(raw_content)
+        self._patterns = ()  # type: tuple
+        self._index(tuple(unique(patterns)))
+
+    def _index(self, patterns: tuple) -> None:
+        """Buckets every file by top level directory and matched pattern
+
+        :param patterns:
+        """
+        compiled = [(pattern, re.compile(translate(normcase(pattern))))
+                    for pattern in patterns]
+        any_pattern = re.compile('|'.join(
+            '(?:{})'.format(regex.pattern) for _, regex in compiled))
+        for file_content in self._raw_content:
+            group = self._groups.setdefault(file_content[0].split('/')[0], {})
+            for pattern, _ in compiled:
+                group.setdefault(pattern, [])
+            name = normcase(file_content[0])
+            if not any_pattern.match(name):
+                continue
+            for pattern, regex in compiled:
+                if regex.match(name):
+                    group[pattern].append(file_content)
+        self._patterns += patterns
+
+    def matches(self, patterns: tuple) -> list:
+        """Returns the (file name, content) pairs matching the patterns
+
+        :param patterns:
+        :return:
+        """
+        missing = tuple(pattern for pattern in unique(patterns)
+                        if pattern not in self._patterns)
+        if missing:
+            self._index(missing)
+        return [file_content
+                for group in self._groups.values()
+                for pattern in patterns
+                for file_content in group.get(pattern, [])]
+
+    @instrumented_stage('filter')
+    def relevant(self, patterns: tuple, separator: str = '\n') -> str:
+        """Concatenated content of the matching files, memoised
+
+        :param patterns:
+        :param separator:
+        :return:
+        """
+        key = (patterns, separator)
+        if key not in self._joined:
+            self._joined[key] = join_members(
+                separator, [content[1] for content in self.matches(patterns)])
+        return self._joined[key]
+
+    @instrumented_stage('filter')
+    def partitioned(self, patterns: tuple,
+                    separator: str = '\n') -> 'PartitionedContent':
+        """Content of the matching files, kept apart per array, memoised
+
+        Each top level directory (a file name for the files at the root of
+        the input) is one partition, with the same text the directory adds
+        to relevant.
+
+        :param patterns:
+        :param separator:
+        :return:
+        """
+        key = (patterns, separator)
+        if key not in self._partitioned:
+            self.matches(patterns)
+            partitions = list()  # type: List[tuple]
+            for directory, group in self._groups.items():
+                contents = [content[1] for pattern in patterns
+                            for content in group.get(pattern, [])]
+                if contents:
+                    partitions.append(
+                        (directory, join_members(separator, contents)))
+            if any(isinstance(text, DeferredText) for _, text in partitions):
+                self._partitioned[key] = DeferredText(
+                    partial(PartitionedContent, partitions, separator), None,
+                    sum(text_size(text) for _, text in partitions)
+                    + len(separator) * (len(partitions) - 1),
+                    tuple(partitions))
+            else:
+                self._partitioned[key] = PartitionedContent(
+                    partitions, separator)
+        return self._partitioned[key]
 
+    @instrumented_stage('filter')
+    def separated(self, patterns: tuple) -> list:
+        """Content of the matching files
 
+        :param patterns:
+        :return:
+        """
+        return [member_text(content[1]) for content in self.matches(patterns)]
+
+    @instrumented_stage('filter')
+    def file_joined(self, patterns: tuple) -> list:
+        """Name of each matching file joined with its content
+
+        :param patterns:
+        :return:
+        """
+        return ['\n'.join((name, member_text(content)))
+                for name, content in self.matches(patterns)]
+
+
+@instrumented_stage('table')
 def sheet_process_output(
         worksheet: Any,
         table_name: str,
@@ -143,48 +302,6 @@ def sheet_process_output(
     compute_column_dimensions(worksheet)
 
 
-def join_flatten(nr_common_cols: int, unflattened_list: list) -> Any:
-    """Removes the common columns of the second list after a join operation on two lists
-
-    Concatenates the two lists after removal
-
-    :param nr_common_cols:
-    :param unflattened_list:
-    :return:
-    """
-    return map(
-        compose(
-            list,
-            concat,
-            juxt(
-                first,
-                compose(
-                    drop(nr_common_cols),
-                    second)))
-    )(unflattened_list)
-
-
-def multiple_join(common_columns: tuple, tables: list) -> Any:
-    """Applies join on multiple lists
-
-    Removes common columns by calling join_flatten
-
-    :param common_columns:
-    :param tables:
-    :return:
-    :raises ValueError:
-    """
-    if len(tables) < 2:
-        raise ValueError
-    rows = tables[0]
-    for i in range(1, len(tables)):
-        cmd_merged_out = join(
-            itemgetter(*common_columns), rows,
-            itemgetter(*common_columns), tables[i])
-        rows = join_flatten(len(common_columns), cmd_merged_out)
-    return rows
-
-
 # noinspection TaskProblemsInspection
 def multi(dispatch_fn: Callable) -> Callable:
     """Decorator that determines which version of a method should be called
@@ -286,35 +403,103 @@ def flatten_dict(unflattened: dict) -> Any:
     return build_dict(unflattened, flattened)
 
 
-def write_excel(
-        rows: Iterable,
+@instrumented_stage('write', rows=lambda result: max(result[1] - 1, 0))
+def write_rows(
         worksheet: Any,
-        RowTuple: Any,
-        start_col: str) -> tuple:
-    """Writes rows in excel from a specified start column
+        rows: Iterable,
+        start_col: str = 'A',
+        text_cols: str = '',
+        number_format: str = '0',
+        number_formats: Dict[str, str] = None,
+        bold_row: Callable = None) -> tuple:
+    """Writes rows under the header of a worksheet from a start column
+
+    Values are stripped, lists of values are written one per line in a
+    wrapped cell. Each column is then typed as a whole (see typed_column),
+    except column A and the text_cols columns which are kept as text. The
+    border, alignment, font and number format of a cell are set once per
+    combination and shared with the following cells.
 
-    :param rows:
     :param worksheet:
-    :param RowTuple:
+    :param rows:
     :param start_col:
-    :return:
+    :param text_cols: columns that are never typed as numbers, eg. 'BH'
+    :param number_format: number format of the number cells
+    :param number_formats: number format by column, eg. {'K': '0.00000'}
+    :param bold_row: predicate on a row, its cells are written in bold
+    :return: final column (as ord) and final row, zero when no rows
     """
+    rows = list(rows)
+    number_formats = number_formats or dict()
+    first_col = column_index_from_string(start_col)
+    bold_rows = [bold_row is not None and bold_row(row) for row in rows]
+    wrapped = set()  # type: set
+    lengths = defaultdict(int)  # type: Dict[int, int]
+    values = []  # type: List[list]
+    for row_n, row in enumerate(rows):
+        row_values = []
+        for col_n, col_value in enumerate(row):
+            if isinstance(col_value, (list, tuple)):
+                wrapped.add((row_n, col_n))
+                col_value = str.strip('\n'.join(col_value))
+            elif isinstance(col_value, str):
+                col_value = str.strip(col_value)
+            else:
+                col_value = str(col_value)
+            length = len(col_value) if '\n' not in col_value \
+                else max(map(len, col_value.split('\n')))
+            if length > lengths[col_n]:
+                lengths[col_n] = length
+            row_values.append(col_value)
+        values.append(row_values)
+    widen_columns(worksheet, dict(
+        (get_column_letter(first_col + col_n), length)
+        for col_n, length in lengths.items()))
+
+    cell_formats = []  # type: List[str]
+    for col_n in range(max(map(len, values), default=0)):
+        column = get_column_letter(first_col + col_n)
+        cell_formats.append(number_formats.get(column, number_format))
+        if column == 'A' or column in text_cols:
+            continue
+        column_values = iter(typed_column(
+            [row_values[col_n] for row_values in values
+             if col_n < len(row_values)]))
+        for row_values in values:
+            if col_n < len(row_values):
+                row_values[col_n] = next(column_values)
+
+    write_values = getattr(worksheet, 'write_values', None)
+    if write_values is not None:
+        # an output sink keeps only the values, see supergrep.sinks
+        for row_n, row_values in enumerate(values):
+            write_values(row_n + 2, first_col, row_values)
+        final_col = max((first_col + len(row_values) + 63
+                         for row_values in values if row_values), default=0)
+        return final_col, len(values) + 1 if values else 0
+
+    styles = dict()  # type: Dict[tuple, Any]
     final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord(start_col)):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            col_value = str(col_value) \
-                if not isinstance(col_value, str) else col_value
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
+    for row_n, (row_values, bold) in enumerate(zip(values, bold_rows)):
+        for col_n, col_value in enumerate(row_values):
+            cell = worksheet.cell(row=row_n + 2, column=first_col + col_n)
+            cell.value = col_value
+            style_key = (
+                cell_formats[col_n] if cell.data_type == 'n' else None,
+                (row_n, col_n) in wrapped, bold)
+            if style_key in styles:
+                cell._style = copy(styles[style_key])
             else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+                style_value_cell(cell)
+                if style_key[0]:
+                    cell.number_format = style_key[0]
+                if style_key[1]:
+                    cell.alignment = Alignment(wrapText=True)
+                if bold:
+                    cell.font = BOLD_FONT
+                styles[style_key] = copy(cell._style)
+            final_col = max(final_col, first_col + col_n + 64)
+        final_row = row_n + 2
     return final_col, final_row
 
 
@@ -1,13 +1,12 @@
 """Access_view parser"""
 
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 ACSVW_TMPL = textwrap.dedent("""\
     Value Filldown,Required SymmetrixID (\d+)
@@ -26,6 +25,7 @@ ACSVW_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process access_view worksheet
 
@@ -36,21 +36,11 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(ACSVW_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
 
     access_view_out = run_parser_over(content, ACSVW_TMPL)
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, access_view_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, access_view_out)
 
     sheet_process_output(
         worksheet,
@@ -1,15 +1,12 @@
 """device_name_list parser"""
 
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from cytoolz.curried import map
-
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 DEVNM_TMPL = textwrap.dedent("""\
     Value Filldown,Required SymmetrixID (\d+)
@@ -28,6 +25,7 @@ DEVNM_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process device_name_list worksheet
 
@@ -38,22 +36,12 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(DEVNM_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
     device_name_list_out = run_parser_over(content, DEVNM_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, device_name_list_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            if chr(col_n) != 'B':
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, device_name_list_out, text_cols='B')
 
     sheet_process_output(
         worksheet,
@@ -1,15 +1,14 @@
 """Dskgrp_summary parser"""
 
 import textwrap
-from collections import namedtuple
 from typing import Any
 
 from openpyxl.comments import Comment
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 DSKRGP_TMPL = textwrap.dedent("""\
     Value Filldown,Required SymmetrixID (\d+)
@@ -41,6 +40,7 @@ legend = textwrap.dedent("""
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process dskgrp_summary worksheet
 
@@ -51,7 +51,6 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(DSKRGP_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     headers[5], headers[6], headers[8] = \
         'diskspeed(RPM)', 'disksize(MB)', 'totalcapacity(MB)'
@@ -59,16 +58,7 @@ def process(workbook: Any, content: str) -> None:
     worksheet['E1'].comment = Comment(legend, '')
 
     dskgrp_summary_out = run_parser_over(content, DSKRGP_TMPL)
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, dskgrp_summary_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, dskgrp_summary_out)
 
     sheet_process_output(
         worksheet,
@@ -1,17 +1,14 @@
 """thin_devices parser"""
 
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from cytoolz.curried import map
 from openpyxl.comments import Comment
-from openpyxl.styles import Alignment
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 legend = textwrap.dedent("""
     Legend:
@@ -52,6 +49,7 @@ THNDEV_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process thin_devices worksheet
 
@@ -62,28 +60,14 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(THNDEV_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
     worksheet['D1'].comment = Comment(legend, '')
 
     thin_devices_out = run_parser_over(content, THNDEV_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, thin_devices_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            style_value_cell(cell)
-            if chr(col_n) != 'B':
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, thin_devices_out, text_cols='B')
 
     sheet_process_output(
         worksheet,
@@ -1,21 +1,25 @@
 """VMAX command entry point"""
 import os
 
-from openpyxl import load_workbook
-
+from supergrep.instrumentation import stage
 from supergrep.parsing import load_raw_content
-from supergrep.utils import get_bundle_dir, get_relevant_content, relevant_content_file_join
-from supergrep.vmax.access_initiator import process as access_initiator
-from supergrep.vmax.access_view import process as access_view
+from supergrep.scheduler import prefetch_parsers, sheet_jobs
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
+from supergrep.vmax.access_initiator import (
+    ACSINIT_TMPL, process as access_initiator)
+from supergrep.vmax.access_view import ACSVW_TMPL, process as access_view
 from supergrep.vmax.backend import process as backend
-from supergrep.vmax.device_name_list import process as device_name_list
+from supergrep.vmax.device_name_list import (
+    DEVNM_TMPL, process as device_name_list)
 from supergrep.vmax.disks import process as disks
-from supergrep.vmax.dskgrp_summary import process as dskgrp_summary
-from supergrep.vmax.list_wwn import process as list_wwn
+from supergrep.vmax.dskgrp_summary import (
+    DSKRGP_TMPL, process as dskgrp_summary)
+from supergrep.vmax.list_wwn import LSTWWN_TMPL, process as list_wwn
 from supergrep.vmax.requests import process as requests
-from supergrep.vmax.symcfg_list import process as symcfg_list
-from supergrep.vmax.symdev_info import process as symdev_info
-from supergrep.vmax.thin_devices import process as thin_devices
+from supergrep.vmax.symcfg_list import SYMCFG_TMPL, process as symcfg_list
+from supergrep.vmax.symdev_info import SYMDEV_TMPL, process as symdev_info
+from supergrep.vmax.thin_devices import THNDEV_TMPL, process as thin_devices
 
 __all__ = ('main',)
 
@@ -28,7 +32,7 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\vmax-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path)
 
     raw_content_patterns = (
         '*_symcfg_list.txt',
@@ -45,29 +49,40 @@ def main(input_files: str, output_file: str) -> None:
     )
 
     raw_content = load_raw_content(tuple(input_files), raw_content_patterns)
-    symcfg_list_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0], ))
+    content_index = ContentIndex(raw_content, raw_content_patterns)
+    symcfg_list_content = content_index.relevant(
+        (raw_content_patterns[0], ))
+
+    symdev_info_content = content_index.relevant(
+        (raw_content_patterns[1], ), '*' * 20)
 
-    symdev_info_content = get_relevant_content(
-        raw_content, (raw_content_patterns[1], ), '*' * 20)
+    dskgrp_summary_content = content_index.relevant(
+        (raw_content_patterns[2],))
 
-    dskgrp_summary_content = get_relevant_content(
-        raw_content, (raw_content_patterns[2],))
+    access_view_content = content_index.relevant(
+        (raw_content_patterns[3], ), '*' * 20)
 
-    access_view_content = get_relevant_content(
-        raw_content, (raw_content_patterns[3], ), '*' * 20)
+    access_initiator_content = content_index.relevant(
+        (raw_content_patterns[4], ))
 
-    access_initiator_content = get_relevant_content(
-        raw_content, (raw_content_patterns[4], ))
+    thin_devices_content = content_index.relevant(
+        (raw_content_patterns[5], ))
 
-    thin_devices_content = get_relevant_content(
-        raw_content, (raw_content_patterns[5], ))
+    device_name_content = content_index.relevant(
+        (raw_content_patterns[6], ), '*' * 20)
 
-    device_name_content = get_relevant_content(
-        raw_content, (raw_content_patterns[6], ), '*' * 20)
+    list_wwn_content = content_index.relevant(
+        (raw_content_patterns[7], ), '*' * 20)
 
-    list_wwn_content = get_relevant_content(
-        raw_content, (raw_content_patterns[7], ), '*' * 20)
+    prefetch_parsers(
+        sheet_jobs(symcfg_list_content, SYMCFG_TMPL)
+        + sheet_jobs(symdev_info_content, SYMDEV_TMPL)
+        + sheet_jobs(dskgrp_summary_content, DSKRGP_TMPL)
+        + sheet_jobs(access_view_content, ACSVW_TMPL)
+        + sheet_jobs(access_initiator_content, ACSINIT_TMPL)
+        + sheet_jobs(thin_devices_content, THNDEV_TMPL)
+        + sheet_jobs(device_name_content, DEVNM_TMPL)
+        + sheet_jobs(list_wwn_content, LSTWWN_TMPL))
 
     symcfg_list(workbook, symcfg_list_content)
     symdev_info(workbook, symdev_info_content)
@@ -78,32 +93,35 @@ def main(input_files: str, output_file: str) -> None:
     device_name_list(workbook, device_name_content)
     list_wwn(workbook, list_wwn_content)
 
-    backend_content = relevant_content_file_join(
-        raw_content, (raw_content_patterns[8], ))
+    backend_content = content_index.file_joined(
+        (raw_content_patterns[8], ))
 
-    disks_content = relevant_content_file_join(
-        raw_content, (raw_content_patterns[9], ))
+    disks_content = content_index.file_joined(
+        (raw_content_patterns[9], ))
 
-    requests_content = relevant_content_file_join(
-        raw_content, (raw_content_patterns[10], ))
+    requests_content = content_index.file_joined(
+        (raw_content_patterns[10], ))
 
     if len(backend_content) > 1:
         output_wb = output_file.split(os.sep)
+        extension = os.path.splitext(output_file)[1]
         template_path = os.path.join(
             get_bundle_dir(), r'resources\vmax-performance-template.xlsx')
         for back_ct, disks_ct, requests_ct \
                 in zip(backend_content, disks_content, requests_content):
-            perf_workbook = load_workbook(template_path)
+            perf_workbook = open_output_workbook(template_path)
             output_wb[-1] = back_ct.split('_')[0]
-            perf_output = os.sep.join(output_wb) + '_perf.xlsx'
+            perf_output = os.sep.join(output_wb) + '_perf' + extension
             backend(perf_workbook, back_ct)
             disks(perf_workbook, disks_ct)
             requests(perf_workbook, requests_ct)
 
-            perf_workbook.save(perf_output)
+            with stage('save'):
+                perf_workbook.save(perf_output)
     else:
         backend(workbook, backend_content[0])
         disks(workbook, disks_content[0])
         requests(workbook, requests_content[0])
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
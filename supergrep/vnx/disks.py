@@ -1,16 +1,14 @@
 """Disks sheet"""
 import textwrap
-from collections import namedtuple
 from operator import itemgetter
 from typing import Any
 
 from cytoolz.curried import unique
-from openpyxl.styles import Alignment
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import capacity_conversion, check_empty_arrays
 
 GETDISK_TMPL = textwrap.dedent("""\
@@ -75,6 +73,7 @@ GETDISK_TMPL = textwrap.dedent("""\
 
 
 # noinspection TaskProblemsInspection
+@sheet_stage
 def process(workbook: Any, content: str) -> list:
     """Process Disks worksheet
 
@@ -85,7 +84,6 @@ def process(workbook: Any, content: str) -> list:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(GETDISK_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
 
@@ -96,23 +94,8 @@ def process(workbook: Any, content: str) -> list:
     for row in cmd_disks_out:
         row[7] = capacity_conversion(row[6])
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, cmd_disks_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = str.strip('\n'.join(col_value))
-            style_value_cell(cell)
-            if chr(col_n) == 'H':
-                set_cell_to_number(cell, '0.00000')
-            else:
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, cmd_disks_out, number_formats={'H': '0.00000'})
 
     sheet_process_output(
         worksheet,
@@ -4,13 +4,13 @@ from operator import itemgetter
 
 from cytoolz.curried import map, groupby
 from openpyxl import Workbook
-from openpyxl.styles import Font
 
-from supergrep.formatting import (
-    build_header, style_value_cell, set_cell_to_number)
-from supergrep.utils import sheet_process_output
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, write_rows
 
 
+@sheet_stage
 def process(workbook: Workbook, content: list) -> None:
     """Process DisksPivot worksheet
 
@@ -51,21 +51,10 @@ def process(workbook: Workbook, content: list) -> None:
         type_rows += [[row_type] + list(map(str, type_sum)), *array_rows]
 
     type_rows += [['Grand Total'] + grand_total]
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(TypeTuple._make, type_rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            col_value = str(col_value) \
-                if not isinstance(col_value, str) else col_value
-            cell.value = col_value
-            style_value_cell(cell)
-            if row_tuple.ArrayName \
-                    in [sg for sg in type_groups.keys()] + ['Grand Total']:
-                cell.font = Font(bold=True, size=11)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    type_bold_rows = list(type_groups) + ['Grand Total']
+    final_col, final_row = write_rows(
+        worksheet, map(TypeTuple._make, type_rows),
+        bold_row=lambda row: row.ArrayName in type_bold_rows)
 
     sheet_process_output(
         worksheet,
@@ -88,21 +77,10 @@ def process(workbook: Workbook, content: list) -> None:
         speed_rows += [[speed] + list(map(str, speed_sum)), *array_rows]
 
     speed_rows += [['Grand Total'] + speed_total]
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(SpeedTuple._make, speed_rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('E')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            col_value = str(col_value) \
-                if not isinstance(col_value, str) else col_value
-            cell.value = col_value
-            style_value_cell(cell)
-            if row_tuple.SpeedArrayName \
-                    in [pg for pg in speed_groups.keys()] + ['Grand Total']:
-                cell.font = Font(bold=True, size=11)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    speed_bold_rows = list(speed_groups) + ['Grand Total']
+    final_col, final_row = write_rows(
+        worksheet, map(SpeedTuple._make, speed_rows), start_col='E',
+        bold_row=lambda row: row.SpeedArrayName in speed_bold_rows)
 
     sheet_process_output(
         worksheet,
@@ -4,14 +4,14 @@ from operator import itemgetter
 
 from cytoolz.curried import map, groupby
 from openpyxl import Workbook
-from openpyxl.styles import Font
 
-from supergrep.formatting import build_header, style_value_cell, \
-    set_cell_to_number
-from supergrep.utils import sheet_process_output
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, write_rows
 
 
 # noinspection TaskProblemsInspection
+@sheet_stage
 def process(workbook: Workbook, content: list) -> None:
     """Process InitiatorType worksheet
 
@@ -43,20 +43,9 @@ def process(workbook: Workbook, content: list) -> None:
             array_rows.append(map(str, row))
         initiator_rows += [[array_type] + [str(total_initiators)], *array_rows]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, initiator_rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            col_value = str(col_value) \
-                if not isinstance(col_value, str) else col_value
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            if row_tuple.ArrayName in type_groups.keys():
-                cell.font = Font(bold=True, size=11)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, map(RowTuple._make, initiator_rows),
+        bold_row=lambda row: row.ArrayName in type_groups)
 
     sheet_process_output(
         worksheet,
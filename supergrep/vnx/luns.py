@@ -1,15 +1,15 @@
 """LUNs sheet"""
 import textwrap
-from collections import namedtuple
 from operator import itemgetter
 from typing import Any
 
-from cytoolz.curried import unique
+from cytoolz.curried import last, unique
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.relational import column_key, left_join
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import (
     capacity_conversion, check_empty_arrays, get_luns)
 
@@ -62,6 +62,7 @@ GETLUN_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str, sg_data: list) -> list:
     """Process LUNs worksheet
 
@@ -73,7 +74,6 @@ def process(workbook: Any, content: str, sg_data: list) -> list:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(GETLUN_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
 
@@ -83,32 +83,18 @@ def process(workbook: Any, content: str, sg_data: list) -> list:
 
     expanded_luns = [[*entry[:-1], get_luns(entry[-1])] for entry in sg_data]
 
-    sg_dict = {}  # type: dict
-    for entry in expanded_luns:
-        for lun in entry[-1]:
-            sg_dict[entry[0], lun[1]] = entry[1], lun[0]
-
-    for row in cmd_getlun_out:
-        if (row[0], row[1]) in sg_dict.keys():
-            row[3], row[4] = sg_dict[row[0], row[1]][0], \
-                             sg_dict[row[0], row[1]][1]
-        else:
-            row[3], row[4] = ('No Storage Group Found', '')
+    # array, ALU, storage group, HLU of each LUN in a storage group
+    group_luns = [(entry[0], lun[1], entry[1], lun[0])
+                  for entry in expanded_luns for lun in entry[-1]]
+
+    for row, group_lun in left_join(
+            cmd_getlun_out, group_luns, column_key(0, 1),
+            default=(None, None, 'No Storage Group Found', ''), pick=last):
+        row[3], row[4] = group_lun[2:]
         row[12] = capacity_conversion(row[11])
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, cmd_getlun_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            if chr(col_n) == 'K':
-                set_cell_to_number(cell, '0.00000')
-            else:
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, cmd_getlun_out, number_formats={'K': '0.00000'})
 
     sheet_process_output(
         worksheet,
@@ -4,13 +4,13 @@ from operator import itemgetter
 
 from cytoolz.curried import map, groupby
 from openpyxl import Workbook
-from openpyxl.styles import Font
 
-from supergrep.formatting import (
-    build_header, style_value_cell, set_cell_to_number)
-from supergrep.utils import sheet_process_output
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, write_rows
 
 
+@sheet_stage
 def process(workbook: Workbook, content: list) -> None:
     """Process LUNsPivot worksheet
 
@@ -51,21 +51,10 @@ def process(workbook: Workbook, content: list) -> None:
         state_rows += [[state] + [str(state_sum)], *array_rows]
 
     state_rows += [['Grand Total', str(grand_total)]]
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(StateTuple._make, state_rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            col_value = str(col_value) \
-                if not isinstance(col_value, str) else col_value
-            cell.value = col_value
-            style_value_cell(cell)
-            if row_tuple.ArrayName \
-                    in [sg for sg in state_groups.keys()] + ['Grand Total']:
-                cell.font = Font(bold=True, size=11)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    state_bold_rows = list(state_groups) + ['Grand Total']
+    final_col, final_row = write_rows(
+        worksheet, map(StateTuple._make, state_rows),
+        bold_row=lambda row: row.ArrayName in state_bold_rows)
 
     sheet_process_output(
         worksheet,
@@ -88,21 +77,10 @@ def process(workbook: Workbook, content: list) -> None:
         private_rows += [[private] + list(map(str, private_sum)), *array_rows]
 
     private_rows += [['Grand Total'] + private_total]
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(PrivateTuple._make, private_rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('D')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            col_value = str(col_value) \
-                if not isinstance(col_value, str) else col_value
-            cell.value = col_value
-            style_value_cell(cell)
-            if row_tuple.PrivateArrayName \
-                    in [pg for pg in private_groups.keys()] + ['Grand Total']:
-                cell.font = Font(bold=True, size=11)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    private_bold_rows = list(private_groups) + ['Grand Total']
+    final_col, final_row = write_rows(
+        worksheet, map(PrivateTuple._make, private_rows), start_col='D',
+        bold_row=lambda row: row.PrivateArrayName in private_bold_rows)
 
     sheet_process_output(
         worksheet,
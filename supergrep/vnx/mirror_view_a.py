@@ -1,15 +1,14 @@
 """MirrorView-A Sheet"""
 import textwrap
-from collections import namedtuple
 from operator import itemgetter
 from typing import Any
 
 from cytoolz.curried import unique
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import take_array_names, check_empty_arrays
 
 MIRROR_VIEW_A_TMPL = textwrap.dedent("""\
@@ -55,6 +54,7 @@ MIRROR_VIEW_A_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str, array_names: dict) -> None:
     """Process MirrorView-A worksheet
 
@@ -66,24 +66,13 @@ def process(workbook: Any, content: str, array_names: dict) -> None:
 
     headers = get_parser_header(MIRROR_VIEW_A_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     cmd_mirror_view_a_out = check_empty_arrays(take_array_names(
         array_names, run_parser_over(content, MIRROR_VIEW_A_TMPL)))
 
     rows = unique(cmd_mirror_view_a_out, key=itemgetter(0))
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -1,16 +1,14 @@
 """RAID-Groups sheet"""
 import textwrap
-from collections import namedtuple
 from operator import itemgetter
 from typing import Any
 
 from cytoolz.curried import unique
-from openpyxl.styles import Alignment
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import capacity_conversion, check_empty_arrays
 
 GETRG_TMPL = textwrap.dedent("""\
@@ -62,6 +60,7 @@ GETRG_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process RAID-Groups worksheet
 
@@ -72,7 +71,6 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(GETRG_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
 
@@ -83,23 +81,8 @@ def process(workbook: Any, content: str) -> None:
     for row in cmd_getrg_out:
         row[9] = capacity_conversion(row[8], conversion_factor=2147483648)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, cmd_getrg_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = str.strip('\n'.join(col_value))
-            style_value_cell(cell)
-            if chr(col_n) == 'J':
-                set_cell_to_number(cell, '0.00000')
-            else:
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(
+        worksheet, cmd_getrg_out, number_formats={'J': '0.00000'})
 
     sheet_process_output(
         worksheet,
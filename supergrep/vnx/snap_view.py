@@ -1,12 +1,11 @@
 """SnapView Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import take_array_names, check_empty_arrays
 
 SNAP_VIEW_TMPL = textwrap.dedent("""\
@@ -58,6 +57,7 @@ SNAP_VIEW_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str, array_names: dict) -> None:
     """Process SnapView worksheet
 
@@ -69,23 +69,12 @@ def process(workbook: Any, content: str, array_names: dict) -> None:
 
     headers = get_parser_header(SNAP_VIEW_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     snap_view_out = check_empty_arrays(take_array_names(
         array_names, run_parser_over(content, SNAP_VIEW_TMPL)))
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, snap_view_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, snap_view_out)
 
     sheet_process_output(
         worksheet,
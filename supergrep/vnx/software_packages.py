@@ -1,15 +1,14 @@
 """Software Packages sheet"""
 import textwrap
-from collections import namedtuple
 from operator import itemgetter
 from typing import Any
 
 from cytoolz.curried import unique
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import check_empty_arrays
 
 NDU_TMPL = textwrap.dedent("""\
@@ -44,6 +43,7 @@ NDU_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Software-Packages worksheet
 
@@ -54,25 +54,17 @@ def process(workbook: Any, content: str) -> None:
     worksheet = workbook.get_sheet_by_name(worksheet_name)
 
     headers = get_parser_header(NDU_TMPL)
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
 
     cmd_ndu_out = run_parser_over(content, NDU_TMPL)
     cmd_ndu_out = check_empty_arrays(
         list(unique(cmd_ndu_out, key=itemgetter(0, 1))))
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, cmd_ndu_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            if cell.value != '-':
-                cell.value = str.strip(col_value, '-')
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    cmd_ndu_out = [
+        [col_value if str.strip(col_value) == '-'
+         else str.strip(col_value, '-') for col_value in row]
+        for row in cmd_ndu_out]
+    final_col, final_row = write_rows(worksheet, cmd_ndu_out)
 
     sheet_process_output(
         worksheet,
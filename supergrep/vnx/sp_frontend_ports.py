@@ -1,16 +1,15 @@
 """SP Frontend Ports Sheet"""
 import textwrap
-from collections import namedtuple
 from operator import itemgetter
 
 from cytoolz.curried import (
     compose, concat, drop, first, join, juxt, map, second, unique)
 from openpyxl import Workbook
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import run_parser_over, get_parser_header
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import check_empty_arrays
 
 PORT_TMPL = textwrap.dedent("""\
@@ -65,6 +64,7 @@ SPPORTSPEED_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Workbook, content: str) -> list:
     """Process SP-Frontend-Ports worksheet
 
@@ -79,7 +79,6 @@ def process(workbook: Workbook, content: str) -> list:
         get_parser_header(PORT_TMPL),
         get_parser_header(SPPORTSPEED_TMPL)[3:],
     ]))
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
 
     build_header(worksheet, headers)
 
@@ -103,16 +102,7 @@ def process(workbook: Workbook, content: str) -> list:
     )(cmd_merged_out)
     rows = check_empty_arrays(list(unique(rows, key=common_columns_getter)))
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
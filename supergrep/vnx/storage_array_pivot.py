@@ -4,13 +4,13 @@ from operator import itemgetter
 
 from cytoolz.curried import map, groupby
 from openpyxl import Workbook
-from openpyxl.styles import Font
 
-from supergrep.formatting import \
-    (build_header, style_value_cell, set_cell_to_number)
-from supergrep.utils import sheet_process_output, write_excel
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, write_rows
 
 
+@sheet_stage
 def process(workbook: Workbook, content: tuple) -> None:
     """Process StorageArrayPivot worksheet
 
@@ -29,10 +29,6 @@ def process(workbook: Workbook, content: tuple) -> None:
 
     SpeedTuple = namedtuple(
         'RowTuple', speed_header)  # pylint: disable=invalid-name
-    ModelTuple = namedtuple(
-        'RowTuple', model_header)  # pylint: disable=invalid-name
-    RevisionTuple = namedtuple(
-        'RowTuple', model_header)  # pylint: disable=invalid-name
 
     build_header(worksheet, speed_header)
     build_header(worksheet, model_header, 'F')
@@ -61,21 +57,10 @@ def process(workbook: Workbook, content: tuple) -> None:
         speed_rows += [[speed] + list(map(str, total_initiators)), *array_rows]
 
     speed_rows += [['Grand Total'] + grand_total]
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(SpeedTuple._make, speed_rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            col_value = str(col_value) \
-                if not isinstance(col_value, str) else col_value
-            cell.value = col_value
-            style_value_cell(cell)
-            if row_tuple.ArrayName \
-                    in [sg for sg in speed_groups.keys()] + ['Grand Total']:
-                cell.font = Font(bold=True, size=11)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    speed_bold_rows = list(speed_groups) + ['Grand Total']
+    final_col, final_row = write_rows(
+        worksheet, map(SpeedTuple._make, speed_rows),
+        bold_row=lambda row: row.ArrayName in speed_bold_rows)
 
     sheet_process_output(
         worksheet,
@@ -86,7 +71,7 @@ def process(workbook: Workbook, content: tuple) -> None:
 
     model_rows = [(key, len(val)) for key, val in content[1].items()]
     model_rows.append(('Total', sum([row[1] for row in model_rows])))
-    final_col, final_row = write_excel(model_rows, worksheet, ModelTuple, 'F')
+    final_col, final_row = write_rows(worksheet, model_rows, start_col='F')
     sheet_process_output(
         worksheet,
         'ModelTable',
@@ -97,8 +82,7 @@ def process(workbook: Workbook, content: tuple) -> None:
 
     revision_rows = [(key, len(val)) for key, val in content[2].items()]
     revision_rows.append(('Total', sum([row[1] for row in revision_rows])))
-    final_col, final_row = write_excel(
-        revision_rows, worksheet, RevisionTuple, 'I')
+    final_col, final_row = write_rows(worksheet, revision_rows, start_col='I')
     sheet_process_output(
         worksheet,
         'RevisionTable',
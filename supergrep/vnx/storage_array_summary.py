@@ -1,15 +1,15 @@
 """Storage Array Summary Sheet"""
 import textwrap
-from collections import namedtuple, defaultdict
+from collections import defaultdict
 from operator import itemgetter
 from typing import Any
 
 from cytoolz.curried import concat, unique, compose, groupby
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import check_empty_arrays
 
 ARRAY_NAME_TMPL = textwrap.dedent("""\
@@ -81,6 +81,7 @@ GET_AGENT_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> tuple:
     """Process Storage-Array-Summary worksheet
 
@@ -97,7 +98,6 @@ def process(workbook: Any, content: str) -> tuple:
         get_parser_header(GET_ARRAY_UID_TMPL),
         get_parser_header(GET_AGENT_TMPL)
     ]))
-    RowTuple = namedtuple('RowTuple', headers)   # pylint: disable=invalid-name
 
     build_header(worksheet, headers)
 
@@ -116,18 +116,9 @@ def process(workbook: Any, content: str) -> tuple:
 
     array_names = defaultdict(str)    # type: defaultdict
     rows = check_empty_arrays(list(unique(cmd_out, key=itemgetter(0, 1))))
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        array_names[worksheet['Q{}'.format(row_n)].value] = \
-            worksheet['A{}'.format(row_n)].value
-        final_row = row_n
+    for row in rows:
+        array_names[str.strip(row[16])] = str.strip(row[0])
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -3,20 +3,17 @@
 # pylint: disable=anomalous-backslash-in-string, too-many-locals
 
 import textwrap
-from collections import namedtuple
-from fnmatch import fnmatch
 from operator import itemgetter
 from typing import Any
 
 from cytoolz.curried import (
-    compose, concat, drop, first, groupby,
-    join, juxt, last, map, second, valmap, unique)
-from openpyxl.styles import Alignment  # pylint: disable=import-error
+    compose, concat, first, groupby, juxt, last, map, second, valmap, unique)
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import run_parser_over, get_parser_header
-from supergrep.utils import sheet_process_output
+from supergrep.relational import anti_join, column_key, inner_join, merge_pairs
+from supergrep.utils import sheet_process_output, write_rows
 from supergrep.vnx.utils import check_empty_arrays
 
 STORAGEGROUP_TMPL = textwrap.dedent("""\
@@ -83,6 +80,7 @@ PORT_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> Any:
     """Process Storage-Groups worksheet
 
@@ -98,7 +96,6 @@ def process(workbook: Any, content: str) -> Any:
         get_parser_header(PORT_TMPL),
         get_parser_header(STORAGEGROUP_TMPL)[3:],
     ]))
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
 
     build_header(worksheet, headers)
 
@@ -120,51 +117,17 @@ def process(workbook: Any, content: str) -> Any:
             second)
     )(server_names_grouped.items())
 
-    common_columns_getter = itemgetter(*common_columns)
-    cmd_merged_out = join(
-        common_columns_getter, cmd_port_relevant,
-        common_columns_getter, cmd_storagegroup_out)
-
-    cmd_merged_out = sorted(cmd_merged_out)
-
-    rows = list(map(
-        compose(
-            list,
-            concat,
-            juxt(
-                first,
-                compose(
-                    drop(3),
-                    second)))
-    )(cmd_merged_out))
-
-    portcmd = {(array, grp) for array, grp, *other in rows}
-    strgp = {(array, grp) for array, grp, *other in cmd_storagegroup_out}
-    no_server_groups = strgp - portcmd
-
-    storage_list = list(filter(
-        lambda storage_gr: any(
-            fnmatch(str((storage_gr[0], storage_gr[1])), str(ctrlServer))
-            for ctrlServer in no_server_groups),
-        cmd_storagegroup_out))
+    group_key = column_key(*common_columns)
+    rows = sorted(merge_pairs(
+        inner_join(cmd_port_relevant, cmd_storagegroup_out, group_key),
+        drop=3))
+
+    storage_list = list(anti_join(cmd_storagegroup_out, rows, group_key))
 
     storage_list = check_empty_arrays(
         list(unique(storage_list + rows, key=itemgetter(0, 1))))
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, storage_list), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, storage_list)
 
     sheet_process_output(
         worksheet,
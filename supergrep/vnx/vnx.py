@@ -1,26 +1,35 @@
 """VNX command entry point"""
 import os
 
-from openpyxl import load_workbook
-
+from supergrep.instrumentation import stage
 from supergrep.parsing import load_raw_content
-from supergrep.utils import get_bundle_dir, get_relevant_content
-from supergrep.vnx.disks import process as disks
+from supergrep.scheduler import prefetch_parsers, sheet_jobs
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
+from supergrep.vnx.disks import GETDISK_TMPL, process as disks
 from supergrep.vnx.disks_pivot import process as disks_pivot
 from supergrep.vnx.initiator_type_pivot import process as initiator_type_pivot
 from supergrep.vnx.lun_storage_pivot import process as lun_storage_pivot
-from supergrep.vnx.luns import process as luns
+from supergrep.vnx.luns import GETLUN_TMPL, process as luns
 from supergrep.vnx.luns_pivot import process as luns_pivot
-from supergrep.vnx.mirror_view_a import process as mirror_view_a
-from supergrep.vnx.mirror_view_s import process as mirror_view_s
-from supergrep.vnx.raid_groups import process as raid_groups
-from supergrep.vnx.snap_clones import process as snap_clones
-from supergrep.vnx.snap_view import process as snap_view
-from supergrep.vnx.software_packages import process as software_packages
-from supergrep.vnx.sp_frontend_ports import process as sp_frontend_ports
+from supergrep.vnx.mirror_view_a import (
+    MIRROR_VIEW_A_TMPL, process as mirror_view_a)
+from supergrep.vnx.mirror_view_s import (
+    MIRROR_VIEW_S_TMPL, process as mirror_view_s)
+from supergrep.vnx.raid_groups import GETRG_TMPL, process as raid_groups
+from supergrep.vnx.snap_clones import (
+    SNAP_CLONES_TMPL, process as snap_clones)
+from supergrep.vnx.snap_view import SNAP_VIEW_TMPL, process as snap_view
+from supergrep.vnx.software_packages import (
+    NDU_TMPL, process as software_packages)
+from supergrep.vnx.sp_frontend_ports import (
+    PORT_TMPL, SPPORTSPEED_TMPL, process as sp_frontend_ports)
 from supergrep.vnx.storage_array_pivot import process as storage_array_pivot
-from supergrep.vnx.storage_array_summary import process as storage_array_summary
-from supergrep.vnx.storage_groups import process as storage_groups
+from supergrep.vnx.storage_array_summary import (
+    ARRAY_NAME_TMPL, GET_AGENT_TMPL, GET_ARRAY_UID_TMPL,
+    process as storage_array_summary)
+from supergrep.vnx.storage_groups import (
+    PORT_TMPL as SG_PORT_TMPL, STORAGEGROUP_TMPL, process as storage_groups)
 
 __all__ = ('main',)
 
@@ -33,7 +42,7 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\emc-vnx-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path, stream=False)
 
     raw_content_patterns = (
         'SPA_cfg_info.txt',
@@ -47,17 +56,32 @@ def main(input_files: str, output_file: str) -> None:
     )
 
     raw_content = load_raw_content(tuple(input_files), raw_content_patterns)
-    spa_spb_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0], raw_content_patterns[1]))
+    content_index = ContentIndex(raw_content, raw_content_patterns)
+    spa_spb_content = content_index.partitioned(
+        (raw_content_patterns[0], raw_content_patterns[1]))
+
+    mirror_view_content = content_index.partitioned(
+        (raw_content_patterns[2], raw_content_patterns[3]))
 
-    mirror_view_content = get_relevant_content(
-        raw_content, (raw_content_patterns[2], raw_content_patterns[3]))
+    snap_view_content = content_index.partitioned(
+        (raw_content_patterns[4], raw_content_patterns[5]))
 
-    snap_view_content = get_relevant_content(
-        raw_content, (raw_content_patterns[4], raw_content_patterns[5]))
+    snap_clones_content = content_index.partitioned(
+        (raw_content_patterns[6], raw_content_patterns[7]))
 
-    snap_clones_content = get_relevant_content(
-        raw_content, (raw_content_patterns[6], raw_content_patterns[7]))
+    prefetch_parsers(
+        sheet_jobs(spa_spb_content, ARRAY_NAME_TMPL, GET_ARRAY_UID_TMPL,
+                   GET_AGENT_TMPL)
+        + sheet_jobs(spa_spb_content, PORT_TMPL, SPPORTSPEED_TMPL)
+        + sheet_jobs(spa_spb_content, STORAGEGROUP_TMPL, SG_PORT_TMPL)
+        + sheet_jobs(spa_spb_content, GETLUN_TMPL)
+        + sheet_jobs(spa_spb_content, NDU_TMPL)
+        + sheet_jobs(spa_spb_content, GETDISK_TMPL)
+        + sheet_jobs(spa_spb_content, GETRG_TMPL)
+        + sheet_jobs(mirror_view_content, MIRROR_VIEW_S_TMPL)
+        + sheet_jobs(mirror_view_content, MIRROR_VIEW_A_TMPL)
+        + sheet_jobs(snap_view_content, SNAP_VIEW_TMPL)
+        + sheet_jobs(snap_clones_content, SNAP_CLONES_TMPL))
 
     array_names, array_models, array_revisions = storage_array_summary(
         workbook, spa_spb_content)
@@ -78,4 +102,5 @@ def main(input_files: str, output_file: str) -> None:
     snap_view(workbook, snap_view_content, array_names)
     snap_clones(workbook, snap_clones_content, array_names)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
@@ -0,0 +1,49 @@
+"""Template workbooks, read from resources once per process"""
+from io import BytesIO
+from typing import Dict, List
+
+from openpyxl import Workbook, load_workbook
+
+__all__ = ('clear_workbook_templates', 'template_sheetnames',
+           'template_workbook')
+
+# template path -> (bytes of the .xlsx, sheet names)
+_WORKBOOK_TEMPLATES = dict()  # type: Dict[str, tuple]
+
+
+def _workbook_template(template_path: str) -> tuple:
+    template = _WORKBOOK_TEMPLATES.get(template_path)
+    if template is None:
+        with open(template_path, 'rb') as template_file:
+            data = template_file.read()
+        workbook = load_workbook(BytesIO(data), read_only=True)
+        template = data, list(workbook.sheetnames)
+        workbook.close()
+        _WORKBOOK_TEMPLATES[template_path] = template
+    return template
+
+
+def template_workbook(template_path: str) -> Workbook:
+    """New workbook with the content of a template workbook
+
+    The template file is read from disk on first use only, each call loads
+    a new workbook from the bytes kept in memory.
+
+    :param template_path:
+    :return:
+    """
+    return load_workbook(BytesIO(_workbook_template(template_path)[0]))
+
+
+def template_sheetnames(template_path: str) -> List[str]:
+    """Names of the sheets of a template workbook
+
+    :param template_path:
+    :return:
+    """
+    return list(_workbook_template(template_path)[1])
+
+
+def clear_workbook_templates() -> None:
+    """Forgets the templates read so far, eg. after they were edited"""
+    _WORKBOOK_TEMPLATES.clear()
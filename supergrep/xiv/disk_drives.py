@@ -1,15 +1,15 @@
 """Disk Drives Sheet"""
 
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from cytoolz.curried import concat, map
+from cytoolz.curried import concat
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output, multiple_join
+from supergrep.relational import multiple_join
+from supergrep.utils import sheet_process_output, write_rows
 
 SYSTEM_NAME_TMPL = textwrap.dedent("""\
     Value Filldown,Required SystemName (\w+)
@@ -56,6 +56,7 @@ DISK_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Disk Drivers worksheet
 
@@ -69,7 +70,6 @@ def process(workbook: Any, content: str) -> None:
         get_parser_header(SYSTEM_NAME_TMPL),
         get_parser_header(DISK_TMPL)[2:],
     ]))
-    RowTuple = namedtuple('RowTuple', headers)
 
     build_header(worksheet, headers)
 
@@ -80,16 +80,7 @@ def process(workbook: Any, content: str) -> None:
     rows = multiple_join(
         common_columns, [system_drivers_out, disk_drivers_out])
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -1,17 +1,17 @@
 """SAN Hosts sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any, Iterable
 
-import xmltodict
 from openpyxl.styles import Alignment
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell, column_format)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output, search_tag_value, \
-    ordered_jsons, flatten_dict, multiple_join
+from supergrep.relational import multiple_join
+from supergrep.utils import sheet_process_output, \
+    ordered_jsons, flatten_dict, write_rows
 from supergrep.xiv.utils import luns_occurrences, expand_rows
+from supergrep.xml_elements import extract_elements
 
 SYSTEM_NAME_TMPL = textwrap.dedent("""\
     Value Filldown,Required SystemName (\w+)
@@ -23,7 +23,12 @@ SYSTEM_NAME_TMPL = textwrap.dedent("""\
       ^\s*system_name\s+ ${SystemName} -> Start
 """)
 
+# Elements of the all_mappings_list and host_list cli.xml the sheet reads
+MAP_ELEMENTS = ('map', )
+HOST_ELEMENTS = ('host', )
 
+
+@sheet_stage
 def process(workbook: Any, contents: Iterable) -> None:
     """Process SAN hosts Status worksheet
 
@@ -39,7 +44,6 @@ def process(workbook: Any, contents: Iterable) -> None:
         'cluster', 'fc_ports', 'type', 'iscsi_chap_name', 'perf_class'
     ]
 
-    RowTuple = namedtuple('RowTuple', headers)
     build_header(worksheet, headers)
     headers = [
         'cluster_id/@value', 'host_id/@value', 'volume_id/@value',
@@ -54,13 +58,12 @@ def process(workbook: Any, contents: Iterable) -> None:
         all_map_content = '\n'.join(all_content.split('\n')[1:])
         host_content = '\n'.join(host_content.split('\n')[1:])
 
-        doc_map = xmltodict.parse(all_map_content)
-        map_details = search_tag_value(doc_map, 'map')
+        map_details = extract_elements(all_map_content, MAP_ELEMENTS)['map']
         maps = luns_occurrences(map_details, headers)
         lun_rows = [system_name + row for row in maps]
 
-        doc_host = xmltodict.parse(host_content)
-        host_details = search_tag_value(doc_host, 'host')
+        host_details = extract_elements(
+            host_content, HOST_ELEMENTS)['host']
         flat_data_host = [flatten_dict(data) for data in host_details]
         hosts = ordered_jsons(flat_data_host,
                               [headers[0], 'id/@value'] + headers[3:])
@@ -83,20 +86,10 @@ def process(workbook: Any, contents: Iterable) -> None:
     row_all = multiple_join(
         common_columns, [clusters_hosts, hosts_rows])
 
-    sub_rows = list(rows_cluster) + list(row_hosts) + list(row_all)
+    sub_rows = rows_cluster + row_hosts + row_all
     rows = expand_rows(sub_rows, 3)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(column_format(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            if chr(col_n) != 'D':
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows, text_cols='D')
 
     sheet_process_output(
         worksheet,
@@ -1,14 +1,14 @@
 """Storage Controllers Sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from cytoolz.curried import concat, map
+from cytoolz.curried import concat
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output, multiple_join
+from supergrep.relational import multiple_join
+from supergrep.utils import sheet_process_output, write_rows
 
 STORAGE_CONTROLLERS_TMPL = textwrap.dedent("""\
     Value Required,Filldown SystemName (\w+)
@@ -88,6 +88,7 @@ STORAGE_CAPACITY_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Storage Controllers worksheet
 
@@ -102,8 +103,6 @@ def process(workbook: Any, content: str) -> None:
         get_parser_header(STORAGE_CAPACITY_TMPL)[1:]
     ]))
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
     storage_controllers_out = run_parser_over(content, STORAGE_CONTROLLERS_TMPL)
     storage_version_out = run_parser_over(content, STORAGE_VERSION_TMPL)
@@ -116,16 +115,7 @@ def process(workbook: Any, content: str) -> None:
          storage_version_out,
          storage_capacity_out])
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows)
 
     sheet_process_output(
         worksheet,
@@ -1,15 +1,13 @@
 """Volumes sheet"""
 import textwrap
-from collections import namedtuple
 from typing import Any, Iterable
 
-import xmltodict
-
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output, search_tag_value, \
-    ordered_jsons, flatten_dict
+from supergrep.utils import sheet_process_output, \
+    ordered_jsons, flatten_dict, write_rows
+from supergrep.xml_elements import extract_elements
 
 SYSTEM_NAME_TMPL = textwrap.dedent("""\
     Value Filldown,Required SystemName (\w+)
@@ -21,7 +19,11 @@ SYSTEM_NAME_TMPL = textwrap.dedent("""\
       ^\s*system_name\s+ ${SystemName} -> Start
 """)
 
+# Elements of the vol_list cli.xml the sheet reads
+VOLUME_ELEMENTS = ('volume', )
+
 
+@sheet_stage
 def process(workbook: Any, contents: Iterable) -> None:
     """Process Volumes Status worksheet
 
@@ -41,7 +43,6 @@ def process(workbook: Any, contents: Iterable) -> None:
         'MetadataMismatch'
     ]
 
-    RowTuple = namedtuple('RowTuple', headers)
     build_header(worksheet, headers)
     headers = [
         'id/@value', 'name/@value', 'size/@value', 'size_MiB/@value',
@@ -58,23 +59,13 @@ def process(workbook: Any, contents: Iterable) -> None:
     for sys_content, content in contents:
         system_name = run_parser_over(sys_content, SYSTEM_NAME_TMPL)[0]
         volumes_content = '\n'.join(content.split('\n')[1:])
-        doc = xmltodict.parse(volumes_content)
-        command_details = search_tag_value(doc, 'volume')
+        command_details = extract_elements(
+            volumes_content, VOLUME_ELEMENTS)['volume']
         flat_data = [flatten_dict(data) for data in command_details]
         volumes = ordered_jsons(flat_data, headers)
         rows += [system_name + row for row in volumes]
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            if chr(col_n) != 'B':
-                set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, rows, text_cols='B')
 
     sheet_process_output(
         worksheet,
@@ -1,15 +1,18 @@
 """XIV command entry point"""
 import os
 
-from openpyxl import load_workbook
-
+from supergrep.instrumentation import stage
 from supergrep.parsing import raw_tar_content
-from supergrep.utils import get_bundle_dir, get_relevant_content, \
-    get_separated_content
-from supergrep.xiv.disk_drives import process as disk_drives
-from supergrep.xiv.pools import process as pools
+from supergrep.scheduler import prefetch_parsers, sheet_jobs
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
+from supergrep.xiv.disk_drives import (
+    SYSTEM_NAME_TMPL, DISK_TMPL, process as disk_drives)
+from supergrep.xiv.pools import POOLS_TMPL, process as pools
 from supergrep.xiv.san_hosts import process as san_hosts
-from supergrep.xiv.storage_controllers import process as storage_controllers
+from supergrep.xiv.storage_controllers import (
+    STORAGE_CONTROLLERS_TMPL, STORAGE_VERSION_TMPL, STORAGE_CAPACITY_TMPL,
+    process as storage_controllers)
 from supergrep.xiv.volumes import process as volumes
 
 __all__ = ('main',)
@@ -24,7 +27,7 @@ def main(input_files: str, output_file: str) -> None:
 
     template_path = os.path.join(
         get_bundle_dir(), r'resources\xiv-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path, stream=False)
 
     raw_content_patterns = (
         '*cod_list_-f_all/cli.txt',
@@ -39,39 +42,47 @@ def main(input_files: str, output_file: str) -> None:
     )
 
     raw_content = list(raw_tar_content(tuple(input_files), raw_content_patterns))
-    storage_controllers_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[1],
-                      raw_content_patterns[2]), '*' * 20 + '\n')
+    content_index = ContentIndex(raw_content, raw_content_patterns)
+    storage_controllers_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[1],
+         raw_content_patterns[2]), '*' * 20 + '\n')
 
-    disk_drivers_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[3],
-                      raw_content_patterns[4]), '*' * 20 + '\n')
+    disk_drivers_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[3],
+         raw_content_patterns[4]), '*' * 20 + '\n')
 
-    pools_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[5]), '*' * 20 + '\n')
+    pools_content = content_index.partitioned(
+        (raw_content_patterns[0],
+         raw_content_patterns[5]), '*' * 20 + '\n')
 
-    volumes_content_txt = get_separated_content(
-        raw_content, (raw_content_patterns[0], ))
+    volumes_content_txt = content_index.separated(
+        (raw_content_patterns[0], ))
 
-    volumes_content_xml = get_separated_content(
-        raw_content, (raw_content_patterns[6], ))
+    volumes_content_xml = content_index.separated(
+        (raw_content_patterns[6], ))
 
-    all_content_xml = get_separated_content(
-        raw_content, (raw_content_patterns[7], ))
+    all_content_xml = content_index.separated(
+        (raw_content_patterns[7], ))
 
-    hosts_mappings_content_xml = get_separated_content(
-        raw_content, (raw_content_patterns[8], ))
+    hosts_mappings_content_xml = content_index.separated(
+        (raw_content_patterns[8], ))
 
     volumes_content = zip(volumes_content_txt, volumes_content_xml)
     hosts_content = zip(volumes_content_txt, all_content_xml,
                         hosts_mappings_content_xml)
+    prefetch_parsers(
+        sheet_jobs(storage_controllers_content, STORAGE_CONTROLLERS_TMPL,
+                   STORAGE_VERSION_TMPL, STORAGE_CAPACITY_TMPL)
+        + sheet_jobs(disk_drivers_content, SYSTEM_NAME_TMPL, DISK_TMPL)
+        + sheet_jobs(pools_content, POOLS_TMPL))
+
     storage_controllers(workbook, storage_controllers_content)
     disk_drives(workbook, disk_drivers_content)
     pools(workbook, pools_content)
     volumes(workbook, volumes_content)
     san_hosts(workbook, hosts_content)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)
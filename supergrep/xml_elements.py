@@ -0,0 +1,167 @@
+"""Streaming extraction of the elements the sheets need from XML documents
+
+The Isilon, EVA and XIV sheets only use a few elements of large XML
+documents. extract_elements reads a document once with expat and builds
+the values of those elements only, instead of converting the whole
+document to nested dictionaries with xmltodict.parse first. The values,
+and which element search_tag_value would have picked, are the same.
+"""
+from collections import Counter, OrderedDict
+from functools import partial
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
+from xml.parsers import expat
+
+__all__ = ('extract_elements', )
+
+# Characters, or bytes, fed to the parser at a time
+FEED_CHUNK = 64 * 1024
+
+
+class _Element:
+    """An element being read
+
+    Its value, as xmltodict.parse gives it, is only built inside the
+    elements with the tags (value is not None). Otherwise only what
+    search_tag_value needs is kept: how many times each child tag occurs,
+    the values of the children with the tags and what the search found
+    under each child which is a dictionary.
+    """
+
+    __slots__ = ('name', 'value', 'text', 'is_dict', 'counts', 'direct',
+                 'found')
+
+    def __init__(self, name: str, attributes: list, build: bool) -> None:
+        self.name = name
+        self.value = None  # type: Optional[OrderedDict]
+        self.text = None  # type: Optional[List[str]]
+        if build:
+            self.value = OrderedDict(
+                ('@{}'.format(attributes[index]), attributes[index + 1])
+                for index in range(0, len(attributes), 2))
+            self.text = []
+        # a dictionary in xmltodict, with attributes or children
+        self.is_dict = bool(attributes)
+        self.counts = Counter()  # type: Counter
+        self.direct = dict()  # type: Dict[str, list]
+        # (child tag, tag -> value found under the child) in document order
+        self.found = list()  # type: List[tuple]
+
+    def close(self) -> Any:
+        """Value of the element
+
+        :return:
+        """
+        if self.value is None:
+            return None
+        text = ''.join(self.text).strip() or None
+        if not self.value:
+            return text
+        if text:
+            self.value['#text'] = text
+        return self.value
+
+    def search(self, tags: tuple) -> Dict[str, Any]:
+        """search_tag_value of the element for every tag, the found ones
+
+        A child with the tag is the result, even when empty (which stops
+        the search in this element). Otherwise the first child, in
+        document order, that is a dictionary (not repeated, so not a list)
+        and has a result gives it.
+
+        :param tags:
+        :return:
+        """
+        results = dict()  # type: Dict[str, Any]
+        for tag in tags:
+            if tag in self.direct:
+                values = self.direct[tag]
+                value = values[0] if len(values) == 1 else values
+                if value is not None:
+                    results[tag] = value
+                continue
+            for child, found in self.found:
+                if tag in found and self.counts[child] == 1:
+                    results[tag] = found[tag]
+                    break
+        return results
+
+
+def _feed(parser: Any, source: Union[str, IO]) -> None:
+    """Feeds a document to an expat parser, in chunks
+
+    Text is fed a slice at a time rather than encoded whole, which would
+    hold another copy of it. Like xmltodict.parse, text is read as utf-8
+    whatever its declaration says.
+
+    :param parser:
+    :param source: XML text, or a binary file object
+    """
+    if isinstance(source, str):
+        for start in range(0, len(source), FEED_CHUNK):
+            parser.Parse(source[start:start + FEED_CHUNK], False)
+    else:
+        for chunk in iter(partial(source.read, FEED_CHUNK), b''):
+            parser.Parse(chunk, False)
+    parser.Parse(b'', True)
+
+
+def extract_elements(source: Union[str, IO], tags: Iterable[str]) -> Dict[
+        str, Any]:
+    """search_tag_value over the xmltodict document, in one pass
+
+    Element names are compared as written (eg. ns:tag) and namespace
+    declarations are '@xmlns' attributes, as xmltodict.parse does by
+    default. Only the values of the elements with the tags, and of what
+    they contain, are built while the document is read.
+
+    :param source: XML text, or a binary file object
+    :param tags:
+    :return: tag -> value, None for the tags not found
+    """
+    tags = tuple(tags)
+    opened = list()  # type: List[_Element]
+    kept = [0]
+    root = dict()  # type: Dict[str, Any]
+
+    def start(name: str, attributes: list) -> None:
+        kept[0] += name in tags
+        if opened:
+            opened[-1].is_dict = True
+        opened.append(_Element(name, attributes, kept[0] > 0))
+
+    def end(name: str) -> None:
+        element = opened.pop()
+        value = element.close()
+        results = element.search(tags)
+        kept[0] -= name in tags
+        if not opened:
+            root.update(results)
+            if name in tags:
+                root[name] = value
+            return
+        parent = opened[-1]
+        parent.counts[name] += 1
+        if name in tags:
+            parent.direct.setdefault(name, []).append(value)
+        if element.is_dict and results:
+            parent.found.append((name, results))
+        if parent.value is not None:
+            if name not in parent.value:
+                parent.value[name] = value
+            elif isinstance(parent.value[name], list):
+                parent.value[name].append(value)
+            else:
+                parent.value[name] = [parent.value[name], value]
+
+    def characters(data: str) -> None:
+        if opened and opened[-1].text is not None:
+            opened[-1].text.append(data)
+
+    parser = expat.ParserCreate()
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    _feed(parser, source)
+    return OrderedDict((tag, root.get(tag)) for tag in tags)
@@ -1,5 +1,6 @@
 """Gets clusters from each input file(XtremIO)"""
 import textwrap
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import run_parser_over
 
 SHOW_CLUSTERS_INFO_TMPL = textwrap.dedent("""\
@@ -12,6 +13,7 @@ SHOW_CLUSTERS_INFO_TMPL = textwrap.dedent("""\
       ^\s*${ClusterName}\s+(.+) -> Record
 """)
 
+@sheet_stage
 def process(content: str) -> list:
     """Process clusters (XtremIO)
 
@@ -1,14 +1,11 @@
 """Data Protection Groups Sheet (XtremIO)"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from cytoolz.curried import map
-
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOW_DATA_PROTECTION_TMPL = textwrap.dedent("""\
     Value Name (\S+)
@@ -27,6 +24,7 @@ SHOW_DATA_PROTECTION_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Data Protection Groups worksheet (XtremIO)
 
@@ -37,22 +35,11 @@ def process(workbook: Any, content: str) -> None:
 
     headers = get_parser_header(SHOW_DATA_PROTECTION_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     show_targets_out = run_parser_over(content, SHOW_DATA_PROTECTION_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, show_targets_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, show_targets_out)
 
     sheet_process_output(
         worksheet,
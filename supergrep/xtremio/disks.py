@@ -1,15 +1,11 @@
 """Disks Sheet (XtremIO)"""
 import textwrap
-from collections import namedtuple
 from typing import Any
 
-from cytoolz.curried import map
-from openpyxl.styles import Alignment
-
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output
+from supergrep.utils import sheet_process_output, write_rows
 
 SHOW_SSDS_TMPL = textwrap.dedent("""\
     Value Required ClusterName (\S+)
@@ -30,6 +26,7 @@ SHOW_SSDS_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> None:
     """Process Disks worksheet (XtremIO)
 
@@ -40,26 +37,11 @@ def process(workbook: Any, content: str) -> None:
 
     headers = get_parser_header(SHOW_SSDS_TMPL)
 
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
-
     build_header(worksheet, headers)
 
     show_ssds_out = run_parser_over(content, SHOW_SSDS_TMPL)
 
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, show_ssds_out), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            style_value_cell(cell)
-            set_cell_to_number(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, show_ssds_out)
 
     sheet_process_output(
         worksheet,
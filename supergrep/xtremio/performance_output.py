@@ -2,11 +2,13 @@
 import csv
 from typing import Any
 
-from supergrep.formatting import build_header, set_cell_to_number, style_value_cell
-from supergrep.utils import sheet_process_output, percentile
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, percentile, write_rows
 from supergrep.xtremio.utils import compute_row, store_summary
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> list:
     """Process Performance Output worksheet (XtremIO)
 
@@ -27,25 +29,16 @@ def process(workbook: Any, content: str) -> list:
 
     # we check for '' in each row to remove blank rows that are in the file
     # perf_csv is a list of lists containing all the rows of the file
-    rows = filter(
-        lambda x: '' not in x and len(x) > 1 and x != header[:8], perf_csv)
+    rows = list(filter(
+        lambda x: '' not in x and len(x) > 1 and x != header[:8], perf_csv))
+    start_date, end_date = (rows[0][0], rows[-1][0]) if rows else ('', '')
 
     summary_data = ([], [], [], [], [], [], [], [], [])  # type: tuple
 
-    final_col, final_row, start_date, end_date = 0, 0, '', ''
-    for row_n, row_tuple in enumerate(rows, 2):
-        start_date = row_tuple[0] if start_date == '' else start_date
-        xls_row = compute_row(row_tuple)
+    xls_rows = list(map(compute_row, rows))
+    for xls_row in xls_rows:
         summary_data = store_summary(summary_data, xls_row)
-        for col_n, col_value in \
-                enumerate(xls_row, ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            set_cell_to_number(cell)
-            style_value_cell(cell)
-            final_col = col_n
-        final_row = row_n
-        end_date = row_tuple[0]
+    final_col, final_row = write_rows(worksheet, xls_rows)
 
     perf_summary = list()
     for summary_column, data_origin in zip(
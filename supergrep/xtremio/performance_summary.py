@@ -1,10 +1,12 @@
 """Performance Summary Sheet (XtremIO)"""
 from typing import Any
 
-from supergrep.formatting import build_header, set_cell_to_number, style_value_cell
-from supergrep.utils import sheet_process_output
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
+from supergrep.utils import sheet_process_output, write_rows
 
 
+@sheet_stage
 def process(workbook: Any, content: list) -> None:
     """Process Performance Summary worksheet (XtremIO)
 
@@ -16,17 +18,8 @@ def process(workbook: Any, content: list) -> None:
     header = ['Column', 'Avg', '95th', 'Max']
     build_header(worksheet, header)
 
-    final_col, final_row = 0, 0
     content += [('Logical capacity exposed:', '', '', '')]
-    for row_n, row_tuple in enumerate(content, 2):
-        for col_n, col_value in \
-                enumerate(row_tuple, ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            cell.value = str.strip(col_value)
-            set_cell_to_number(cell)
-            style_value_cell(cell)
-            final_col = col_n
-        final_row = row_n
+    final_col, final_row = write_rows(worksheet, content)
 
     sheet_process_output(
         worksheet,
@@ -1,16 +1,16 @@
 """Storage Array Summary Sheet (XtremIO)"""
 import textwrap
-from collections import namedtuple, defaultdict
+from collections import defaultdict
 from operator import itemgetter
 from typing import Any
 
-from cytoolz.curried import concat, map, unique
-from openpyxl.styles import Alignment
+from cytoolz.curried import concat, unique
 
-from supergrep.formatting import (
-    build_header, set_cell_to_number, style_value_cell)
+from supergrep.formatting import build_header
+from supergrep.instrumentation import sheet_stage
 from supergrep.parsing import get_parser_header, run_parser_over
-from supergrep.utils import sheet_process_output, multiple_join
+from supergrep.relational import multiple_join
+from supergrep.utils import sheet_process_output, write_rows
 
 
 SHOW_CLUSTERS_TMPL = textwrap.dedent("""\
@@ -87,6 +87,7 @@ CLUSTERS_SAVINGS_TMPL = textwrap.dedent("""\
 """)
 
 
+@sheet_stage
 def process(workbook: Any, content: str) -> list:
     """Process Storage-Array-Summary worksheet (XtremIO)
 
@@ -103,7 +104,6 @@ def process(workbook: Any, content: str) -> list:
         get_parser_header(SHOW_STORAGE_INFO_TMPL)[1:],
         get_parser_header(CLUSTERS_SAVINGS_TMPL)[1:]
     ]))
-    RowTuple = namedtuple('RowTuple', headers)  # pylint: disable=invalid-name
 
     build_header(worksheet, headers)
 
@@ -142,23 +142,13 @@ def process(workbook: Any, content: str) -> list:
          show_storage_out,
          clusters_savings_out])
 
-    rows = unique(rows, key=itemgetter(0))
-    final_col, final_row = 0, 0
-    for row_n, row_tuple in enumerate(map(RowTuple._make, rows), 2):
-        for col_n, col_value in \
-                enumerate(row_tuple._asdict().values(), ord('A')):
-            cell = worksheet['{}{}'.format(chr(col_n), row_n)]
-            if isinstance(col_value, str):
-                cell.value = str.strip(col_value)
-                if chr(col_n) in ('E', 'F', 'G'):
-                    cell.value += 'B'
-            else:
-                cell.alignment = Alignment(wrapText=True)
-                cell.value = '\n'.join(col_value)
-            set_cell_to_number(cell)
-            style_value_cell(cell)
-            final_col = col_n
-        final_row = row_n
+    # the space columns (E, F, G) get their unit suffix
+    rows = [
+        [str.strip(col_value) + 'B'
+         if col_n in (4, 5, 6) and isinstance(col_value, str) else col_value
+         for col_n, col_value in enumerate(row)]
+        for row in unique(rows, key=itemgetter(0))]
+    final_col, final_row = write_rows(worksheet, rows)
 
     clusters = [
         ("Cluster Names:", ", ".join([
@@ -1,20 +1,31 @@
 """XtremIO command entry point"""
 import os
 
-from openpyxl import load_workbook
-
+from supergrep.cache import member_text
+from supergrep.instrumentation import stage
 from supergrep.parsing import load_raw_content
-from supergrep.utils import get_bundle_dir, get_relevant_content, relevant_content_file_join
-from supergrep.xtremio.data_protection_groups import process as data_protection_groups
-from supergrep.xtremio.disks import process as disks
-from supergrep.xtremio.initiators_and_groups import process as initiators_and_groups
-from supergrep.xtremio.lun_mapping import process as lun_mapping
+from supergrep.scheduler import prefetch_parsers, sheet_jobs
+from supergrep.streaming import open_output_workbook
+from supergrep.utils import ContentIndex, get_bundle_dir
+from supergrep.xtremio.data_protection_groups import (
+    SHOW_DATA_PROTECTION_TMPL, process as data_protection_groups)
+from supergrep.xtremio.disks import SHOW_SSDS_TMPL, process as disks
+from supergrep.xtremio.initiators_and_groups import (
+    SHOW_INITIATORS_TMPL, SHOW_INITIATOR_GROUPS_TMPL,
+    process as initiators_and_groups)
+from supergrep.xtremio.lun_mapping import (
+    LUN_MAPPING_TMPL, process as lun_mapping)
 from supergrep.xtremio.performance_output import process as performance_output
 from supergrep.xtremio.performance_summary import process as performance_summary
-from supergrep.xtremio.storage_array_summary import process as storage_array_summary
-from supergrep.xtremio.target_ports import process as target_ports
-from supergrep.xtremio.volume_performance import process as volume_performance
-from supergrep.xtremio.volumes import process as volumes
+from supergrep.xtremio.storage_array_summary import (
+    CLUSTERS_SAVINGS_TMPL, SHOW_CLUSTERS_INFO_TMPL, SHOW_CLUSTERS_TMPL,
+    SHOW_STORAGE_INFO_TMPL, SHOW_X_BRICKS_TMPL,
+    process as storage_array_summary)
+from supergrep.xtremio.target_ports import (
+    SHOW_TARGETS_TMPL, process as target_ports)
+from supergrep.xtremio.volume_performance import (
+    SHOW_VOLUME_PERFORMANCE_TMPL, process as volume_performance)
+from supergrep.xtremio.volumes import SHOW_VOLUMES_TMPL, process as volumes
 from supergrep.xtremio.clusters import process as clusters_info
 
 __all__ = ('main',)
@@ -28,7 +39,7 @@ def main(input_files: str, output_file: str) -> None:
     """
     template_path = os.path.join(
         get_bundle_dir(), r'resources\xtremio-template.xlsx')
-    workbook = load_workbook(template_path)
+    workbook = open_output_workbook(template_path, stream=False)
 
     raw_content_patterns = (
         '*ShowClusters.out',
@@ -47,63 +58,80 @@ def main(input_files: str, output_file: str) -> None:
         '*performance_history.csv',
     )
     raw_content = load_raw_content(tuple(input_files), raw_content_patterns)
-    storage_array_summary_content = get_relevant_content(
-        raw_content, (raw_content_patterns[0],
-                      raw_content_patterns[1],
-                      raw_content_patterns[2],
-                      raw_content_patterns[3],
-                      raw_content_patterns[4]), '\n' + '*' * 20 + '\n')
-
-    disks_content = get_relevant_content(
-        raw_content, (raw_content_patterns[5], ), '*' * 20 + '\n')
-
-    target_ports_content = get_relevant_content(
-        raw_content, (raw_content_patterns[6], ), '*' * 20 + '\n')
-
-    show_volumes_content = get_relevant_content(
-        raw_content, (raw_content_patterns[7], ), '*' * 20 + '\n')
-
-    data_protection_content = get_relevant_content(
-        raw_content, (raw_content_patterns[8], ), '*' * 20 + '\n')
-
-    volume_performance_content = get_relevant_content(
-        raw_content, (raw_content_patterns[9], ), '*' * 20 + '\n')
-
-    lun_mapping_content = get_relevant_content(
-        raw_content, (raw_content_patterns[10], ), '*' * 20 + '\n')
-
-    initiator_groups_content = get_relevant_content(
-        raw_content, (raw_content_patterns[11],
-                      raw_content_patterns[12]), '\n' + '*' * 20 + '\n')
-
-    performance_content = get_relevant_content(
-        raw_content, (raw_content_patterns[13], ), '\n' + '*' * 20 + '\n')
-
-    performance_files = relevant_content_file_join(
-        raw_content, (raw_content_patterns[13], ))
-
-    clusters_files = relevant_content_file_join(
-        raw_content, (raw_content_patterns[0], ))
+    content_index = ContentIndex(raw_content, raw_content_patterns)
+    storage_array_summary_content = content_index.relevant(
+        (raw_content_patterns[0],
+         raw_content_patterns[1],
+         raw_content_patterns[2],
+         raw_content_patterns[3],
+         raw_content_patterns[4]), '\n' + '*' * 20 + '\n')
+
+    disks_content = content_index.relevant(
+        (raw_content_patterns[5], ), '*' * 20 + '\n')
+
+    target_ports_content = content_index.relevant(
+        (raw_content_patterns[6], ), '*' * 20 + '\n')
+
+    show_volumes_content = content_index.relevant(
+        (raw_content_patterns[7], ), '*' * 20 + '\n')
+
+    data_protection_content = content_index.relevant(
+        (raw_content_patterns[8], ), '*' * 20 + '\n')
+
+    volume_performance_content = content_index.relevant(
+        (raw_content_patterns[9], ), '*' * 20 + '\n')
+
+    lun_mapping_content = content_index.relevant(
+        (raw_content_patterns[10], ), '*' * 20 + '\n')
+
+    initiator_groups_content = content_index.relevant(
+        (raw_content_patterns[11],
+         raw_content_patterns[12]), '\n' + '*' * 20 + '\n')
+
+    performance_content = content_index.relevant(
+        (raw_content_patterns[13], ), '\n' + '*' * 20 + '\n')
+
+    performance_files = content_index.file_joined(
+        (raw_content_patterns[13], ))
+
+    clusters_files = content_index.file_joined(
+        (raw_content_patterns[0], ))
+
+    prefetch_parsers(
+        sheet_jobs(storage_array_summary_content, SHOW_CLUSTERS_TMPL,
+                   SHOW_CLUSTERS_INFO_TMPL, SHOW_X_BRICKS_TMPL,
+                   SHOW_STORAGE_INFO_TMPL, CLUSTERS_SAVINGS_TMPL)
+        + sheet_jobs(disks_content, SHOW_SSDS_TMPL)
+        + sheet_jobs(target_ports_content, SHOW_TARGETS_TMPL)
+        + sheet_jobs(show_volumes_content, SHOW_VOLUMES_TMPL)
+        + sheet_jobs(data_protection_content, SHOW_DATA_PROTECTION_TMPL)
+        + sheet_jobs(volume_performance_content, SHOW_VOLUME_PERFORMANCE_TMPL)
+        + sheet_jobs(lun_mapping_content, LUN_MAPPING_TMPL)
+        + sheet_jobs(initiator_groups_content, SHOW_INITIATORS_TMPL,
+                     SHOW_INITIATOR_GROUPS_TMPL))
 
     clusters = storage_array_summary(workbook, storage_array_summary_content)
 
     if len(performance_files) > 1:
         output_wb = output_file.split(os.sep)
+        extension = os.path.splitext(output_file)[1]
         template_path = os.path.join(
             get_bundle_dir(), r'resources\xtremio-performance-template.xlsx')
         for file_content, file_cluster in \
                 zip(performance_files, clusters_files):
-            perf_workbook = load_workbook(template_path)
+            perf_workbook = open_output_workbook(template_path, stream=False)
             output_wb[-1] = file_content.split('/')[0]
-            perf_output = os.sep.join(output_wb) + '_perf.xlsx'
+            perf_output = os.sep.join(output_wb) + '_perf' + extension
             file_content = '\n'.join(
                 file for file in file_content.split('\n')[1:])
             perf_data = performance_output(perf_workbook, file_content)
             cluster_names = clusters_info(file_cluster)
             performance_summary(perf_workbook, perf_data + cluster_names)
-            perf_workbook.save(perf_output)
+            with stage('save'):
+                perf_workbook.save(perf_output)
     else:
-        perf_data = performance_output(workbook, performance_content)
+        perf_data = performance_output(
+            workbook, member_text(performance_content))
         performance_summary(workbook, perf_data + clusters)
 
     disks(workbook, disks_content)
@@ -114,4 +142,5 @@ def main(input_files: str, output_file: str) -> None:
     lun_mapping(workbook, lun_mapping_content)
     initiators_and_groups(workbook, initiator_groups_content)
 
-    workbook.save(output_file)
+    with stage('save'):
+        workbook.save(output_file)